@@ -1,40 +1,41 @@
 
-import spacy
-from spacy.matcher import PhraseMatcher
-from sentence_transformers import SentenceTransformer
+import os
+import sys
 import numpy as np
 import pandas as pd
 import re
+from functools import lru_cache
 from typing import List, Dict
 
+# Skill vocabulary and normalisation are shared with the complete app
+# (complete/skill_taxonomy.py, complete/skill_normalizer.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             'complete'))
+from skill_normalizer import default_normalizer  # noqa: E402
+from skill_taxonomy import SKILL_SET  # noqa: E402
 
-try:
-    
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    
-    import spacy.cli
-    print("Downloading spaCy model 'en_core_web_sm'...")
-    spacy.cli.download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
 
+# spaCy, the PhraseMatcher and Sentence-BERT are loaded on first use, not at
+# import time, so the Streamlit page renders before any model is loaded.
 
-sbert_model = SentenceTransformer('all-MiniLM-L6-v2')
+@lru_cache(maxsize=None)
+def get_nlp():
+    """spaCy pipeline (en_core_web_sm), loaded once"""
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm")
+    except OSError as e:
+        raise OSError("spaCy model 'en_core_web_sm' is not installed; "
+                      "run: python -m spacy download en_core_web_sm") from e
+
+
+@lru_cache(maxsize=None)
+def get_sbert_model():
+    """Sentence-BERT model, loaded once"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer('all-MiniLM-L6-v2')
 
 
-SKILL_SET = [
-    
-    "Python", "SQL", "Machine Learning", "Data Analysis", "Project Management", 
-    "TensorFlow", "Pytorch", "AWS", "Docker", "Tableau", "Full Stack Development",
-    
-    
-    "Communication", "Leadership", "Critical Thinking", "Agile", "Scrum",
-    
-   
-    "MS Office", "MS Visio", "Functional testing", "Business Analysis", 
-    "Requirement documentation", "Documentation Skills", "Status Reporting", 
-    "Coordination", "Requirements Gathering Tool"
-]
 TECH_KEYWORDS = [
     "Python", "SQL", "TensorFlow", "Pytorch", "AWS", "Docker", "Tableau",
     "MS Office", "MS Visio", "Functional testing", "Requirements Gathering Tool",
@@ -45,9 +46,15 @@ SOFT_KEYWORDS = [
     "Documentation", "Status Reporting", "Coordination", "Business Analysis"
 ]
 
-matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-patterns = [nlp.make_doc(skill.lower()) for skill in SKILL_SET]
-matcher.add("Skill_Pattern", patterns)
+@lru_cache(maxsize=None)
+def get_matcher():
+    """PhraseMatcher over SKILL_SET, built once"""
+    from spacy.matcher import PhraseMatcher
+    nlp = get_nlp()
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    patterns = [nlp.make_doc(skill.lower()) for skill in SKILL_SET]
+    matcher.add("Skill_Pattern", patterns)
+    return matcher
 
 
 def extract_skills_multi_method(text: str, source_type: str) -> List[Dict]:
@@ -57,9 +64,9 @@ def extract_skills_multi_method(text: str, source_type: str) -> List[Dict]:
     2. POS Tagging/Context (Identify Nouns near skill-related verbs)
     3. Custom NER (Placeholder for a trained model)
     """
-    doc = nlp(text.lower())
+    doc = get_nlp()(text.lower())
     extracted_skills = set()
-    matches = matcher(doc)
+    matches = get_matcher()(doc)
     for _, start, end in matches:
         skill = doc[start:end].text.title()
         extracted_skills.add(skill)
@@ -78,8 +85,11 @@ def extract_skills_multi_method(text: str, source_type: str) -> List[Dict]:
 
 
     
+    # Case/spacing variants and aliases collapse into one canonical skill
+    canonical_skills, _ = default_normalizer.canonicalize(sorted(extracted_skills))
+
     final_list = []
-    for skill in sorted(list(extracted_skills)):
+    for skill in sorted(canonical_skills):
         skill_type = "Technical" 
         
         
@@ -100,7 +110,7 @@ def get_skill_embeddings(skills: List[str]) -> np.ndarray:
     """Uses Sentence-BERT to generate embeddings for a list of skills."""
     if not skills:
         return np.array([])
-    return sbert_model.encode(skills, convert_to_tensor=False)
+    return get_sbert_model().encode(skills, convert_to_tensor=False)
 
 def calculate_similarity_matrix(resume_skills: List[str], jd_skills: List[str]) -> pd.DataFrame:
     """
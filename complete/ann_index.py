@@ -0,0 +1,213 @@
+import json
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class IVFIndex:
+    """Approximate nearest-neighbour index (inverted file, pure NumPy)
+
+    Unit-length item vectors are clustered with spherical k-means; each query
+    is compared only with the items of its n_probe closest clusters. Raising
+    n_probe trades latency for recall (n_probe == n_lists is exact search).
+    """
+
+    def __init__(self, n_lists: Optional[int] = None, n_probe: int = 8,
+                 n_iterations: int = 10, seed: int = 0):
+        """
+        Initialize index
+
+        Args:
+            n_lists: Number of clusters (defaults to ~4 * sqrt(n_items))
+            n_probe: Clusters searched per query (recall/latency trade-off)
+            n_iterations: k-means iterations used when building
+            seed: Random seed for centroid initialisation
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iterations = n_iterations
+        self.seed = seed
+        self.logger = self._setup_logger()
+
+        self.skills: List[str] = []
+        self.model_name: Optional[str] = None
+        self.centroids: Optional[np.ndarray] = None
+        # Item vectors grouped by cluster: cluster c owns rows offsets[c]:offsets[c + 1]
+        self.vectors: Optional[np.ndarray] = None
+        self.offsets: Optional[np.ndarray] = None
+        # Position of each grouped row in the original skills list, and its inverse
+        self.item_ids: Optional[np.ndarray] = None
+        self._row_of_item: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def build(self, embeddings: np.ndarray, skills: List[str],
+              model_name: Optional[str] = None) -> 'IVFIndex':
+        """
+        Cluster the item embeddings and lay them out by cluster
+
+        Args:
+            embeddings: L2-normalised item embeddings (n_items x dim)
+            skills: Skill name of each row
+            model_name: Model that produced the embeddings (checked on load)
+
+        Returns:
+            self
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if len(embeddings) != len(skills):
+            raise ValueError("embeddings and skills must have the same length")
+
+        n_items = len(embeddings)
+        n_lists = self.n_lists or max(1, int(4 * np.sqrt(n_items)))
+        n_lists = min(n_lists, n_items)
+        self.logger.info(f"Building IVF index: {n_items} items, {n_lists} lists")
+
+        self.centroids = self._train_centroids(embeddings, n_lists)
+        assignments = self._assign(embeddings)
+
+        order = np.argsort(assignments, kind='stable')
+        counts = np.bincount(assignments, minlength=n_lists)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self.vectors = embeddings[order]
+        self.item_ids = order.astype(np.int64)
+        self.skills = list(skills)
+        self.model_name = model_name
+        self.n_lists = n_lists
+        self._index_items()
+        return self
+
+    def search(self, queries: np.ndarray, k: int = 10,
+               n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the top-k most similar items for each query
+
+        Args:
+            queries: L2-normalised query embeddings (n_queries x dim)
+            k: Number of neighbours per query
+            n_probe: Override the index's n_probe for this call
+
+        Returns:
+            (similarities, item ids), both n_queries x k and sorted by
+            decreasing similarity; missing slots have id -1 and similarity -inf
+        """
+        if self.centroids is None:
+            raise ValueError("Index is empty; call build() or load() first")
+
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        k = min(k, len(self.skills))
+
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+
+        exhaustive = n_probe >= self.n_lists
+        if not exhaustive:
+            centroid_scores = queries @ self.centroids.T
+            probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+
+        for q, query in enumerate(queries):
+            if exhaustive:
+                candidates = np.arange(len(self.vectors))
+            else:
+                candidates = np.concatenate([np.arange(self.offsets[c], self.offsets[c + 1])
+                                             for c in probes[q]])
+            if len(candidates) == 0:
+                continue
+            candidate_scores = self.vectors[candidates] @ query
+            top = min(k, len(candidates))
+            best = np.argpartition(-candidate_scores, top - 1)[:top]
+            best = best[np.argsort(-candidate_scores[best])]
+            scores[q, :top] = candidate_scores[best]
+            ids[q, :top] = self.item_ids[candidates[best]]
+
+        return scores, ids
+
+    def get_vectors(self, item_ids: np.ndarray) -> np.ndarray:
+        """Embeddings of items by their position in the skills list"""
+        return self.vectors[self._row_of_item[item_ids]]
+
+    def save(self, path: str):
+        """Save the index to a single .npz file"""
+        np.savez(
+            path,
+            centroids=self.centroids,
+            vectors=self.vectors,
+            offsets=self.offsets,
+            item_ids=self.item_ids,
+            meta=np.array(json.dumps({
+                'skills': self.skills,
+                'model_name': self.model_name,
+                'n_probe': self.n_probe
+            }))
+        )
+        self.logger.info(f"Saved IVF index ({len(self.skills)} items) to {path}")
+
+    @classmethod
+    def load(cls, path: str, model_name: Optional[str] = None) -> 'IVFIndex':
+        """
+        Load an index saved with save()
+
+        Args:
+            path: Path of the .npz file
+            model_name: If given, fail when the index was built with another model
+        """
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            if model_name is not None and meta['model_name'] != model_name:
+                raise ValueError(f"Index was built with {meta['model_name']}, not {model_name}")
+
+            index = cls(n_lists=len(data['centroids']), n_probe=meta['n_probe'])
+            index.centroids = data['centroids']
+            index.vectors = data['vectors']
+            index.offsets = data['offsets']
+            index.item_ids = data['item_ids']
+        index.skills = meta['skills']
+        index.model_name = meta['model_name']
+        index._index_items()
+        return index
+
+    def _index_items(self):
+        self._row_of_item = np.empty_like(self.item_ids)
+        self._row_of_item[self.item_ids] = np.arange(len(self.item_ids))
+
+    def _train_centroids(self, embeddings: np.ndarray, n_lists: int) -> np.ndarray:
+        """Spherical k-means on a sample of the items"""
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(len(embeddings), 256 * n_lists)
+        sample = embeddings[rng.choice(len(embeddings), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self.n_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignments, kind='stable')
+            counts = np.bincount(assignments, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            filled = counts > 0
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            sums[filled] = np.add.reduceat(sample[order], starts[filled], axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            filled &= norms[:, 0] > 0
+            centroids[filled] = sums[filled] / norms[filled]
+        return centroids
+
+    def _assign(self, embeddings: np.ndarray, block_size: int = 8192) -> np.ndarray:
+        assignments = np.empty(len(embeddings), dtype=np.int64)
+        for start in range(0, len(embeddings), block_size):
+            block = embeddings[start:start + block_size]
+            assignments[start:start + block_size] = np.argmax(block @ self.centroids.T, axis=1)
+        return assignments
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('IVFIndex')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
@@ -1,21 +1,37 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import plotly.graph_objects as go
-import plotly.express as px
-import plotly.figure_factory as ff
-import seaborn as sns
-import matplotlib.pyplot as plt
-from typing import Dict, List, Tuple, Optional, Set
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Optional, Set, Union
+import copy
+import dataclasses
 from dataclasses import dataclass
+from functools import cached_property
 from collections import defaultdict
 from datetime import datetime
 import json
 import io
+import os
 import base64
 import logging
+import threading
+import heapq
+import itertools
+import time
+
+from ann_index import IVFIndex
+from embedding_cache import EmbeddingCache
+from embedding_store import EmbeddingStore
+from encoder_backends import BACKENDS, load_model, model_key
+from resource_registry import registry
+from result_cache import ResultCache
+from skill_normalizer import SkillNormalizer, default_normalizer
+from skill_taxonomy import LEARNING_RESOURCES, SAMPLE_JD_SKILLS, SAMPLE_RESUME_SKILLS
+from taxonomy_artifact import warm_encoder
+
+if TYPE_CHECKING:
+    # scipy.sparse is imported where sparse output is built, not at startup
+    from scipy import sparse
 
 # Configure page
 st.set_page_config(
@@ -105,52 +121,195 @@ class SkillMatch:
         }
 
 
+# Match category codes used by the columnar GapAnalysisResult
+STRONG_MATCH, PARTIAL_MATCH, MISSING = 0, 1, 2
+MATCH_CATEGORY_NAMES = ('STRONG_MATCH', 'PARTIAL_MATCH', 'MISSING')
+MATCH_CONFIDENCE_LEVELS = ('HIGH', 'MEDIUM', 'LOW')
+MATCH_PRIORITIES = ('LOW', 'MEDIUM', 'HIGH')
+
+
 @dataclass
 class GapAnalysisResult:
-    """Complete gap analysis results"""
-    matched_skills: List[SkillMatch]
-    partial_matches: List[SkillMatch]
-    missing_skills: List[SkillMatch]
+    """Complete gap analysis results
+    
+    Per-JD-skill results are stored column-wise (one array entry per JD skill);
+    SkillMatch objects for the matched/partial/missing lists are only built
+    when first accessed. similarity_matrix is dense, a scipy.sparse CSR
+    matrix holding only entries above a floor (sparse output mode), or None
+    when the analysis ran in memory-capped mode without a floor.
+    """
     overall_score: float
     category_scores: Dict[str, float]
-    similarity_matrix: np.ndarray
+    similarity_matrix: Optional[Union[np.ndarray, 'sparse.csr_matrix']]
     resume_skills: List[str]
     jd_skills: List[str]
+    best_resume_idx: np.ndarray
+    best_similarity: np.ndarray
+    match_codes: np.ndarray
+    strong_threshold: float = 0.80
+    partial_threshold: float = 0.50
+    # JD skills resolved by the lexical fast path; their matrix columns hold
+    # 1.0 at the exact match and 0 elsewhere (not computed)
+    lexical_mask: Optional[np.ndarray] = None
+    # 'best' (best resume skill per JD skill) or a one-to-one mode, in which
+    # JD skills left without a resume skill have best_resume_idx -1
+    matching_mode: str = 'best'
+    
+    @cached_property
+    def matched_skills(self) -> List[SkillMatch]:
+        return self._skill_matches(STRONG_MATCH)
+    
+    @cached_property
+    def partial_matches(self) -> List[SkillMatch]:
+        return self._skill_matches(PARTIAL_MATCH)
+    
+    @cached_property
+    def missing_skills(self) -> List[SkillMatch]:
+        return self._skill_matches(MISSING)
     
     def get_statistics(self) -> Dict:
         total = len(self.jd_skills)
+        matched_count, partial_count, missing_count = np.bincount(self.match_codes, minlength=3)[:3]
         return {
             'total_required_skills': total,
-            'matched_count': len(self.matched_skills),
-            'partial_count': len(self.partial_matches),
-            'missing_count': len(self.missing_skills),
-            'match_percentage': (len(self.matched_skills) / total * 100) if total > 0 else 0,
+            'matched_count': int(matched_count),
+            'partial_count': int(partial_count),
+            'missing_count': int(missing_count),
+            'match_percentage': float(matched_count / total * 100) if total > 0 else 0,
             'overall_score': self.overall_score * 100
         }
+    
+    def skill_match(self, jd_idx: int) -> SkillMatch:
+        """SkillMatch of one JD skill"""
+        code = int(self.match_codes[jd_idx])
+        resume_idx = int(self.best_resume_idx[jd_idx])
+        return SkillMatch(
+            jd_skill=self.jd_skills[jd_idx],
+            resume_skill=self.resume_skills[resume_idx] if resume_idx >= 0 else '',
+            similarity=float(self.best_similarity[jd_idx]),
+            category=MATCH_CATEGORY_NAMES[code],
+            confidence_level=MATCH_CONFIDENCE_LEVELS[code],
+            priority=MATCH_PRIORITIES[code]
+        )
+    
+    def _skill_matches(self, code: int) -> List[SkillMatch]:
+        return [self.skill_match(jd_idx) for jd_idx in np.flatnonzero(self.match_codes == code)]
+
+
+DEFAULT_EMBEDDING_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.embedding_store')
+DEFAULT_CACHE_MAX_BYTES = int(os.environ.get('SKILLGAP_EMBEDDING_CACHE_MB', '64')) * 1024 * 1024
+DEFAULT_ENCODER_BACKEND = os.environ.get('SKILLGAP_ENCODER_BACKEND', 'torch')
+# Similarity matrices above this size are reduced block by block instead of kept
+DEFAULT_MAX_MATRIX_BYTES = int(os.environ.get('SKILLGAP_MAX_MATRIX_MB', '256')) * 1024 * 1024
+DEFAULT_MAX_BLOCK_BYTES = 64 * 1024 * 1024
+# Finished analyses: kept in memory, and on disk if SKILLGAP_RESULT_CACHE names a directory
+DEFAULT_RESULT_CACHE_DIR = os.environ.get('SKILLGAP_RESULT_CACHE') or None
+DEFAULT_RESULT_CACHE_TTL = float(os.environ.get('SKILLGAP_RESULT_CACHE_TTL', '3600'))
+# Prebuilt embeddings of the curated taxonomy (python taxonomy_artifact.py), empty disables
+DEFAULT_TAXONOMY_ARTIFACT = os.environ.get(
+    'SKILLGAP_TAXONOMY_ARTIFACT',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taxonomy_embeddings.npz'))
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """Return float32 copy of embeddings with every row scaled to unit length"""
+    embeddings = np.array(embeddings, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    embeddings /= norms
+    return embeddings
+
+
+@dataclass
+class LeaderboardEntry:
+    """Compact per-candidate summary kept by the leaderboard mode"""
+    candidate_id: str
+    overall_score: float
+    matched_count: int
+    partial_count: int
+    missing_count: int
+    top_missing: List[str]
+    
+    def get_statistics(self) -> Dict:
+        total = self.matched_count + self.partial_count + self.missing_count
+        return {
+            'total_required_skills': total,
+            'matched_count': self.matched_count,
+            'partial_count': self.partial_count,
+            'missing_count': self.missing_count,
+            'match_percentage': (self.matched_count / total * 100) if total > 0 else 0,
+            'overall_score': self.overall_score * 100
+        }
+    
+    def to_dict(self) -> Dict:
+        return {
+            'candidate_id': self.candidate_id,
+            **self.get_statistics(),
+            'top_missing': self.top_missing
+        }
 
 
 class SentenceBERTEncoder:
     """Handles BERT embedding generation using Sentence-BERT"""
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    # Model batches are built by token length, not count: a batch holds as many
+    # similar-length skills as fit in MAX_BATCH_TOKENS padded tokens, and is cut
+    # early once padding would exceed MAX_PADDING_RATIO of its real tokens
+    MAX_BATCH_TOKENS = 4096
+    MAX_BATCH_SIZE = 256
+    MAX_PADDING_RATIO = 0.25
+    
+    # sentence-transformers pads each batch to its longest input, so similar-length
+    # batches are what keeps short skills from paying for long ones' attention.
+    # Fallback sequence limit for models that don't declare max_seq_length
+    DEFAULT_MAX_SEQ_LENGTH = 512
+    
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2',
+                 store_path: Optional[str] = None, store_readonly: Optional[bool] = None,
+                 cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 normalizer: Optional[SkillNormalizer] = None,
+                 backend: str = DEFAULT_ENCODER_BACKEND):
         """
         Initialize Sentence-BERT model
         
         Args:
             model_name: Name of the sentence-transformers model
+            store_path: Directory of the persistent embedding store
+                (defaults to $SKILLGAP_EMBEDDING_STORE, empty string disables it)
+            store_readonly: Open the store read-only, e.g. in worker processes
+                (defaults to $SKILLGAP_EMBEDDING_STORE_READONLY)
+            cache_max_bytes: Memory budget of the in-process embedding cache
+            normalizer: Maps skills to canonical keys; the key is what gets
+                cached and embedded (the default model is uncased)
+            backend: Inference backend, one of encoder_backends.BACKENDS
+                (defaults to $SKILLGAP_ENCODER_BACKEND, else 'torch')
         """
-        self.model_name = model_name
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {BACKENDS}")
+        self.backend = backend
+        # ONNX / int8 embeddings are stored and cached under their own name
+        self.model_name = model_key(model_name, backend)
+        self.normalizer = normalizer or default_normalizer
         self.logger = self._setup_logger()
-        self.embedding_cache = {}
+        self.embedding_cache = EmbeddingCache(max_bytes=cache_max_bytes)
+        # One encoder is shared by all sessions of the process (see ResourceRegistry)
+        self._lock = threading.RLock()
         
         try:
-            self.logger.info(f"Loading model: {model_name}")
-            self.model = SentenceTransformer(model_name)
+            self.logger.info(f"Loading model: {model_name} ({backend} backend)")
+            self.model = load_model(model_name, backend)
             self.embedding_dimension = self.model.get_sentence_embedding_dimension()
             self.logger.info(f"Model loaded successfully. Embedding dimension: {self.embedding_dimension}")
         except Exception as e:
             self.logger.error(f"Failed to load model: {e}")
             raise
+        
+        # The model's own limit; longer skills are truncated by the model
+        self.max_seq_length = getattr(self.model, 'max_seq_length', None) or self.DEFAULT_MAX_SEQ_LENGTH
+        self.sequence_stats = {'batches': 0, 'skills': 0, 'real_tokens': 0,
+                               'padded_tokens': 0, 'seconds': 0.0}
+        
+        self.store = self._open_store(store_path, store_readonly)
     
     def encode_skills(self, skills: List[str], use_cache: bool = True, 
                      show_progress: bool = False) -> np.ndarray:
@@ -168,70 +327,230 @@ class SentenceBERTEncoder:
         if not skills:
             raise ValueError("Skills list cannot be empty")
         
-        # Check cache
+        with self._lock:
+            return self._encode_skills(skills, use_cache, show_progress)
+    
+    def _encode_skills(self, skills: List[str], use_cache: bool,
+                       show_progress: bool) -> np.ndarray:
+        """Encode skills; caller holds the encoder lock"""
+        # Deduplicate by canonical key: each distinct skill is looked up / encoded
+        # once, then scattered back to every position it occupies in the input
+        positions = {}
+        key = self.normalizer.key
+        inverse = np.fromiter((positions.setdefault(key(skill), len(positions)) for skill in skills),
+                              dtype=np.int64, count=len(skills))
+        unique_skills = list(positions)
+        
+        embeddings = np.empty((len(unique_skills), self.embedding_dimension), dtype=np.float32)
+        pending = np.arange(len(unique_skills))
+        
         if use_cache:
-            cached_embeddings = []
-            uncached_skills = []
-            uncached_indices = []
+            # Tier 1: in-memory LRU cache
+            found = np.zeros(len(unique_skills), dtype=bool)
+            for i, skill in enumerate(unique_skills):
+                embedding = self.embedding_cache.get(skill)
+                if embedding is not None:
+                    embeddings[i] = embedding
+                    found[i] = True
+            pending = np.flatnonzero(~found)
             
-            for i, skill in enumerate(skills):
-                if skill in self.embedding_cache:
-                    cached_embeddings.append(self.embedding_cache[skill])
-                else:
-                    uncached_skills.append(skill)
-                    uncached_indices.append(i)
+            # Tier 2: persistent store, one vectorised gather for all misses
+            if self.store is not None and len(pending):
+                pending_skills = [unique_skills[i] for i in pending]
+                rows = self.store.lookup_rows(self.model_name, pending_skills)
+                in_store = rows >= 0
+                if in_store.any():
+                    stored = self.store.take(rows[in_store])
+                    embeddings[pending[in_store]] = stored
+                    for i, embedding in zip(pending[in_store], stored):
+                        self.embedding_cache.put(unique_skills[i], embedding)
+                    pending = pending[~in_store]
+        
+        # Tier 3: the model, for whatever is left
+        if len(pending):
+            pending_skills = [unique_skills[i] for i in pending]
+            new_embeddings = self._run_model(pending_skills, show_progress)
+            embeddings[pending] = new_embeddings
             
-            # Encode uncached skills
-            if uncached_skills:
-                new_embeddings = self.model.encode(
-                    uncached_skills, 
-                    show_progress_bar=show_progress,
-                    batch_size=32
-                )
-                
-                # Update cache
-                for skill, embedding in zip(uncached_skills, new_embeddings):
-                    self.embedding_cache[skill] = embedding
-                
-                # Combine cached and new
-                all_embeddings = [None] * len(skills)
-                cached_idx = 0
-                uncached_idx = 0
-                
-                for i in range(len(skills)):
-                    if i in uncached_indices:
-                        all_embeddings[i] = new_embeddings[uncached_idx]
-                        uncached_idx += 1
-                    else:
-                        all_embeddings[i] = cached_embeddings[cached_idx]
-                        cached_idx += 1
-                
-                return np.array(all_embeddings)
-            else:
-                return np.array(cached_embeddings)
-        else:
-            # Encode without cache
-            embeddings = self.model.encode(
-                skills, 
-                show_progress_bar=show_progress,
-                batch_size=32
-            )
+            if use_cache:
+                for skill, embedding in zip(pending_skills, embeddings[pending]):
+                    self.embedding_cache.put(skill, embedding)
+                self._persist(pending_skills, new_embeddings)
+        
+        if len(unique_skills) == len(skills):
             return embeddings
+        return embeddings[inverse]
     
     def get_embedding_for_skill(self, skill: str) -> np.ndarray:
         """Get embedding for a single skill"""
-        if skill in self.embedding_cache:
-            return self.embedding_cache[skill]
-        
-        embedding = self.model.encode([skill])[0]
-        self.embedding_cache[skill] = embedding
+        with self._lock:
+            return self._get_embedding_for_skill(skill)
+    
+    def _get_embedding_for_skill(self, skill: str) -> np.ndarray:
+        skill = self.normalizer.key(skill)
+        embedding = self.embedding_cache.get(skill)
+        if embedding is not None:
+            return embedding
+        
+        if self.store is not None:
+            embedding = self.store.get(self.model_name, skill)
+            if embedding is not None:
+                self.embedding_cache.put(skill, embedding)
+                return embedding
+        
+        embedding = self._run_model([skill])[0]
+        self.embedding_cache.put(skill, embedding)
+        self._persist([skill], embedding.reshape(1, -1))
         return embedding
     
+    def _run_model(self, skills: List[str], show_progress: bool = False) -> np.ndarray:
+        """Run the model; returns L2-normalised float32 embeddings (one row per skill)"""
+        # Shortest first, so each batch pads to a length close to its members'
+        lengths = self._token_lengths(skills)
+        order = np.argsort(lengths, kind='stable')
+        buckets = self._length_buckets(lengths[order])
+        if show_progress:
+            self.logger.info(f"Encoding {len(skills)} skills in {len(buckets)} length buckets")
+        
+        sorted_lengths = lengths[order]
+        
+        embeddings = np.empty((len(skills), self.embedding_dimension), dtype=np.float32)
+        start_time = time.perf_counter()
+        try:
+            for start, stop in buckets:
+                batch = order[start:stop]
+                embeddings[batch] = self.model.encode(
+                    [skills[i] for i in batch],
+                    show_progress_bar=False,
+                    batch_size=len(batch),
+                    normalize_embeddings=True
+                )
+                self._record_batch(sorted_lengths[start:stop])
+        finally:
+            self.sequence_stats['seconds'] += time.perf_counter() - start_time
+        return embeddings
+    
+    def _record_batch(self, sorted_lengths: np.ndarray):
+        """Count one batch; the model pads it to its longest (last) input"""
+        stats = self.sequence_stats
+        stats['batches'] += 1
+        stats['skills'] += len(sorted_lengths)
+        stats['real_tokens'] += int(sorted_lengths.sum())
+        stats['padded_tokens'] += len(sorted_lengths) * int(sorted_lengths[-1])
+    
+    def _token_lengths(self, skills: List[str]) -> np.ndarray:
+        """Tokenised length of each skill (incl. special tokens, capped at the model's limit)"""
+        tokenizer = getattr(self.model, 'tokenizer', None)
+        max_length = self.max_seq_length
+        if tokenizer is None:
+            # Rough estimate for models without a tokenizer: ~4 characters per token
+            return np.minimum(np.fromiter((len(s) // 4 + 3 for s in skills), dtype=np.int64,
+                                          count=len(skills)), max_length)
+        input_ids = tokenizer(skills, add_special_tokens=True, truncation=True,
+                              max_length=max_length)['input_ids']
+        return np.fromiter((len(ids) for ids in input_ids), dtype=np.int64, count=len(skills))
+    
+    def _length_buckets(self, sorted_lengths: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Split ascending token lengths into (start, stop) batches
+        
+        A batch grows while (batch size x its longest length), i.e. the padded
+        tokens of the forward pass, stays within MAX_BATCH_TOKENS and the
+        padding stays within MAX_PADDING_RATIO of the real tokens.
+        """
+        buckets = []
+        start = 0
+        real_tokens = 0
+        for i, length in enumerate(sorted_lengths.tolist()):
+            size = i - start + 1
+            padded = size * length
+            if size > 1 and (padded > self.MAX_BATCH_TOKENS or size > self.MAX_BATCH_SIZE
+                             or padded > (real_tokens + length) * (1 + self.MAX_PADDING_RATIO)):
+                buckets.append((start, i))
+                start = i
+                real_tokens = 0
+            real_tokens += length
+        if len(sorted_lengths):
+            buckets.append((start, len(sorted_lengths)))
+        return buckets
+    
     def clear_cache(self):
-        """Clear embedding cache"""
-        self.embedding_cache.clear()
+        """Clear embedding cache (the persistent store is left untouched)"""
+        with self._lock:
+            self.embedding_cache.clear()
         self.logger.info("Embedding cache cleared")
     
+    def warm_cache(self, skills: List[str], embeddings: np.ndarray) -> int:
+        """
+        Seed the embedding cache with precomputed embeddings
+        
+        Args:
+            skills: Canonical skill keys, one per row
+            embeddings: L2-normalised embeddings from this encoder's model
+            
+        Returns:
+            Number of skills added
+        """
+        if embeddings.shape[1:] != (self.embedding_dimension,):
+            raise ValueError(f"Expected embeddings of dimension {self.embedding_dimension}, "
+                             f"got shape {embeddings.shape}")
+        added = 0
+        with self._lock:
+            for skill, embedding in zip(skills, embeddings):
+                if skill not in self.embedding_cache:
+                    self.embedding_cache.put(skill, np.array(embedding, dtype=np.float32))
+                    added += 1
+        return added
+    
+    def get_cache_statistics(self) -> Dict:
+        """Return hit/miss/eviction counters and resident size of the embedding cache"""
+        return self.embedding_cache.get_statistics()
+    
+    def get_sequence_statistics(self) -> Dict:
+        """
+        Return token counts and measured throughput of the model batches run so far
+        
+        padding_ratio is the share of padded tokens that are padding and
+        skills_per_second the measured model throughput
+        (benchmarks/bench_dynamic_batching.py compares both against
+        fixed-size batches).
+        """
+        stats = dict(self.sequence_stats)
+        padded = stats['padded_tokens']
+        stats['max_seq_length'] = self.max_seq_length
+        stats['mean_padded_length'] = padded / stats['skills'] if stats['skills'] else 0.0
+        stats['padding_ratio'] = 1 - stats['real_tokens'] / padded if padded else 0.0
+        stats['skills_per_second'] = stats['skills'] / stats['seconds'] if stats['seconds'] else 0.0
+        return stats
+    
+    def _open_store(self, store_path: Optional[str],
+                    store_readonly: Optional[bool]) -> Optional[EmbeddingStore]:
+        """Open the persistent embedding store, or return None if disabled/unavailable"""
+        if store_path is None:
+            store_path = os.environ.get('SKILLGAP_EMBEDDING_STORE', DEFAULT_EMBEDDING_STORE)
+        if not store_path:
+            return None
+        if store_readonly is None:
+            store_readonly = os.environ.get('SKILLGAP_EMBEDDING_STORE_READONLY', '') == '1'
+        
+        try:
+            store = EmbeddingStore(store_path, self.embedding_dimension, readonly=store_readonly)
+            self.logger.info(f"Embedding store opened: {store_path} ({len(store)} rows)")
+            return store
+        except Exception as e:
+            # The app still works without persistence, just slower after restarts
+            self.logger.warning(f"Embedding store unavailable, continuing without it: {e}")
+            return None
+    
+    def _persist(self, skills: List[str], embeddings: np.ndarray):
+        """Append newly encoded embeddings to the persistent store"""
+        if self.store is None or self.store.readonly:
+            return
+        try:
+            self.store.add(self.model_name, skills, embeddings)
+        except Exception as e:
+            self.logger.warning(f"Failed to persist embeddings: {e}")
+    
     def _setup_logger(self) -> logging.Logger:
         """Setup logging"""
         logger = logging.getLogger('BERTEncoder')
@@ -268,34 +587,218 @@ class SimilarityCalculator:
         if embedding2.ndim == 1:
             embedding2 = embedding2.reshape(1, -1)
         
+        from sklearn.metrics.pairwise import cosine_similarity
         similarity = cosine_similarity(embedding1, embedding2)[0][0]
         return float(similarity)
     
     def compute_similarity_matrix(self, resume_embeddings: np.ndarray,
-                                  jd_embeddings: np.ndarray) -> np.ndarray:
+                                  jd_embeddings: np.ndarray,
+                                  normalized: bool = True,
+                                  out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Compute pairwise similarity matrix
         
+        Embeddings from SentenceBERTEncoder are already unit length, so cosine
+        similarity reduces to a single float32 matrix product.
+        
         Args:
             resume_embeddings: Embeddings for resume skills (n_resume x embedding_dim)
             jd_embeddings: Embeddings for JD skills (n_jd x embedding_dim)
+            normalized: Whether both inputs are already L2-normalised
+            out: Optional preallocated float32 array (n_resume x n_jd) to write into
             
         Returns:
             Similarity matrix (n_resume x n_jd)
         """
         self.logger.info(f"Computing similarity matrix: {resume_embeddings.shape} x {jd_embeddings.shape}")
-        similarity_matrix = cosine_similarity(resume_embeddings, jd_embeddings)
+        if not normalized:
+            resume_embeddings = l2_normalize(resume_embeddings)
+            jd_embeddings = l2_normalize(jd_embeddings)
+        resume_embeddings = np.asarray(resume_embeddings, dtype=np.float32)
+        jd_embeddings = np.asarray(jd_embeddings, dtype=np.float32)
+        
+        if out is None:
+            out = np.empty((resume_embeddings.shape[0], jd_embeddings.shape[0]), dtype=np.float32)
+        similarity_matrix = np.matmul(resume_embeddings, jd_embeddings.T, out=out)
         self.logger.info(f"Similarity matrix computed: {similarity_matrix.shape}")
         return similarity_matrix
     
+    def compute_best_matches_blocked(self, resume_embeddings: np.ndarray,
+                                     jd_embeddings: np.ndarray,
+                                     max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES,
+                                     top_k: Optional[int] = None,
+                                     sparse_floor: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Per-JD-skill best matches without materialising the full similarity matrix
+        
+        The matrix is computed block by block (each block at most max_block_bytes
+        of float32) and every block is immediately reduced to a running column
+        max/argmax (and optionally a running top-k), so peak memory depends on
+        the budget, not on n_resume x n_jd.
+        
+        Args:
+            resume_embeddings: Unit-length resume skill embeddings (n_resume x dim)
+            jd_embeddings: Unit-length JD skill embeddings (n_jd x dim)
+            max_block_bytes: Memory budget for one similarity block
+            top_k: Also keep the k most similar resume skills per JD skill
+            sparse_floor: Also keep every entry >= this value as a sparse matrix
+            
+        Returns:
+            Dict with 'best_resume_idx' and 'best_similarity' (n_jd each), plus
+            'top_k_idx' / 'top_k_similarity' (n_jd x k, best first) if top_k is set
+            and 'sparse_matrix' (CSR, n_resume x n_jd) if sparse_floor is set
+        """
+        n_resume, n_jd = len(resume_embeddings), len(jd_embeddings)
+        self.logger.info(f"Computing blocked best matches: {n_resume} x {n_jd}, "
+                         f"budget {max_block_bytes / 1024 / 1024:.0f} MB")
+        
+        # Full JD width when at least 256 resume rows still fit, else split both axes
+        max_cells = max(1, max_block_bytes // 4)
+        block_cols = min(n_jd, max(1, max_cells // min(n_resume, 256)))
+        block_rows = max(1, min(n_resume, max_cells // block_cols))
+        block = np.empty((block_rows, block_cols), dtype=np.float32)
+        
+        best_resume_idx = np.zeros(n_jd, dtype=np.int64)
+        best_similarity = np.full(n_jd, -np.inf, dtype=np.float32)
+        if top_k:
+            top_k = min(top_k, n_resume)
+            top_k_idx = np.zeros((n_jd, top_k), dtype=np.int64)
+            top_k_similarity = np.full((n_jd, top_k), -np.inf, dtype=np.float32)
+        kept_rows, kept_cols, kept_values = [], [], []
+        
+        for col_start in range(0, n_jd, block_cols):
+            col_stop = min(col_start + block_cols, n_jd)
+            jd_block = np.asarray(jd_embeddings[col_start:col_stop], dtype=np.float32)
+            cols = np.arange(col_stop - col_start)
+            
+            for row_start in range(0, n_resume, block_rows):
+                row_stop = min(row_start + block_rows, n_resume)
+                resume_block = np.asarray(resume_embeddings[row_start:row_stop], dtype=np.float32)
+                sims = np.matmul(resume_block, jd_block.T,
+                                 out=block[:row_stop - row_start, :col_stop - col_start])
+                
+                # Running column max / argmax
+                block_best = sims.argmax(axis=0)
+                block_max = sims[block_best, cols]
+                improved = block_max > best_similarity[col_start:col_stop]
+                best_similarity[col_start:col_stop][improved] = block_max[improved]
+                best_resume_idx[col_start:col_stop][improved] = block_best[improved] + row_start
+                
+                if sparse_floor is not None:
+                    rows, block_cols_kept = np.nonzero(sims >= sparse_floor)
+                    kept_rows.append(rows + row_start)
+                    kept_cols.append(block_cols_kept + col_start)
+                    kept_values.append(sims[rows, block_cols_kept])
+                
+                # Running top-k: merge the block's top-k with the kept top-k
+                if top_k:
+                    k = min(top_k, len(sims))
+                    part = np.argpartition(-sims, k - 1, axis=0)[:k].T
+                    merged_idx = np.concatenate([top_k_idx[col_start:col_stop], part + row_start], axis=1)
+                    merged_sim = np.concatenate([top_k_similarity[col_start:col_stop],
+                                                 np.take_along_axis(sims.T, part, axis=1)], axis=1)
+                    keep = np.argsort(-merged_sim, axis=1, kind='stable')[:, :top_k]
+                    top_k_idx[col_start:col_stop] = np.take_along_axis(merged_idx, keep, axis=1)
+                    top_k_similarity[col_start:col_stop] = np.take_along_axis(merged_sim, keep, axis=1)
+        
+        best_matches = {'best_resume_idx': best_resume_idx, 'best_similarity': best_similarity}
+        if top_k:
+            best_matches['top_k_idx'] = top_k_idx
+            best_matches['top_k_similarity'] = top_k_similarity
+        if sparse_floor is not None:
+            from scipy import sparse
+            best_matches['sparse_matrix'] = sparse.coo_matrix(
+                (np.concatenate(kept_values), (np.concatenate(kept_rows), np.concatenate(kept_cols))),
+                shape=(n_resume, n_jd), dtype=np.float32
+            ).tocsr()
+        return best_matches
+    
+    def sparsify(self, similarity_matrix: np.ndarray, floor: float) -> 'sparse.csr_matrix':
+        """
+        Keep only the similarity entries >= floor
+        
+        Args:
+            similarity_matrix: Dense similarity matrix
+            floor: Smallest similarity worth keeping (e.g. the partial threshold)
+            
+        Returns:
+            CSR matrix of the same shape; dropped entries read as 0
+        """
+        from scipy import sparse
+        rows, cols = np.nonzero(similarity_matrix >= floor)
+        sparse_matrix = sparse.csr_matrix(
+            (similarity_matrix[rows, cols], (rows, cols)),
+            shape=similarity_matrix.shape, dtype=np.float32
+        )
+        self.logger.info(f"Sparse similarity matrix: kept {sparse_matrix.nnz} of "
+                         f"{similarity_matrix.size} entries (floor {floor:.2f})")
+        return sparse_matrix
+    
+    def assign_one_to_one(self, similarity_matrix: np.ndarray,
+                          method: str = 'optimal') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Match resume skills to JD skills so each resume skill is used at most once
+        
+        'optimal' solves the rectangular linear sum assignment (maximum total
+        similarity, Jonker-Volgenant). 'greedy' repeatedly takes the most
+        similar unused pair; its total is at least half the optimum and it
+        is usually within a few percent.
+        
+        Args:
+            similarity_matrix: Dense similarity matrix (n_resume x n_jd)
+            method: 'optimal' or 'greedy'
+            
+        Returns:
+            (resume index, similarity) per JD skill; JD skills left without a
+            resume skill (n_jd > n_resume) get index -1 and similarity 0
+        """
+        n_resume, n_jd = similarity_matrix.shape
+        if method == 'optimal':
+            from scipy.optimize import linear_sum_assignment
+            rows, cols = linear_sum_assignment(similarity_matrix, maximize=True)
+        elif method == 'greedy':
+            rows, cols = self._greedy_assignment(similarity_matrix)
+        else:
+            raise ValueError(f"Unknown assignment method: {method}")
+        
+        resume_idx = np.full(n_jd, -1, dtype=np.int64)
+        similarity = np.zeros(n_jd, dtype=np.float32)
+        resume_idx[cols] = rows
+        similarity[cols] = similarity_matrix[rows, cols]
+        return resume_idx, similarity
+    
+    @staticmethod
+    def _greedy_assignment(similarity_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Greedy matching in rounds: every mutually-best (row, column) pair is taken at once"""
+        rows_left = np.arange(similarity_matrix.shape[0])
+        cols_left = np.arange(similarity_matrix.shape[1])
+        rows, cols = [], []
+        # The global maximum is always mutually best, so each round makes progress;
+        # locally dominant pairs give the same matching as sequential greedy
+        while len(rows_left) and len(cols_left):
+            block = similarity_matrix[np.ix_(rows_left, cols_left)]
+            best_row = block.argmax(axis=0)
+            best_col = block.argmax(axis=1)
+            mutual = np.flatnonzero(best_col[best_row] == np.arange(len(cols_left)))
+            rows.append(rows_left[best_row[mutual]])
+            cols.append(cols_left[mutual])
+            rows_left = np.delete(rows_left, best_row[mutual])
+            cols_left = np.delete(cols_left, mutual)
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(rows), np.concatenate(cols)
+    
     def find_best_matches(self, similarity_matrix: np.ndarray, 
-                         threshold: float = 0.5) -> List[Tuple[int, int, float]]:
+                         threshold: float = 0.5,
+                         one_to_one: bool = False) -> List[Tuple[int, int, float]]:
         """
         Find best matches above threshold
         
         Args:
             similarity_matrix: Computed similarity matrix
             threshold: Minimum similarity threshold
+            one_to_one: Use each resume skill for at most one JD skill
+                (optimal assignment) instead of its best match per JD skill
             
         Returns:
             List of (resume_idx, jd_idx, similarity) tuples
@@ -303,6 +806,11 @@ class SimilarityCalculator:
         matches = []
         n_resume, n_jd = similarity_matrix.shape
         
+        if one_to_one:
+            resume_idx, similarity = self.assign_one_to_one(similarity_matrix)
+            return [(int(resume_idx[jd_idx]), int(jd_idx), float(similarity[jd_idx]))
+                    for jd_idx in np.flatnonzero((resume_idx >= 0) & (similarity >= threshold))]
+        
         for jd_idx in range(n_jd):
             best_resume_idx = np.argmax(similarity_matrix[:, jd_idx])
             best_similarity = similarity_matrix[best_resume_idx, jd_idx]
@@ -327,21 +835,56 @@ class SimilarityCalculator:
 class SkillGapAnalyzer:
     """Main skill gap analysis engine"""
     
-    def __init__(self, encoder: SentenceBERTEncoder, calculator: SimilarityCalculator,
-                 strong_threshold: float = 0.80, partial_threshold: float = 0.50):
+    MATCHING_MODES = ('best', 'optimal', 'greedy')
+    
+    def __init__(self, encoder: Optional[SentenceBERTEncoder], calculator: SimilarityCalculator,
+                 strong_threshold: float = 0.80, partial_threshold: float = 0.50,
+                 ann_index: Optional[IVFIndex] = None,
+                 max_matrix_bytes: Optional[int] = DEFAULT_MAX_MATRIX_BYTES,
+                 sparse_floor: Optional[float] = None,
+                 result_cache: Optional[ResultCache] = None,
+                 lexical_fast_path: bool = True,
+                 matching_mode: str = 'best'):
         """
         Initialize gap analyzer
         
         Args:
-            encoder: BERT encoder instance
+            encoder: BERT encoder instance (None for an analyzer that only
+                reclassifies existing results, so the model need not be loaded)
             calculator: Similarity calculator instance
             strong_threshold: Threshold for strong match
             partial_threshold: Threshold for partial match
+            ann_index: Optional ANN index over a large skill taxonomy, used by
+                analyze_against_index instead of a full similarity matrix
+            max_matrix_bytes: Largest similarity matrix analyze() materialises;
+                bigger inputs are scored block by block without keeping the
+                matrix (None disables the cap)
+            sparse_floor: If set, results keep only similarities >= this value,
+                as a sparse matrix (also in memory-capped mode)
+            result_cache: Optional cache of finished results; a repeated
+                analysis of the same skill sets is served without encoding
+            lexical_fast_path: Resolve JD skills that exactly (or by alias)
+                match a resume skill without SBERT ('best' mode only)
+            matching_mode: 'best' lets one resume skill be the best match of
+                many JD skills; 'optimal' / 'greedy' match one-to-one (see
+                SimilarityCalculator.assign_one_to_one)
         """
+        if matching_mode not in self.MATCHING_MODES:
+            raise ValueError(f"matching_mode must be one of {self.MATCHING_MODES}")
         self.encoder = encoder
         self.calculator = calculator
         self.strong_threshold = strong_threshold
         self.partial_threshold = partial_threshold
+        self.ann_index = ann_index
+        self.max_matrix_bytes = max_matrix_bytes
+        self.sparse_floor = sparse_floor
+        self.result_cache = result_cache
+        self.lexical_fast_path = lexical_fast_path
+        self.matching_mode = matching_mode
+        self.lexical_stats = {'analyses': 0, 'lexical_matches': 0, 'encodes_saved': 0, 'cells_saved': 0}
+        if result_cache is not None and encoder is not None:
+            result_cache.bind_model(encoder.model_name)
+        self.last_leaderboard_stats = None
         self.logger = self._setup_logger()
     
     def analyze(self, resume_skills: List[str], jd_skills: List[str],
@@ -359,117 +902,669 @@ class SkillGapAnalyzer:
         """
         self.logger.info(f"Starting gap analysis: {len(resume_skills)} resume skills vs {len(jd_skills)} JD skills")
         
+        # Equivalent spellings/aliases collapse into one row / column
+        normalizer = self.encoder.normalizer
+        resume_skills, resume_keys = normalizer.canonicalize(resume_skills)
+        jd_skills, jd_keys = normalizer.canonicalize(jd_skills)
+        
         # Validate inputs
         if not resume_skills or not jd_skills:
             raise ValueError("Both resume_skills and jd_skills must be non-empty")
         
-        # Step 1: Generate embeddings
-        self.logger.info("Step 1: Generating BERT embeddings...")
-        resume_embeddings = self.encoder.encode_skills(resume_skills, show_progress=True)
+        cache_key, result = self._cached_result(resume_keys, jd_keys)
+        if result is not None:
+            return result
+        
+        # Step 0: Lexical fast path - a JD skill whose canonical key is also a
+        # resume key is an exact/alias match; it is STRONG with similarity 1.0
+        # and never reaches the encoder or the similarity matrix
+        n_resume, n_jd = len(resume_skills), len(jd_skills)
+        lexical_rows = self._lexical_rows(resume_keys, jd_keys)
+        lexical_mask = lexical_rows >= 0
+        semantic_cols = np.flatnonzero(~lexical_mask)
+        
+        best_resume_idx = np.where(lexical_mask, lexical_rows, 0)
+        best_similarity = np.ones(n_jd, dtype=np.float32)
+        semantic_sparse = None
+        
+        # Full matrix, or only column maxima when it would not fit in the memory cap
+        matrix_bytes = n_resume * n_jd * np.dtype(np.float32).itemsize
+        capped = self.max_matrix_bytes is not None and matrix_bytes > self.max_matrix_bytes
+        if capped:
+            similarity_matrix = None
+        elif len(semantic_cols) == n_jd:
+            similarity_matrix = np.empty((n_resume, n_jd), dtype=np.float32)
+        else:
+            # Lexical columns hold only their exact match (1.0); the rest are not
+            # computed and stay 0, lexical_mask records which columns these are
+            similarity_matrix = np.zeros((n_resume, n_jd), dtype=np.float32)
+            similarity_matrix[lexical_rows[lexical_mask], lexical_mask] = 1.0
+        
+        if len(semantic_cols):
+            # Step 1: Generate embeddings
+            self.logger.info("Step 1: Generating BERT embeddings...")
+            resume_embeddings = self.encoder.encode_skills(resume_skills, show_progress=True)
+            jd_embeddings = self.encoder.encode_skills([jd_skills[j] for j in semantic_cols],
+                                                       show_progress=True)
+            
+            # Step 2: Compute similarity matrix
+            if capped:
+                self.logger.info(f"Step 2: Similarity matrix would need {matrix_bytes / 1024 / 1024:.0f} MB; "
+                                f"computing best matches block by block...")
+                best = self.calculator.compute_best_matches_blocked(
+                    resume_embeddings, jd_embeddings,
+                    max_block_bytes=min(self.max_matrix_bytes, DEFAULT_MAX_BLOCK_BYTES),
+                    sparse_floor=self.sparse_floor
+                )
+                best_resume_idx[semantic_cols] = best['best_resume_idx']
+                best_similarity[semantic_cols] = best['best_similarity']
+                semantic_sparse = best.get('sparse_matrix')
+            else:
+                self.logger.info("Step 2: Computing similarity matrix...")
+                semantic = self.calculator.compute_similarity_matrix(resume_embeddings, jd_embeddings)
+                similarity_matrix[:, semantic_cols] = semantic
+                best_resume_idx[semantic_cols] = semantic.argmax(axis=0)
+                best_similarity[semantic_cols] = semantic[best_resume_idx[semantic_cols],
+                                                          np.arange(len(semantic_cols))]
+        
+        if capped and self.sparse_floor is not None:
+            # Blocked sparse output covers the semantic columns; add the exact matches
+            from scipy import sparse
+            coo = semantic_sparse.tocoo() if semantic_sparse is not None else sparse.coo_matrix((n_resume, 0))
+            similarity_matrix = sparse.coo_matrix(
+                (np.concatenate([coo.data, np.ones(lexical_mask.sum(), dtype=np.float32)]),
+                 (np.concatenate([coo.row, lexical_rows[lexical_mask]]),
+                  np.concatenate([semantic_cols[coo.col], np.flatnonzero(lexical_mask)]))),
+                shape=(n_resume, n_jd), dtype=np.float32
+            ).tocsr()
+        
+        self._record_lexical(
+            lexical_matches=int(lexical_mask.sum()),
+            encodes_saved=int(lexical_mask.sum()) + (n_resume if not len(semantic_cols) else 0),
+            cells_saved=n_resume * int(lexical_mask.sum())
+        )
+        
+        # Step 3-5: Classify matches and score
+        self.logger.info(f"Step 3: Classifying skill matches ({int(lexical_mask.sum())} exact/alias)...")
+        result = self._build_result(similarity_matrix, resume_skills, jd_skills,
+                                    best_resume_idx, best_similarity,
+                                    lexical_mask=lexical_mask if lexical_mask.any() else None)
+        
+        self.logger.info(f"Analysis complete: {len(result.matched_skills)} matched, "
+                        f"{len(result.partial_matches)} partial, {len(result.missing_skills)} missing")
+        self._store_result(cache_key, result)
+        return result
+    
+    def analyze_incremental(self, resume_skills: List[str], jd_skills: List[str],
+                            previous: Optional[GapAnalysisResult] = None) -> GapAnalysisResult:
+        """
+        Gap analysis that reuses a previous result for the skills both runs share
+        
+        The new skill lists are diffed against the previous run: only added
+        skills are encoded, only their rows/columns of the similarity matrix
+        are computed, and best matches are only recomputed for JD skills whose
+        previous best resume skill was removed (or that are new). Gives the
+        same result as analyze(), but interactive edits of long lists stay fast.
+        
+        Args:
+            resume_skills: List of skills from resume
+            jd_skills: List of required skills from job description
+            previous: Result of the previous run; falls back to analyze() if None
+            
+        Returns:
+            GapAnalysisResult object with complete analysis
+        """
+        # Splicing needs every entry of the previous matrix, not just those above a floor
+        if previous is None or not isinstance(previous.similarity_matrix, np.ndarray):
+            return self.analyze(resume_skills, jd_skills)
+        
+        normalizer = self.encoder.normalizer
+        resume_skills, resume_keys = normalizer.canonicalize(resume_skills)
+        jd_skills, jd_keys = normalizer.canonicalize(jd_skills)
+        if not resume_skills or not jd_skills:
+            raise ValueError("Both resume_skills and jd_skills must be non-empty")
+        
+        cache_key, result = self._cached_result(resume_keys, jd_keys)
+        if result is not None:
+            return result
+        if (self.max_matrix_bytes is not None and
+                len(resume_skills) * len(jd_skills) * np.dtype(np.float32).itemsize > self.max_matrix_bytes):
+            return self.analyze(resume_skills, jd_skills)
+        
+        # Position of each new row/column in the previous run, -1 if added
+        old_rows = self._previous_positions(resume_keys, previous.resume_skills)
+        old_cols = self._previous_positions(jd_keys, previous.jd_skills)
+        kept_rows = np.flatnonzero(old_rows >= 0)
+        new_rows = np.flatnonzero(old_rows < 0)
+        
+        # Every JD skill with an exact/alias resume match is lexical, as in analyze();
+        # previous SBERT columns are reused only for skills that were and still are
+        # semantic. Any other column (added, or lexical in the previous run) is
+        # computed in full
+        lexical_rows = self._lexical_rows(resume_keys, jd_keys)
+        lexical_mask = lexical_rows >= 0
+        was_lexical = np.zeros(len(jd_skills), dtype=bool)
+        if previous.lexical_mask is not None:
+            reused = old_cols >= 0
+            was_lexical[reused] = previous.lexical_mask[old_cols[reused]]
+        reusable = (old_cols >= 0) & ~was_lexical & ~lexical_mask
+        kept_cols = np.flatnonzero(reusable)
+        new_cols = np.flatnonzero(~reusable & ~lexical_mask)
+        
+        self.logger.info(f"Incremental analysis: {len(new_rows)} new resume skills, "
+                        f"{len(new_cols)} new JD skills, reusing {len(kept_rows)}x{len(kept_cols)} block")
+        
+        if lexical_mask.any():
+            similarity_matrix = np.zeros((len(resume_skills), len(jd_skills)), dtype=np.float32)
+            similarity_matrix[lexical_rows[lexical_mask], lexical_mask] = 1.0
+        else:
+            similarity_matrix = np.empty((len(resume_skills), len(jd_skills)), dtype=np.float32)
+        similarity_matrix[np.ix_(kept_rows, kept_cols)] = \
+            previous.similarity_matrix[np.ix_(old_rows[kept_rows], old_cols[kept_cols])]
+        
+        # Only the added skills reach the model; everything else is a cache hit
+        if len(new_cols):
+            resume_embeddings = self.encoder.encode_skills(resume_skills)
+            new_col_embeddings = self.encoder.encode_skills([jd_skills[j] for j in new_cols])
+            similarity_matrix[:, new_cols] = self.calculator.compute_similarity_matrix(
+                resume_embeddings, new_col_embeddings
+            )
+        if len(new_rows) and len(kept_cols):
+            new_row_embeddings = self.encoder.encode_skills([resume_skills[i] for i in new_rows])
+            kept_col_embeddings = self.encoder.encode_skills([jd_skills[j] for j in kept_cols])
+            similarity_matrix[np.ix_(new_rows, kept_cols)] = self.calculator.compute_similarity_matrix(
+                new_row_embeddings, kept_col_embeddings
+            )
+        added_lexical = lexical_mask & (old_cols < 0)
+        self._record_lexical(
+            lexical_matches=int(lexical_mask.sum()),
+            encodes_saved=int(added_lexical.sum()),
+            cells_saved=len(resume_skills) * int(added_lexical.sum())
+                        + len(new_rows) * int((lexical_mask & ~added_lexical).sum())
+        )
+        
+        # Best matches: exact matches are final; the rest start from the previous
+        # ones, mapped to the new row order
+        new_row_of_old = np.full(len(previous.resume_skills), -1, dtype=np.int64)
+        new_row_of_old[old_rows[kept_rows]] = kept_rows
+        best_resume_idx = np.where(lexical_mask, lexical_rows, 0)
+        best_similarity = np.where(lexical_mask, 1.0, -np.inf).astype(np.float32)
+        
+        previous_best = new_row_of_old[previous.best_resume_idx[old_cols[kept_cols]]]
+        still_present = previous_best >= 0
+        if previous.matching_mode != 'best':
+            # One-to-one picks are not column maxima; rescan every column
+            still_present[:] = False
+        best_resume_idx[kept_cols[still_present]] = previous_best[still_present]
+        best_similarity[kept_cols[still_present]] = previous.best_similarity[old_cols[kept_cols[still_present]]]
+        
+        # Added rows can only improve on a best match that is still present
+        if len(new_rows):
+            cols = kept_cols[still_present]
+            block = similarity_matrix[np.ix_(new_rows, cols)]
+            if block.size:
+                block_best = block.argmax(axis=0)
+                block_max = block[block_best, np.arange(len(cols))]
+                improved = block_max > best_similarity[cols]
+                best_resume_idx[cols[improved]] = new_rows[block_best[improved]]
+                best_similarity[cols[improved]] = block_max[improved]
+        
+        # Full column scan only where the best row was removed, and for new columns
+        rescan = np.concatenate([kept_cols[~still_present], new_cols])
+        if len(rescan):
+            columns = similarity_matrix[:, rescan]
+            best_resume_idx[rescan] = columns.argmax(axis=0)
+            best_similarity[rescan] = columns[best_resume_idx[rescan], np.arange(len(rescan))]
+        
+        result = self._build_result(similarity_matrix, resume_skills, jd_skills,
+                                    best_resume_idx, best_similarity,
+                                    lexical_mask=lexical_mask if lexical_mask.any() else None)
+        self._store_result(cache_key, result)
+        return result
+    
+    def _lexical_rows(self, resume_keys: List[str], jd_keys: List[str]) -> np.ndarray:
+        """Row of the resume skill with the same canonical key as each JD skill, -1 if none"""
+        # One-to-one matching needs every column of the matrix
+        if not self.lexical_fast_path or self.matching_mode != 'best':
+            return np.full(len(jd_keys), -1, dtype=np.int64)
+        row_of_key = {key: i for i, key in enumerate(resume_keys)}
+        return np.fromiter((row_of_key.get(key, -1) for key in jd_keys), dtype=np.int64, count=len(jd_keys))
+    
+    def _record_lexical(self, lexical_matches: int, encodes_saved: int, cells_saved: int):
+        """Accumulate the work the lexical fast path avoided"""
+        self.lexical_stats['analyses'] += 1
+        self.lexical_stats['lexical_matches'] += lexical_matches
+        self.lexical_stats['encodes_saved'] += encodes_saved
+        self.lexical_stats['cells_saved'] += cells_saved
+    
+    def _cached_result(self, resume_keys: List[str],
+                       jd_keys: List[str]) -> Tuple[Optional[str], Optional[GapAnalysisResult]]:
+        """(cache key, cached result or None) for a canonicalised analysis"""
+        if self.result_cache is None:
+            return None, None
+        cache_key = ResultCache.make_key(
+            resume_keys, jd_keys, self.encoder.model_name,
+            strong_threshold=self.strong_threshold,
+            partial_threshold=self.partial_threshold,
+            max_matrix_bytes=self.max_matrix_bytes,
+            sparse_floor=self.sparse_floor,
+            lexical_fast_path=self.lexical_fast_path,
+            matching_mode=self.matching_mode
+        )
+        result = self.result_cache.get(cache_key)
+        if result is not None:
+            self.logger.info("Returning cached analysis result")
+        return cache_key, result
+    
+    def _store_result(self, cache_key: Optional[str], result: GapAnalysisResult):
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result, self.encoder.model_name)
+    
+    def _previous_positions(self, keys: List[str], previous_skills: List[str]) -> np.ndarray:
+        """Index of each canonical key in a previous run's skill list, -1 if absent"""
+        key = self.encoder.normalizer.key
+        previous = {key(skill): i for i, skill in enumerate(previous_skills)}
+        return np.fromiter((previous.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+    
+    def build_ann_index(self, skills: List[str], n_lists: Optional[int] = None,
+                        n_probe: int = 8) -> IVFIndex:
+        """
+        Encode a (large) skill taxonomy and build an ANN index over it
+        
+        The index becomes this analyzer's ann_index and can be saved with
+        IVFIndex.save and reloaded with IVFIndex.load.
+        """
+        skills, _ = self.encoder.normalizer.canonicalize(skills)
+        embeddings = self.encoder.encode_skills(skills, show_progress=True)
+        self.ann_index = IVFIndex(n_lists=n_lists, n_probe=n_probe).build(
+            embeddings, skills, model_name=self.encoder.model_name
+        )
+        return self.ann_index
+    
+    def analyze_against_index(self, jd_skills: List[str], index: Optional[IVFIndex] = None,
+                              top_k: int = 5, n_probe: Optional[int] = None) -> GapAnalysisResult:
+        """
+        Gap analysis of JD skills against a huge indexed skill set (e.g. a taxonomy)
+        
+        Instead of an all-pairs matrix against every indexed skill, each JD skill
+        retrieves its top_k approximate neighbours; the result's resume side is
+        the union of those neighbours, with exact similarities against them.
+        
+        Args:
+            jd_skills: List of required skills from job description
+            index: ANN index to search (defaults to self.ann_index)
+            top_k: Neighbours retrieved per JD skill
+            n_probe: Clusters searched per query (higher = better recall, slower)
+            
+        Returns:
+            GapAnalysisResult whose resume_skills are the retrieved indexed skills
+        """
+        index = index or self.ann_index
+        if index is None:
+            raise ValueError("No ANN index available; pass one or call build_ann_index first")
+        if index.model_name and index.model_name != self.encoder.model_name:
+            raise ValueError(f"Index was built with {index.model_name}, encoder uses {self.encoder.model_name}")
+        
+        jd_skills, _ = self.encoder.normalizer.canonicalize(jd_skills)
+        if not jd_skills:
+            raise ValueError("jd_skills must be non-empty")
+        
+        self.logger.info(f"Starting indexed gap analysis: {len(jd_skills)} JD skills vs {len(index)} indexed skills")
         jd_embeddings = self.encoder.encode_skills(jd_skills, show_progress=True)
         
-        # Step 2: Compute similarity matrix
-        self.logger.info("Step 2: Computing similarity matrix...")
+        _, neighbour_ids = index.search(jd_embeddings, k=top_k, n_probe=n_probe)
+        candidate_ids = np.unique(neighbour_ids[neighbour_ids >= 0])
+        
         similarity_matrix = self.calculator.compute_similarity_matrix(
-            resume_embeddings, 
-            jd_embeddings
+            index.get_vectors(candidate_ids), jd_embeddings
         )
+        candidate_skills = [index.skills[i] for i in candidate_ids]
+        return self._build_result(similarity_matrix, candidate_skills, jd_skills)
+    
+    def analyze_batch(self, resumes: List[List[str]], jds: List[List[str]],
+                      summary_only: bool = False,
+                      max_block_bytes: int = 256 * 1024 * 1024):
+        """
+        Analyze every resume against every job description in one pass
         
-        # Step 3: Classify matches
-        self.logger.info("Step 3: Classifying skill matches...")
-        matched_skills = []
-        partial_matches = []
-        missing_skills = []
+        The union of all skills is encoded once and similarities are computed
+        as large matmuls between groups of resumes and the JD-skill union,
+        instead of one encode + small matrix per (resume, JD) pair. Each block
+        is reduced to the pairs' results (or summary) straight away, so the
+        union similarity matrix is never held in memory.
         
-        for jd_idx, jd_skill in enumerate(jd_skills):
-            # Find best matching resume skill
-            best_resume_idx = np.argmax(similarity_matrix[:, jd_idx])
-            best_similarity = float(similarity_matrix[best_resume_idx, jd_idx])
-            resume_skill = resume_skills[best_resume_idx]
+        Args:
+            resumes: N resume skill lists
+            jds: M job description skill lists
+            summary_only: Return a columnar summary instead of per-pair results
+            max_block_bytes: Memory cap for one block of similarities
+                (resumes x JD-skill union)
             
-            # Get category
-            category = skill_categories.get(jd_skill, 'other') if skill_categories else 'other'
+        Returns:
+            N x M nested list of GapAnalysisResult (results[i][j] = resume i vs JD j),
+            or, with summary_only, a dict of flat arrays with one entry per pair
+            ('resume_index', 'jd_index', 'overall_score', 'matched_count',
+            'partial_count', 'missing_count')
+        """
+        if not resumes or not jds:
+            raise ValueError("Both resumes and jds must be non-empty")
+        
+        self.logger.info(f"Starting batch analysis: {len(resumes)} resumes x {len(jds)} JDs")
+        normalizer = self.encoder.normalizer
+        
+        resume_lists = [normalizer.canonicalize(skills) for skills in resumes]
+        jd_lists = [normalizer.canonicalize(skills) for skills in jds]
+        if any(not keys for _, keys in resume_lists + jd_lists):
+            raise ValueError("Every resume and JD must contain at least one skill")
+        
+        # Union vocabularies; each list becomes an index array into its union
+        resume_union, resume_rows = self._index_union(keys for _, keys in resume_lists)
+        jd_union, jd_cols = self._index_union(keys for _, keys in jd_lists)
+        
+        # Step 1: Encode the union of all skills once
+        self.logger.info(f"Step 1: Encoding {len(resume_union)} resume + {len(jd_union)} JD distinct skills...")
+        embeddings = self.encoder.encode_skills(resume_union + jd_union, show_progress=True)
+        resume_embeddings = embeddings[:len(resume_union)]
+        jd_embeddings = embeddings[len(resume_union):]
+        
+        # Step 2: Similarities of a group of resumes at a time, reduced per pair
+        self.logger.info("Step 2: Computing similarities in resume blocks...")
+        row_budget = max(1, max_block_bytes // max(1, 4 * len(jd_union)))
+        summary = self._BatchSummary(jd_cols, len(resumes)) if summary_only else None
+        results = []
+        for group in self._resume_groups(resume_rows, row_budget):
+            # Distinct union rows of the group, one matmul for all of them
+            group_rows, inverse = np.unique(np.concatenate([resume_rows[i] for i in group]),
+                                            return_inverse=True)
+            block = self.calculator.compute_similarity_matrix(resume_embeddings[group_rows], jd_embeddings)
             
-            # Classify based on similarity
-            if best_similarity >= self.strong_threshold:
-                match = SkillMatch(
-                    jd_skill=jd_skill,
-                    resume_skill=resume_skill,
-                    similarity=best_similarity,
-                    category='STRONG_MATCH',
-                    confidence_level='HIGH',
-                    priority='LOW'
-                )
-                matched_skills.append(match)
-                
-            elif best_similarity >= self.partial_threshold:
-                match = SkillMatch(
-                    jd_skill=jd_skill,
-                    resume_skill=resume_skill,
-                    similarity=best_similarity,
-                    category='PARTIAL_MATCH',
-                    confidence_level='MEDIUM',
-                    priority='MEDIUM'
-                )
-                partial_matches.append(match)
-                
+            start = 0
+            for i in group:
+                stop = start + len(resume_rows[i])
+                row_block = block[inverse[start:stop]]
+                start = stop
+                if summary is not None and self.matching_mode == 'best':
+                    summary.add(i, row_block.max(axis=0), self.strong_threshold, self.partial_threshold)
+                elif summary is not None:
+                    # One-to-one picks depend on the whole pair matrix, not on column maxima
+                    for j, cols in enumerate(jd_cols):
+                        _, values = self.calculator.assign_one_to_one(row_block[:, cols], self.matching_mode)
+                        summary.add_pair(i, j, values, self.strong_threshold, self.partial_threshold)
+                else:
+                    resume_display = resume_lists[i][0]
+                    results.append([
+                        self._build_result(row_block[:, cols], resume_display, jd_display)
+                        for (jd_display, _), cols in zip(jd_lists, jd_cols)
+                    ])
+        
+        return summary.as_dict() if summary is not None else results
+    
+    def rank_candidates(self, resumes: Iterable[Tuple[str, List[str]]], jd_skills: List[str],
+                        top_k: int = 50, chunk_size: int = 256,
+                        n_top_missing: int = 3) -> List[LeaderboardEntry]:
+        """
+        Leaderboard mode: stream many resumes against one JD, keeping the top_k
+        
+        The JD is encoded once. Resumes are consumed in chunks; each chunk is
+        encoded in one call and reduced to per-candidate summaries straight
+        away, so only a top_k heap of LeaderboardEntry objects stays in memory,
+        never the similarity matrices.
+        
+        Args:
+            resumes: Iterable (e.g. generator) of (candidate_id, skills) pairs
+            jd_skills: Required skills of the requisition
+            top_k: Number of best candidates to keep
+            chunk_size: Resumes encoded and scored per step
+            n_top_missing: Lowest-similarity missing JD skills kept per candidate
+            
+        Returns:
+            Up to top_k LeaderboardEntry objects, best overall score first
+        """
+        jd_skills, _ = self.encoder.normalizer.canonicalize(jd_skills)
+        if not jd_skills:
+            raise ValueError("jd_skills must be non-empty")
+        jd_embeddings = self.encoder.encode_skills(jd_skills)
+        
+        self.logger.info(f"Starting leaderboard: top {top_k} candidates for {len(jd_skills)} JD skills")
+        heap = []
+        sequence = itertools.count()
+        n_scored = 0
+        start_time = time.perf_counter()
+        
+        chunk = []
+        for candidate in resumes:
+            chunk.append(candidate)
+            if len(chunk) >= chunk_size:
+                n_scored += self._score_candidate_chunk(chunk, jd_skills, jd_embeddings,
+                                                        heap, sequence, top_k, n_top_missing)
+                chunk = []
+        if chunk:
+            n_scored += self._score_candidate_chunk(chunk, jd_skills, jd_embeddings,
+                                                    heap, sequence, top_k, n_top_missing)
+        
+        elapsed = time.perf_counter() - start_time
+        self.last_leaderboard_stats = {
+            'resumes_scored': n_scored,
+            'seconds': elapsed,
+            'resumes_per_second': n_scored / elapsed if elapsed > 0 else 0.0
+        }
+        self.logger.info(f"Leaderboard complete: {n_scored} resumes in {elapsed:.2f}s "
+                        f"({self.last_leaderboard_stats['resumes_per_second']:.0f} resumes/sec)")
+        
+        return [entry for _, _, entry in sorted(heap, reverse=True)]
+    
+    def _score_candidate_chunk(self, chunk: List[Tuple[str, List[str]]], jd_skills: List[str],
+                               jd_embeddings: np.ndarray, heap: List, sequence: Iterator[int],
+                               top_k: int, n_top_missing: int) -> int:
+        """Score one chunk of resumes and push their summaries into the top-k heap"""
+        normalizer = self.encoder.normalizer
+        candidate_ids = []
+        skill_lists = []
+        for candidate_id, skills in chunk:
+            displays, _ = normalizer.canonicalize(skills)
+            if not displays:
+                self.logger.warning(f"Skipping candidate {candidate_id}: no skills")
+                continue
+            candidate_ids.append(candidate_id)
+            skill_lists.append(displays)
+        if not candidate_ids:
+            return 0
+        
+        # All skills of the chunk stacked; candidate c owns rows offsets[c]:offsets[c + 1]
+        lengths = np.array([len(skills) for skills in skill_lists])
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        embeddings = self.encoder.encode_skills([s for skills in skill_lists for s in skills])
+        
+        similarity = self.calculator.compute_similarity_matrix(embeddings, jd_embeddings)
+        if self.matching_mode == 'best':
+            best = np.maximum.reduceat(similarity, offsets, axis=0)  # n_candidates x n_jd
+        else:
+            # One-to-one: each candidate's own assignment, as analyze() would score it
+            best = np.stack([
+                self.calculator.assign_one_to_one(similarity[start:start + length], self.matching_mode)[1]
+                for start, length in zip(offsets, lengths)
+            ])
+        
+        overall = best.mean(axis=1)
+        strong = best >= self.strong_threshold
+        partial = ~strong & (best >= self.partial_threshold)
+        matched_counts = strong.sum(axis=1)
+        partial_counts = partial.sum(axis=1)
+        
+        for c, candidate_id in enumerate(candidate_ids):
+            score = float(overall[c])
+            if len(heap) >= top_k and score <= heap[0][0]:
+                continue
+            missing = np.flatnonzero(best[c] < self.partial_threshold)
+            missing = missing[np.argsort(best[c][missing])][:n_top_missing]
+            entry = LeaderboardEntry(
+                candidate_id=candidate_id,
+                overall_score=score,
+                matched_count=int(matched_counts[c]),
+                partial_count=int(partial_counts[c]),
+                missing_count=int(len(jd_skills) - matched_counts[c] - partial_counts[c]),
+                top_missing=[jd_skills[j] for j in missing]
+            )
+            # Negated arrival order breaks ties (earlier candidate ranks higher)
+            # so entries themselves are never compared
+            item = (score, -next(sequence), entry)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
             else:
-                match = SkillMatch(
-                    jd_skill=jd_skill,
-                    resume_skill=resume_skill,
-                    similarity=best_similarity,
-                    category='MISSING',
-                    confidence_level='LOW',
-                    priority='HIGH'
-                )
-                missing_skills.append(match)
+                heapq.heapreplace(heap, item)
         
-        # Step 4: Calculate overall score
-        overall_score = self._calculate_overall_score(similarity_matrix)
+        return len(candidate_ids)
+    
+    def _index_union(self, key_lists) -> Tuple[List[str], List[np.ndarray]]:
+        """Union of several key lists plus, per list, its indices into the union"""
+        positions = {}
+        indices = []
+        for keys in key_lists:
+            indices.append(np.fromiter((positions.setdefault(k, len(positions)) for k in keys),
+                                       dtype=np.int64, count=len(keys)))
+        return list(positions), indices
+    
+    @staticmethod
+    def _resume_groups(resume_rows: List[np.ndarray], row_budget: int) -> Iterator[List[int]]:
+        """Consecutive resume indices whose skills together fit in row_budget rows"""
+        group = []
+        n_rows = 0
+        for i, rows in enumerate(resume_rows):
+            if group and n_rows + len(rows) > row_budget:
+                yield group
+                group = []
+                n_rows = 0
+            group.append(i)
+            n_rows += len(rows)
+        if group:
+            yield group
+    
+    class _BatchSummary:
+        """Columnar per-pair scores of analyze_batch, filled one resume at a time"""
+        
+        def __init__(self, jd_cols: List[np.ndarray], n_resumes: int):
+            n_jds = len(jd_cols)
+            self.jd_lengths = np.array([len(cols) for cols in jd_cols])
+            self.jd_offsets = np.concatenate([[0], np.cumsum(self.jd_lengths)[:-1]])
+            self.all_cols = np.concatenate(jd_cols)
+            self.overall = np.empty((n_resumes, n_jds), dtype=np.float32)
+            self.matched = np.empty((n_resumes, n_jds), dtype=np.int64)
+            self.partial = np.empty((n_resumes, n_jds), dtype=np.int64)
+        
+        def add(self, resume_index: int, best: np.ndarray, strong_threshold: float,
+                partial_threshold: float):
+            """Reduce one resume's best similarity per JD-union skill into per-JD scores"""
+            values = best[self.all_cols]
+            self.overall[resume_index] = np.add.reduceat(values, self.jd_offsets) / self.jd_lengths
+            strong = values >= strong_threshold
+            self.matched[resume_index] = np.add.reduceat(strong, self.jd_offsets)
+            self.partial[resume_index] = np.add.reduceat(~strong & (values >= partial_threshold),
+                                                         self.jd_offsets)
+        
+        def add_pair(self, resume_index: int, jd_index: int, values: np.ndarray,
+                     strong_threshold: float, partial_threshold: float):
+            """Score one (resume, JD) pair from its per-JD-skill match similarities"""
+            strong = values >= strong_threshold
+            self.overall[resume_index, jd_index] = values.mean()
+            self.matched[resume_index, jd_index] = strong.sum()
+            self.partial[resume_index, jd_index] = (~strong & (values >= partial_threshold)).sum()
+        
+        def as_dict(self) -> Dict[str, np.ndarray]:
+            n_resumes, n_jds = self.overall.shape
+            return {
+                'resume_index': np.repeat(np.arange(n_resumes), n_jds),
+                'jd_index': np.tile(np.arange(n_jds), n_resumes),
+                'overall_score': self.overall.ravel(),
+                'matched_count': self.matched.ravel(),
+                'partial_count': self.partial.ravel(),
+                'missing_count': (self.jd_lengths[np.newaxis, :] - self.matched - self.partial).ravel()
+            }
+    
+    def _build_result(self, similarity_matrix: Optional[Union[np.ndarray, 'sparse.csr_matrix']],
+                      resume_skills: List[str],
+                      jd_skills: List[str], best_resume_idx: Optional[np.ndarray] = None,
+                      best_similarity: Optional[np.ndarray] = None,
+                      lexical_mask: Optional[np.ndarray] = None) -> GapAnalysisResult:
+        """Classify each JD skill by its best resume match and assemble the result"""
+        # Best matching resume skill for every JD skill at once
+        if best_resume_idx is None:
+            best_resume_idx = similarity_matrix.argmax(axis=0)
+            best_similarity = similarity_matrix[best_resume_idx, np.arange(similarity_matrix.shape[1])]
+        
+        # Mode the best matches were actually computed with, decided while the
+        # matrix is still dense (sparse output replaces it below)
+        matching_mode = 'best'
+        if self.matching_mode != 'best':
+            if isinstance(similarity_matrix, np.ndarray):
+                best_resume_idx, best_similarity = self.calculator.assign_one_to_one(
+                    similarity_matrix, self.matching_mode
+                )
+                matching_mode = self.matching_mode
+            else:
+                self.logger.warning("One-to-one matching needs the full similarity matrix; "
+                                    "using best matches for this memory-capped analysis")
         
-        # Step 5: Calculate category scores
-        category_scores = self._calculate_category_scores(
-            matched_skills, partial_matches, missing_skills
-        )
+        # Classify based on similarity
+        match_codes = self._classify(best_similarity)
         
-        self.logger.info(f"Analysis complete: {len(matched_skills)} matched, "
-                        f"{len(partial_matches)} partial, {len(missing_skills)} missing")
+        # Sparse output: best matches above are exact, only the stored matrix is thresholded
+        if self.sparse_floor is not None and isinstance(similarity_matrix, np.ndarray):
+            similarity_matrix = self.calculator.sparsify(similarity_matrix, self.sparse_floor)
         
         return GapAnalysisResult(
-            matched_skills=matched_skills,
-            partial_matches=partial_matches,
-            missing_skills=missing_skills,
-            overall_score=overall_score,
-            category_scores=category_scores,
+            overall_score=float(best_similarity.mean()),
+            category_scores=self._calculate_category_scores(match_codes, best_similarity),
             similarity_matrix=similarity_matrix,
             resume_skills=resume_skills,
-            jd_skills=jd_skills
+            jd_skills=jd_skills,
+            best_resume_idx=best_resume_idx,
+            best_similarity=best_similarity,
+            match_codes=match_codes,
+            strong_threshold=self.strong_threshold,
+            partial_threshold=self.partial_threshold,
+            lexical_mask=lexical_mask,
+            matching_mode=matching_mode
         )
     
-    def _calculate_overall_score(self, similarity_matrix: np.ndarray) -> float:
-        """Calculate overall match score"""
-        # Take maximum similarity for each JD skill
-        max_similarities = similarity_matrix.max(axis=0)
-        # Average of all maximum similarities
-        overall_score = float(np.mean(max_similarities))
-        return overall_score
-    
-    def _calculate_category_scores(self, matched: List[SkillMatch],
-                                   partial: List[SkillMatch],
-                                   missing: List[SkillMatch]) -> Dict[str, float]:
-        """Calculate scores by category"""
-        category_scores = {}
-        
-        all_skills = matched + partial + missing
-        categories = set(skill.category for skill in all_skills)
+    def reclassify(self, result: GapAnalysisResult) -> GapAnalysisResult:
+        """
+        Re-bucket an existing result with this analyzer's thresholds
         
-        for category in categories:
-            cat_skills = [s for s in all_skills if s.category == category]
-            if cat_skills:
-                avg_similarity = np.mean([s.similarity for s in cat_skills])
-                category_scores[category] = float(avg_similarity)
+        Best matches do not depend on the thresholds, so only the category
+        codes and category scores are recomputed; no encoding or similarity
+        computation happens.
         
-        return category_scores
+        Args:
+            result: Result of a previous analysis
+            
+        Returns:
+            New GapAnalysisResult sharing the similarity matrix and best matches
+        """
+        match_codes = self._classify(result.best_similarity)
+        return dataclasses.replace(
+            result,
+            category_scores=self._calculate_category_scores(match_codes, result.best_similarity),
+            match_codes=match_codes,
+            strong_threshold=self.strong_threshold,
+            partial_threshold=self.partial_threshold
+        )
+    
+    def _classify(self, best_similarity: np.ndarray) -> np.ndarray:
+        """Bucket best-match similarities into STRONG_MATCH / PARTIAL_MATCH / MISSING codes"""
+        match_codes = np.full(best_similarity.shape, MISSING, dtype=np.int8)
+        match_codes[best_similarity >= self.partial_threshold] = PARTIAL_MATCH
+        match_codes[best_similarity >= self.strong_threshold] = STRONG_MATCH
+        return match_codes
+    
+    def _calculate_category_scores(self, match_codes: np.ndarray,
+                                   best_similarity: np.ndarray) -> Dict[str, float]:
+        """Calculate scores by category (mean best-match similarity per category)"""
+        counts = np.bincount(match_codes, minlength=3)
+        sums = np.bincount(match_codes, weights=best_similarity, minlength=3)
+        return {
+            MATCH_CATEGORY_NAMES[code]: float(sums[code] / counts[code])
+            for code in range(3) if counts[code] > 0
+        }
     
     def _setup_logger(self) -> logging.Logger:
         """Setup logging"""
@@ -484,60 +1579,164 @@ class SkillGapAnalyzer:
 
 
 class SkillRanker:
-    """Rank skills by importance and priority"""
+    """Rank skills by importance and priority
+    
+    Importance is a weighted sum of the match similarity, a per-category score
+    (gaps matter most) and a per-priority score. Scores are computed on whole
+    arrays, and top-k selection uses a partial sort, so ranking the worst gaps
+    of thousands of candidates does not sort or build every SkillMatch.
+    """
+    
+    DEFAULT_IMPORTANCE_WEIGHTS = {
+        'similarity': 0.4,
+        'category': 0.3,
+        'priority': 0.3
+    }
+    # Indexed by match code (STRONG_MATCH, PARTIAL_MATCH, MISSING)
+    CATEGORY_SCORES = np.array([0.2, 0.6, 1.0])
+    PRIORITY_SCORES = {'HIGH': 1.0, 'MEDIUM': 0.6, 'LOW': 0.3}
+    DEFAULT_PRIORITY_SCORE = 0.5
     
     def __init__(self):
         self.logger = self._setup_logger()
+        self._category_codes = {name: code for code, name in enumerate(MATCH_CATEGORY_NAMES)}
+        # Result objects derive priority from the match code
+        self._priority_scores_by_code = np.array([self.PRIORITY_SCORES[p] for p in MATCH_PRIORITIES])
+    
+    def importance_scores(self, similarity: np.ndarray, match_codes: np.ndarray,
+                          priority_scores: Optional[np.ndarray] = None,
+                          importance_weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Importance of many skills at once
+        
+        Args:
+            similarity: Best-match similarity per skill
+            match_codes: STRONG_MATCH / PARTIAL_MATCH / MISSING code per skill
+            priority_scores: Priority score per skill (defaults to the priority
+                implied by the match code)
+            importance_weights: Optional weights for different factors
+            
+        Returns:
+            Importance score per skill (higher ranks first)
+        """
+        weights = importance_weights or self.DEFAULT_IMPORTANCE_WEIGHTS
+        if priority_scores is None:
+            priority_scores = self._priority_scores_by_code[match_codes]
+        return (weights['similarity'] * np.asarray(similarity, dtype=np.float64) +
+                weights['category'] * self.CATEGORY_SCORES[match_codes] +
+                weights['priority'] * priority_scores)
+    
+    @staticmethod
+    def top_k(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+        """
+        Indices of the k highest scores, best first (ties keep input order)
+        
+        Uses argpartition, so only the k selected entries are sorted.
+        """
+        n = len(scores)
+        if k is None or k >= n:
+            return np.argsort(-scores, kind='stable')
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        # Include every entry tied with the k-th score so the stable sort can
+        # pick among ties by position, as a full sort would
+        kth = -np.partition(-scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(scores >= kth)
+        return candidates[np.argsort(-scores[candidates], kind='stable')][:k]
     
     def rank_by_importance(self, skills: List[SkillMatch], 
-                          importance_weights: Optional[Dict[str, float]] = None) -> List[SkillMatch]:
+                          importance_weights: Optional[Dict[str, float]] = None,
+                          top_k: Optional[int] = None) -> List[SkillMatch]:
         """
         Rank skills by importance
         
         Args:
             skills: List of SkillMatch objects
             importance_weights: Optional weights for different factors
+            top_k: Only return the k most important skills
             
         Returns:
             Ranked list of skills
         """
-        if not importance_weights:
-            importance_weights = {
-                'similarity': 0.4,
-                'category': 0.3,
-                'priority': 0.3
-            }
+        similarity = np.fromiter((skill.similarity for skill in skills), dtype=np.float64, count=len(skills))
+        # Anything that is not MISSING / PARTIAL_MATCH scores like a strong match
+        match_codes = np.fromiter((self._category_codes.get(skill.category, STRONG_MATCH) for skill in skills),
+                                  dtype=np.int64, count=len(skills))
+        priority_scores = np.fromiter(
+            (self.PRIORITY_SCORES.get(skill.priority, self.DEFAULT_PRIORITY_SCORE) for skill in skills),
+            dtype=np.float64, count=len(skills)
+        )
+        scores = self.importance_scores(similarity, match_codes, priority_scores, importance_weights)
+        ranked_skills = [skills[i] for i in self.top_k(scores, top_k)]
         
-        def calculate_importance_score(skill: SkillMatch) -> float:
-            # Similarity score
-            sim_score = skill.similarity
-            
-            # Category score (missing skills are more important to address)
-            if skill.category == 'MISSING':
-                cat_score = 1.0
-            elif skill.category == 'PARTIAL_MATCH':
-                cat_score = 0.6
-            else:
-                cat_score = 0.2
-            
-            # Priority score
-            priority_map = {'HIGH': 1.0, 'MEDIUM': 0.6, 'LOW': 0.3}
-            pri_score = priority_map.get(skill.priority, 0.5)
-            
-            # Weighted combination
-            importance = (
-                importance_weights['similarity'] * sim_score +
-                importance_weights['category'] * cat_score +
-                importance_weights['priority'] * pri_score
-            )
+        self.logger.info(f"Ranked {len(skills)} skills by importance")
+        return ranked_skills
+    
+    def top_k_per_candidate(self, similarity: np.ndarray, match_codes: np.ndarray,
+                            offsets: np.ndarray, k: int,
+                            importance_weights: Optional[Dict[str, float]] = None,
+                            categories: Optional[Iterable[int]] = None) -> List[np.ndarray]:
+        """
+        Top-k most important skills of many candidates in one pass
+        
+        Args:
+            similarity: Best-match similarity of every candidate's skills, concatenated
+            match_codes: Match code of every skill, aligned with similarity
+            offsets: Candidate c owns entries offsets[c]:offsets[c + 1]
+            k: Skills kept per candidate
+            importance_weights: Optional weights for different factors
+            categories: Only rank skills with these match codes (e.g. gaps only)
             
-            return importance
+        Returns:
+            Per candidate, indices into its own segment, best first
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        n_candidates = len(offsets) - 1
+        scores = self.importance_scores(similarity, match_codes, importance_weights=importance_weights)
+        candidate_of = np.repeat(np.arange(n_candidates), np.diff(offsets))
+        
+        eligible = np.ones(len(scores), dtype=bool) if categories is None \
+            else np.isin(match_codes, list(categories))
+        positions = np.flatnonzero(eligible)
+        
+        # One sort by (candidate, -score, position), then the first k per candidate
+        order = positions[np.lexsort((positions, -scores[positions], candidate_of[positions]))]
+        owners = candidate_of[order]
+        first = np.searchsorted(owners, np.arange(n_candidates))
+        rank = np.arange(len(order)) - first[owners]
+        keep = order[rank < k]
+        kept_owners = candidate_of[keep]
+        bounds = np.searchsorted(kept_owners, np.arange(1, n_candidates))
+        return np.split((keep - offsets[kept_owners]).tolist(), bounds)
+    
+    def rank_results(self, results: List[GapAnalysisResult], k: int = 5,
+                     categories: Iterable[int] = (PARTIAL_MATCH, MISSING),
+                     importance_weights: Optional[Dict[str, float]] = None) -> List[List[SkillMatch]]:
+        """
+        Most important skill gaps of many analysis results at once
         
-        # Sort by importance (descending)
-        ranked_skills = sorted(skills, key=calculate_importance_score, reverse=True)
+        Works on the results' columnar arrays; SkillMatch objects are only
+        built for the k skills kept per result.
         
-        self.logger.info(f"Ranked {len(skills)} skills by importance")
-        return ranked_skills
+        Args:
+            results: GapAnalysisResult per candidate
+            k: Skills kept per candidate
+            categories: Match codes to rank (default: partial matches and gaps)
+            importance_weights: Optional weights for different factors
+            
+        Returns:
+            Per result, its top-k SkillMatch objects, most important first
+        """
+        if not results:
+            return []
+        lengths = [len(result.jd_skills) for result in results]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        top = self.top_k_per_candidate(
+            np.concatenate([result.best_similarity for result in results]),
+            np.concatenate([result.match_codes for result in results]).astype(np.int64),
+            offsets, k, importance_weights, categories
+        )
+        return [[result.skill_match(j) for j in indices] for result, indices in zip(results, top)]
     
     def categorize_by_urgency(self, missing_skills: List[SkillMatch]) -> Dict[str, List[SkillMatch]]:
         """
@@ -574,14 +1773,20 @@ class GapVisualizer:
     """Create visualizations for gap analysis (enhanced styles + additional charts)"""
     
     @staticmethod
-    def create_similarity_heatmap(similarity_matrix: np.ndarray,
+    def create_similarity_heatmap(similarity_matrix: Union[np.ndarray, 'sparse.csr_matrix'],
                                  resume_skills: List[str],
                                  jd_skills: List[str]) -> go.Figure:
         """Create interactive similarity heatmap with improved colors and hover info"""
         max_display = 25
         display_resume = resume_skills[:max_display]
         display_jd = jd_skills[:max_display]
-        display_matrix = similarity_matrix[:max_display, :max_display]
+        if not isinstance(similarity_matrix, np.ndarray):
+            # Sparse output: entries below the floor were not stored; leave those cells blank
+            block = similarity_matrix[:max_display, :max_display].tocoo()
+            display_matrix = np.full(block.shape, np.nan, dtype=np.float32)
+            display_matrix[block.row, block.col] = block.data
+        else:
+            display_matrix = similarity_matrix[:max_display, :max_display]
 
         # Custom diverging colorscale (red -> white -> blue)
         colorscale = [
@@ -711,7 +1916,6 @@ class GapVisualizer:
     @staticmethod
     def create_similarity_scatter(analysis_result: GapAnalysisResult) -> go.Figure:
         """Scatter showing best-match similarity per JD skill"""
-        sim_mat = analysis_result.similarity_matrix
         jd_skills = analysis_result.jd_skills
         resume_skills = analysis_result.resume_skills
 
@@ -719,10 +1923,10 @@ class GapVisualizer:
         categories = []
         labels = []
         for j, jd in enumerate(jd_skills):
-            best_i = int(sim_mat[:, j].argmax())
-            best_sim = float(sim_mat[best_i, j])
+            best_i = int(analysis_result.best_resume_idx[j])
+            best_sim = float(analysis_result.best_similarity[j])
             pts.append(best_sim * 100)
-            labels.append(f"JD: {jd}<br>Resume: {resume_skills[best_i]}<br>Sim: {best_sim:.2f}")
+            labels.append(f"JD: {jd}<br>Resume: {resume_skills[best_i] if best_i >= 0 else '—'}<br>Sim: {best_sim:.2f}")
             if best_sim >= 0.8:
                 categories.append('Strong')
             elif best_sim >= 0.5:
@@ -792,7 +1996,7 @@ class ReportGenerator:
         # Strong Matches
         if analysis_result.matched_skills:
             report_lines.append("-" * 80)
-            report_lines.append("✓ STRONG MATCHES (Similarity ≥ 80%)")
+            report_lines.append(f"✓ STRONG MATCHES (Similarity ≥ {analysis_result.strong_threshold:.0%})")
             report_lines.append("-" * 80)
             for match in analysis_result.matched_skills:
                 report_lines.append(f"  • {match.jd_skill}")
@@ -803,7 +2007,8 @@ class ReportGenerator:
         # Partial Matches
         if analysis_result.partial_matches:
             report_lines.append("-" * 80)
-            report_lines.append("⚠ PARTIAL MATCHES (Similarity 50-80%)")
+            report_lines.append(f"⚠ PARTIAL MATCHES (Similarity {analysis_result.partial_threshold * 100:.0f}-"
+                                f"{analysis_result.strong_threshold:.0%})")
             report_lines.append("-" * 80)
             for match in analysis_result.partial_matches:
                 report_lines.append(f"  • {match.jd_skill}")
@@ -815,7 +2020,7 @@ class ReportGenerator:
         # Missing Skills
         if analysis_result.missing_skills:
             report_lines.append("-" * 80)
-            report_lines.append("✗ CRITICAL GAPS (Similarity < 50%)")
+            report_lines.append(f"✗ CRITICAL GAPS (Similarity < {analysis_result.partial_threshold:.0%})")
             report_lines.append("-" * 80)
             for match in analysis_result.missing_skills:
                 report_lines.append(f"  • {match.jd_skill} - {match.priority} PRIORITY")
@@ -868,6 +2073,67 @@ class ReportGenerator:
         df = pd.DataFrame(data)
         return df.to_csv(index=False)
     
+    def generate_similarity_csv(self, analysis_result: GapAnalysisResult) -> str:
+        """
+        Generate CSV of the similarity matrix
+        
+        Dense matrices are written as a resume x JD grid. Sparse matrices are
+        written as (resume skill, JD skill, similarity) rows for the stored
+        entries only, and without a matrix only the best match per JD skill
+        is written.
+        """
+        matrix = analysis_result.similarity_matrix
+        resume_skills = analysis_result.resume_skills
+        jd_skills = analysis_result.jd_skills
+        
+        if isinstance(matrix, np.ndarray):
+            return pd.DataFrame(matrix, index=resume_skills, columns=jd_skills).to_csv()
+        
+        if matrix is None:
+            rows = analysis_result.best_resume_idx
+            cols = np.arange(len(jd_skills))
+            values = analysis_result.best_similarity
+        else:
+            coo = matrix.tocoo()
+            rows, cols, values = coo.row, coo.col, coo.data
+        
+        df = pd.DataFrame({
+            'Resume Skill': np.asarray(resume_skills, dtype=object)[rows],
+            'JD Skill': np.asarray(jd_skills, dtype=object)[cols],
+            'Similarity': np.round(values.astype(np.float64), 4)
+        })
+        return df.to_csv(index=False)
+    
+    def generate_leaderboard_csv(self, entries: List[LeaderboardEntry]) -> str:
+        """Generate CSV of a candidate leaderboard (rank order preserved)"""
+        
+        data = []
+        for rank, entry in enumerate(entries, 1):
+            stats = entry.get_statistics()
+            data.append({
+                'Rank': rank,
+                'Candidate': entry.candidate_id,
+                'Overall Score (%)': f"{stats['overall_score']:.2f}",
+                'Matched': stats['matched_count'],
+                'Partial': stats['partial_count'],
+                'Missing': stats['missing_count'],
+                'Match (%)': f"{stats['match_percentage']:.1f}",
+                'Top Missing Skills': '; '.join(entry.top_missing)
+            })
+        
+        df = pd.DataFrame(data)
+        return df.to_csv(index=False)
+    
+    def generate_leaderboard_json(self, entries: List[LeaderboardEntry]) -> str:
+        """Generate JSON of a candidate leaderboard"""
+        
+        report_data = {
+            'timestamp': self.timestamp.isoformat(),
+            'candidates': [dict(rank=rank, **entry.to_dict()) for rank, entry in enumerate(entries, 1)]
+        }
+        
+        return json.dumps(report_data, indent=2)
+    
     def generate_json_report(self, analysis_result: GapAnalysisResult) -> str:
         """Generate JSON report"""
         
@@ -895,55 +2161,7 @@ class LearningPathGenerator:
     
     def _initialize_resources(self) -> Dict:
         """Initialize learning resources database"""
-        return {
-            'Python': {
-                'difficulty': 'Medium',
-                'time_estimate': '4-8 weeks',
-                'resources': [
-                    'Python for Everybody (Coursera)',
-                    'Automate the Boring Stuff with Python',
-                    'Official Python Tutorial'
-                ]
-            },
-            'Machine Learning': {
-                'difficulty': 'Hard',
-                'time_estimate': '12-16 weeks',
-                'prerequisites': ['Python', 'Statistics'],
-                'resources': [
-                    'Andrew Ng Machine Learning Course',
-                    'Hands-on Machine Learning with Scikit-Learn',
-                    'Fast.ai Practical Deep Learning'
-                ]
-            },
-            'TensorFlow': {
-                'difficulty': 'Medium',
-                'time_estimate': '6-8 weeks',
-                'prerequisites': ['Python', 'Machine Learning'],
-                'resources': [
-                    'TensorFlow Developer Certificate',
-                    'Deep Learning Specialization',
-                    'TensorFlow Official Tutorials'
-                ]
-            },
-            'AWS': {
-                'difficulty': 'Medium',
-                'time_estimate': '8-12 weeks',
-                'resources': [
-                    'AWS Cloud Practitioner Certification',
-                    'AWS Solutions Architect Associate',
-                    'AWS Free Tier Hands-on Labs'
-                ]
-            },
-            'Docker': {
-                'difficulty': 'Medium',
-                'time_estimate': '2-4 weeks',
-                'resources': [
-                    'Docker Official Documentation',
-                    'Docker Mastery Course',
-                    'Docker for Developers'
-                ]
-            }
-        }
+        return copy.deepcopy(LEARNING_RESOURCES)
     
     def generate_path(self, missing_skills: List[SkillMatch],
                      current_skills: List[str]) -> List[Dict]:
@@ -996,13 +2214,19 @@ class LearningPathGenerator:
 class CompleteSkillGapApp:
     """Complete Project Streamlit Application"""
     
+    MODEL_NAME = 'all-MiniLM-L6-v2'
+    
     def __init__(self):
-        # Initialize components
-        self.encoder = SentenceBERTEncoder()
-        self.calculator = SimilarityCalculator()
-        self.visualizer = GapVisualizer()
+        # Initialize components; models and stateless helpers are loaded once per
+        # process and shared by every session and rerun. The encoder is loaded
+        # in the background once the page has rendered (see run / encoder)
+        self.encoder_key = f'encoder:{self.MODEL_NAME}:{DEFAULT_ENCODER_BACKEND}'
+        self.calculator = registry.get('similarity_calculator', SimilarityCalculator)
+        self.visualizer = registry.get('gap_visualizer', GapVisualizer)
+        self.learning_path_gen = registry.get('learning_path_generator', LearningPathGenerator)
+        self.result_cache = registry.get('result_cache', lambda: ResultCache(
+            ttl_seconds=DEFAULT_RESULT_CACHE_TTL, disk_path=DEFAULT_RESULT_CACHE_DIR))
         self.report_generator = ReportGenerator()
-        self.learning_path_gen = LearningPathGenerator()
         
         # Initialize session state
         if 'analysis_result' not in st.session_state:
@@ -1011,6 +2235,27 @@ class CompleteSkillGapApp:
             st.session_state.resume_skills = []
         if 'jd_skills' not in st.session_state:
             st.session_state.jd_skills = []
+        if 'strong_threshold' not in st.session_state:
+            st.session_state.strong_threshold = 0.80
+        if 'partial_threshold' not in st.session_state:
+            st.session_state.partial_threshold = 0.50
+        if 'sparse_similarity' not in st.session_state:
+            st.session_state.sparse_similarity = False
+        if 'matching_mode' not in st.session_state:
+            st.session_state.matching_mode = 'best'
+        if 'lexical_stats' not in st.session_state:
+            st.session_state.lexical_stats = defaultdict(int)
+    
+    @property
+    def encoder(self) -> SentenceBERTEncoder:
+        """Shared encoder; waits for the background load if it is still running"""
+        return registry.get(self.encoder_key, self._load_encoder)
+    
+    def _load_encoder(self) -> SentenceBERTEncoder:
+        encoder = SentenceBERTEncoder(self.MODEL_NAME)
+        # Known vocabulary starts warm; only user-typed skills reach the model
+        warm_encoder(encoder, DEFAULT_TAXONOMY_ARTIFACT)
+        return encoder
     
     def run(self):
         """Run the complete application"""
@@ -1018,6 +2263,8 @@ class CompleteSkillGapApp:
         st.title("🎯Intelligent AI Skill Extraction Dashboard 🎯 ")
         st.markdown("### Contextual skill discovery and prioritised growth recommendations using semantic embeddings")
         
+        self._apply_threshold_changes()
+        
         # Main tabs
         tabs = st.tabs([
             "🔎 Skills Discovery",
@@ -1045,6 +2292,30 @@ class CompleteSkillGapApp:
         
         with tabs[5]:
             self._settings_tab()
+        
+        # Everything above rendered without the model; load it while the user types
+        registry.preload(self.encoder_key, self._load_encoder)
+    
+    def _apply_threshold_changes(self):
+        """Re-bucket the stored result if the Preferences thresholds changed"""
+        result = st.session_state.analysis_result
+        if result is None:
+            return
+        
+        strong_threshold = st.session_state.strong_threshold
+        partial_threshold = st.session_state.partial_threshold
+        if (result.strong_threshold, result.partial_threshold) == (strong_threshold, partial_threshold):
+            return
+        
+        # Thresholds only re-bucket the stored best matches: no encoder needed,
+        # so a slider change never waits for the model to load
+        analyzer = SkillGapAnalyzer(
+            None,
+            self.calculator,
+            strong_threshold=strong_threshold,
+            partial_threshold=partial_threshold
+        )
+        st.session_state.analysis_result = analyzer.reclassify(result)
     
     def _gap_analysis_tab(self):
         """Main gap analysis interface"""
@@ -1083,7 +2354,7 @@ class CompleteSkillGapApp:
                 )
                 if resume_text:
                     resume_skills = [s.strip() for s in resume_text.split('\n') if s.strip()]
-                    st.info(f"**{len(resume_skills)} skills entered**")
+                    st.info(self._skill_count_message(resume_skills))
             
             with col2:
                 st.subheader("💼 Job Description Skills")
@@ -1095,7 +2366,7 @@ class CompleteSkillGapApp:
                 )
                 if jd_text:
                     jd_skills = [s.strip() for s in jd_text.split('\n') if s.strip()]
-                    st.info(f"**{len(jd_skills)} skills entered**")
+                    st.info(self._skill_count_message(jd_skills))
         
         elif input_method == "Upload file":
             st.info("Upload JSON file ")
@@ -1124,15 +2395,8 @@ class CompleteSkillGapApp:
         
         else:  # Sample Data
             st.info("Using sample data for demonstration")
-            resume_skills = [
-                "Python", "Machine Learning", "SQL", "Data Analysis",
-                "Pandas", "NumPy", "Scikit-learn", "Git", "Statistics"
-            ]
-            jd_skills = [
-                "Python", "Deep Learning", "TensorFlow", "SQL",
-                "AWS", "Docker", "Kubernetes", "Data Science",
-                "Neural Networks", "Cloud Computing"
-            ]
+            resume_skills = list(SAMPLE_RESUME_SKILLS)
+            jd_skills = list(SAMPLE_JD_SKILLS)
             
             col1, col2 = st.columns(2)
             with col1:
@@ -1160,6 +2424,13 @@ class CompleteSkillGapApp:
             st.markdown("---")
             self._display_analysis_results(st.session_state.analysis_result)
     
+    def _skill_count_message(self, skills: List[str]) -> str:
+        """Entered-skills summary, noting duplicates/aliases that will be merged"""
+        distinct, _ = default_normalizer.canonicalize(skills)
+        if len(distinct) == len(skills):
+            return f"**{len(skills)} skills entered**"
+        return f"**{len(skills)} skills entered** ({len(distinct)} distinct after merging duplicates and aliases)"
+    
     def _perform_analysis(self, resume_skills: List[str], jd_skills: List[str]):
         """Perform the gap analysis"""
         
@@ -1169,7 +2440,10 @@ class CompleteSkillGapApp:
             
             try:
                 # Step 1: Initialize analyzer
-                status_text.text("Initializing analyzer...")
+                if registry.is_loaded(self.encoder_key):
+                    status_text.text("Initializing analyzer...")
+                else:
+                    status_text.text("Loading the embedding model (first analysis only)...")
                 progress_bar.progress(20)
                 
                 strong_threshold = st.session_state.get('strong_threshold', 0.80)
@@ -1179,20 +2453,28 @@ class CompleteSkillGapApp:
                     self.encoder,
                     self.calculator,
                     strong_threshold=strong_threshold,
-                    partial_threshold=partial_threshold
+                    partial_threshold=partial_threshold,
+                    sparse_floor=partial_threshold if st.session_state.sparse_similarity else None,
+                    result_cache=self.result_cache,
+                    matching_mode=st.session_state.matching_mode
                 )
                 
                 # Step 2: Run analysis
                 status_text.text("Running gap analysis...")
                 progress_bar.progress(40)
                 
-                result = analyzer.analyze(resume_skills, jd_skills)
+                # Edits to a previous analysis only encode/compute what changed
+                result = analyzer.analyze_incremental(
+                    resume_skills, jd_skills, previous=st.session_state.analysis_result
+                )
                 
                 # Step 3: Store results
                 progress_bar.progress(80)
                 status_text.text("Storing results...")
                 
                 st.session_state.analysis_result = result
+                for name, value in analyzer.lexical_stats.items():
+                    st.session_state.lexical_stats[name] += value
                 st.session_state.resume_skills = resume_skills
                 st.session_state.jd_skills = jd_skills
                 
@@ -1348,6 +2630,22 @@ class CompleteSkillGapApp:
         - **Red**: Low similarity (skill gap)
         """)
         
+        if result.similarity_matrix is None:
+            st.warning(f"The full {len(result.resume_skills)} x {len(result.jd_skills)} matrix was too large "
+                      f"to keep in memory; only the best match for each JD skill was computed.")
+            st.dataframe(pd.DataFrame({
+                'JD Skill': result.jd_skills,
+                'Best Resume Skill': [result.resume_skills[i] for i in result.best_resume_idx],
+                'Similarity': [f"{s*100:.1f}%" for s in result.best_similarity]
+            }), use_container_width=True)
+            st.download_button(
+                "📥 Download Best Matches (CSV)",
+                self.report_generator.generate_similarity_csv(result),
+                f"best_matches_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                "text/csv"
+            )
+            return
+        
         # Heatmap
         fig_heatmap = self.visualizer.create_similarity_heatmap(
             result.similarity_matrix,
@@ -1358,20 +2656,36 @@ class CompleteSkillGapApp:
         
         # Detailed matrix view
         with st.expander("📋 View Detailed Similarity Matrix"):
-            # Create DataFrame
-            df_matrix = pd.DataFrame(
-                result.similarity_matrix,
-                index=result.resume_skills,
-                columns=result.jd_skills
-            )
-            
-            # Format as percentages
-            df_display = df_matrix.applymap(lambda x: f"{x*100:.1f}%")
+            if not isinstance(result.similarity_matrix, np.ndarray):
+                # Sparse output: only entries above the floor were kept: list them instead of a grid
+                coo = result.similarity_matrix.tocoo()
+                st.caption(f"Sparse matrix: {coo.nnz} of {coo.shape[0] * coo.shape[1]} pairs stored")
+                df_display = pd.DataFrame({
+                    'Resume Skill': [result.resume_skills[i] for i in coo.row],
+                    'JD Skill': [result.jd_skills[j] for j in coo.col],
+                    'Similarity': [f"{x*100:.1f}%" for x in coo.data]
+                })
+            else:
+                # Create DataFrame
+                df_matrix = pd.DataFrame(
+                    result.similarity_matrix,
+                    index=result.resume_skills,
+                    columns=result.jd_skills
+                )
+                
+                # Format as percentages (exact-match columns are only computed at their match)
+                df_display = df_matrix.applymap(lambda x: f"{x*100:.1f}%")
+                if result.lexical_mask is not None:
+                    not_computed = np.zeros(result.similarity_matrix.shape, dtype=bool)
+                    not_computed[:, result.lexical_mask] = True
+                    not_computed[result.best_resume_idx[result.lexical_mask],
+                                 np.flatnonzero(result.lexical_mask)] = False
+                    df_display = df_display.mask(not_computed, "—")
             
             st.dataframe(df_display, use_container_width=True)
             
             # Download matrix
-            csv_matrix = df_matrix.to_csv()
+            csv_matrix = self.report_generator.generate_similarity_csv(result)
             st.download_button(
                 "📥 Download Similarity Matrix (CSV)",
                 csv_matrix,
@@ -1579,26 +2893,26 @@ class CompleteSkillGapApp:
         col1, col2 = st.columns(2)
         
         with col1:
+            # Keyed sliders write session state before the next rerun starts,
+            # so run() can re-bucket the stored result before any tab renders
             strong_threshold = st.slider(
                 "Strong Match Threshold",
                 min_value=0.0,
                 max_value=1.0,
-                value=st.session_state.get('strong_threshold', 0.80),
                 step=0.05,
+                key='strong_threshold',
                 help="Minimum similarity for a skill to be considered a strong match"
             )
-            st.session_state.strong_threshold = strong_threshold
         
         with col2:
             partial_threshold = st.slider(
                 "Partial Match Threshold",
                 min_value=0.0,
                 max_value=1.0,
-                value=st.session_state.get('partial_threshold', 0.50),
                 step=0.05,
+                key='partial_threshold',
                 help="Minimum similarity for a skill to be considered a partial match"
             )
-            st.session_state.partial_threshold = partial_threshold
         
         st.info(f"""
         **Current Configuration:**
@@ -1607,20 +2921,68 @@ class CompleteSkillGapApp:
         - Missing/Gap: Similarity < {partial_threshold:.0%}
         """)
         
+        st.radio(
+            "Matching Mode",
+            SkillGapAnalyzer.MATCHING_MODES,
+            key='matching_mode',
+            format_func={
+                'best': "Best match per JD skill",
+                'optimal': "One-to-one (optimal assignment)",
+                'greedy': "One-to-one (greedy, faster)"
+            }.get,
+            horizontal=True,
+            help="One-to-one modes use each resume skill for at most one JD skill, so a single "
+                 "broad skill cannot cover many requirements. Applies to the next analysis."
+        )
+        
+        lexical_stats = st.session_state.lexical_stats
+        if lexical_stats['analyses']:
+            st.caption(f"Lexical fast path: {lexical_stats['lexical_matches']} exact/alias matches resolved "
+                       f"without SBERT in {lexical_stats['analyses']} analyses, saving "
+                       f"{lexical_stats['encodes_saved']} encoder lookups and "
+                       f"{lexical_stats['cells_saved']:,} similarity computations")
+        
+        st.checkbox(
+            "Store only similarities above the partial threshold (sparse matrix)",
+            key='sparse_similarity',
+            help="Keeps memory and the similarity CSV small for large analyses; "
+                 "classification is unaffected. Applies to the next analysis."
+        )
+        
         # Model settings
         st.markdown("---")
         st.subheader("🤖 Model Configuration")
         
-        st.info(f"""
-        **Current Model:** {self.encoder.model_name}
-        **Embedding Dimension:** {self.encoder.embedding_dimension}
-        **Cache Size:** {len(self.encoder.embedding_cache)} embeddings
+        if registry.is_loaded(self.encoder_key):
+            self._encoder_statistics()
+        else:
+            st.info(f"""
+        **Current Model:** {self.MODEL_NAME} (loading in the background...)
+        **Inference Backend:** {DEFAULT_ENCODER_BACKEND}
         """)
         
+        result_stats = self.result_cache.get_statistics()
+        st.caption(f"Result cache: {result_stats['entries']} analyses stored, "
+                   f"{result_stats['hits']} served from cache ({result_stats['hit_rate']:.1f}% hit rate)"
+                   f"{', persisted to disk' if result_stats['persistent'] else ''}")
+        
         if st.button("🗑️ Clear Embedding Cache"):
-            self.encoder.clear_cache()
+            if registry.is_loaded(self.encoder_key):
+                self.encoder.clear_cache()
+            self.result_cache.clear()
             st.success("Cache cleared!")
         
+        with st.expander("📦 Loaded Resources"):
+            resource_stats = registry.get_statistics()
+            if resource_stats:
+                df_resources = pd.DataFrame([{
+                    'Resource': r['name'],
+                    'Type': r['type'],
+                    'Load Time (s)': f"{r['load_seconds']:.2f}",
+                    'Memory (MB)': f"{r['memory_bytes'] / 1024 / 1024:.1f}"
+                } for r in resource_stats])
+                st.dataframe(df_resources, use_container_width=True)
+        
         # About
         st.markdown("---")
         st.subheader("ℹ️ About Milestone 3")
@@ -1650,6 +3012,36 @@ class CompleteSkillGapApp:
         - Performance: Fast inference, good accuracy
         - Use Case: Semantic text similarity
         """)
+    
+    def _encoder_statistics(self):
+        """Model info, embedding cache and batching counters of the loaded encoder"""
+        st.info(f"""
+        **Current Model:** {self.encoder.model_name}
+        **Inference Backend:** {self.encoder.backend}
+        **Embedding Dimension:** {self.encoder.embedding_dimension}
+        """)
+        
+        cache_stats = self.encoder.get_cache_statistics()
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Cached Embeddings", cache_stats['entries'])
+        with col2:
+            st.metric("Hits", cache_stats['hits'], f"{cache_stats['hit_rate']:.1f}% hit rate", delta_color="off")
+        with col3:
+            st.metric("Misses", cache_stats['misses'])
+        with col4:
+            st.metric("Evictions", cache_stats['evictions'])
+        with col5:
+            st.metric("Resident Memory", f"{cache_stats['resident_bytes'] / 1024 / 1024:.2f} MB",
+                      f"of {cache_stats['max_bytes'] / 1024 / 1024:.0f} MB", delta_color="off")
+        
+        sequence_stats = self.encoder.get_sequence_statistics()
+        if sequence_stats['skills']:
+            st.caption(f"Encoder: {sequence_stats['skills']:,} skills in {sequence_stats['batches']} batches, "
+                       f"mean padded length {sequence_stats['mean_padded_length']:.1f} of "
+                       f"{sequence_stats['max_seq_length']} tokens, "
+                       f"{sequence_stats['padding_ratio']:.0%} padding, "
+                       f"{sequence_stats['skills_per_second']:.0f} skills/s")
 
 
 def main():
@@ -0,0 +1,86 @@
+"""
+Benchmark one-to-one matching modes against best-match-per-JD-skill
+
+For each size, times the three ways SkillGapAnalyzer can turn a similarity
+matrix into per-JD-skill matches: column argmax ('best'), the optimal
+rectangular linear sum assignment and the greedy approximation. Reports the
+greedy total as a fraction of the optimum and checks the optimal solver
+against --budget-ms (the exit status is non-zero if it is exceeded at
+--budget-size).
+
+Matrices are cosine similarities of random clustered unit vectors, which
+gives the solver the near-ties real skill embeddings produce.
+
+Usage:
+    python benchmarks/bench_assignment.py [--sizes 50 200 500] [--budget-ms 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SimilarityCalculator, l2_normalize  # noqa: E402
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def clustered_similarity(n_resume: int, n_jd: int, dimension: int = 384, n_clusters: int = 20, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((n_clusters, dimension))
+    resume = l2_normalize(centres[rng.integers(n_clusters, size=n_resume)]
+                          + 0.8 * rng.standard_normal((n_resume, dimension)))
+    jd = l2_normalize(centres[rng.integers(n_clusters, size=n_jd)]
+                      + 0.8 * rng.standard_normal((n_jd, dimension)))
+    return resume @ jd.T
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 500])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    parser.add_argument('--budget-size', type=int, default=200)
+    args = parser.parse_args()
+
+    calculator = SimilarityCalculator()
+    calculator.logger.disabled = True
+
+    print(f"{'shape':>9} {'best (ms)':>10} {'optimal (ms)':>13} {'greedy (ms)':>12} "
+          f"{'greedy/optimal':>15} {'best/optimal':>13}")
+    within_budget = True
+    for n in args.sizes:
+        similarity = clustered_similarity(n, n)
+
+        best_seconds = best_of(lambda: similarity.argmax(axis=0), args.repeat)
+        optimal_seconds = best_of(lambda: calculator.assign_one_to_one(similarity, 'optimal'), args.repeat)
+        greedy_seconds = best_of(lambda: calculator.assign_one_to_one(similarity, 'greedy'), args.repeat)
+
+        optimal_total = calculator.assign_one_to_one(similarity, 'optimal')[1].sum()
+        greedy_total = calculator.assign_one_to_one(similarity, 'greedy')[1].sum()
+        best_total = similarity.max(axis=0).sum()
+
+        print(f"{f'{n}x{n}':>9} {best_seconds * 1000:>10.2f} {optimal_seconds * 1000:>13.2f} "
+              f"{greedy_seconds * 1000:>12.2f} {greedy_total / optimal_total:>15.4f} "
+              f"{best_total / optimal_total:>13.4f}")
+        if n == args.budget_size and optimal_seconds * 1000 > args.budget_ms:
+            within_budget = False
+
+    if args.budget_size in args.sizes:
+        print(f"optimal assignment at {args.budget_size}x{args.budget_size}: "
+              f"{'within' if within_budget else 'OVER'} the {args.budget_ms:.0f} ms budget")
+    sys.exit(0 if within_budget else 1)
+
+
+if __name__ == '__main__':
+    main()
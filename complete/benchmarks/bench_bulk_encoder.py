@@ -0,0 +1,75 @@
+"""
+Benchmark BulkEncoder scaling across worker processes
+
+Encodes a synthetic corpus of distinct skill strings once in-process with the
+model's default threading (what encode_skills does) and then with BulkEncoder
+at each worker count, reporting throughput and the scaling efficiency
+relative to one pinned worker. Pool start-up (one model load per worker) is
+included in the timings, as it is in a real backfill.
+
+Needs the real model (sentence-transformers).
+
+Usage:
+    python benchmarks/bench_bulk_encoder.py [--skills 20000] [--workers 1 2 4 8] [--threads-per-worker 1]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_encoder import BulkEncoder  # noqa: E402
+from encoder_backends import load_model  # noqa: E402
+
+PHRASES = ['{}', 'experience with {}', 'advanced {}', '{} development', 'applied {} in production']
+WORDS = ['python', 'data', 'cloud', 'model', 'pipeline', 'analysis', 'security', 'network',
+         'testing', 'design', 'deployment', 'statistics', 'vision', 'language', 'systems']
+
+
+def corpus(n_skills: int):
+    """Distinct skill-like strings (nothing is deduplicated away)"""
+    skills = []
+    for i in range(n_skills):
+        words = ' '.join(WORDS[(i // len(WORDS) ** k) % len(WORDS)] for k in range(1 + i % 3))
+        skills.append(f"{PHRASES[i % len(PHRASES)].format(words)} {i}")
+    return skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--skills', type=int, default=20000)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=[w for w in (1, 2, 4, 8) if w <= (os.cpu_count() or 1)])
+    parser.add_argument('--threads-per-worker', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    skills = corpus(args.skills)
+
+    model = load_model(args.model)
+    start = time.perf_counter()
+    model.encode(skills, batch_size=64, normalize_embeddings=True, show_progress_bar=False)
+    in_process = args.skills / (time.perf_counter() - start)
+    del model
+
+    print(f"{args.skills} skills, {os.cpu_count()} cores")
+    print(f"{'mode':>18} {'skills/s':>9} {'vs in-process':>14} {'efficiency':>11}")
+    print(f"{'in-process':>18} {in_process:>9.0f} {1:>13.2f}x {'':>11}")
+
+    single = None
+    for workers in args.workers:
+        encoder = BulkEncoder(args.model, workers=workers, threads_per_worker=args.threads_per_worker,
+                              chunk_size=args.chunk_size)
+        encoder.logger.disabled = True
+        start = time.perf_counter()
+        encoder.encode(skills)
+        throughput = args.skills / (time.perf_counter() - start)
+        single = single or throughput
+        print(f"{f'{workers} x {args.threads_per_worker} thread(s)':>18} {throughput:>9.0f} "
+              f"{throughput / in_process:>13.2f}x {throughput / (single * workers):>11.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark length-bucketed dynamic batching in SentenceBERTEncoder._run_model
+
+Extracted skills range from one-letter names ("R", "C") to long noun phrases,
+so fixed-count batches pad most rows to the batch's longest phrase. This
+script builds skill lists with that mix and compares:
+
+  fixed/32     model.encode(skills, batch_size=32), the previous call
+               (sentence-transformers sorts by character length internally)
+  buckets      _run_model: sorted by token length, batches under
+               SentenceBERTEncoder.MAX_BATCH_TOKENS padded tokens
+
+reporting the padded tokens each schedule feeds the model and the wall time.
+Needs the real model (its tokenizer defines the lengths).
+
+Usage:
+    python benchmarks/bench_dynamic_batching.py [--skills 2000] [--long-share 0.15] [--token-budgets 2048 4096 8192]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault('SKILLGAP_EMBEDDING_STORE', '')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SentenceBERTEncoder  # noqa: E402
+
+SHORT = ['R', 'C', 'Go', 'Git', 'SQL', 'AWS', 'Java', 'Excel', 'Linux', 'Docker', 'Scala', 'Rust']
+MEDIUM = ['Machine Learning', 'Data Analysis', 'Deep Learning', 'Natural Language Processing',
+          'Computer Vision', 'Cloud Computing', 'Project Management', 'Statistical Modeling']
+LONG = ['experience designing distributed data pipelines on cloud platforms',
+        'building and deploying machine learning models to production at scale',
+        'strong written and verbal communication with cross-functional stakeholders',
+        'hands-on knowledge of container orchestration and infrastructure as code',
+        'developing RESTful microservices with automated testing and continuous delivery']
+
+
+def extracted_skills(n_skills: int, long_share: float, seed: int = 0):
+    """Skill list shaped like extractor output: mostly short names, some long phrases"""
+    rng = np.random.default_rng(seed)
+    skills = []
+    for i in range(n_skills):
+        kind = rng.random()
+        if kind < long_share:
+            skills.append(f"{LONG[rng.integers(len(LONG))]} ({i})")
+        elif kind < long_share + 0.35:
+            skills.append(f"{MEDIUM[rng.integers(len(MEDIUM))]} {i}")
+        else:
+            skills.append(f"{SHORT[rng.integers(len(SHORT))]}{i}")
+    return skills
+
+
+def padded_tokens(lengths: np.ndarray, batches) -> int:
+    return int(sum(len(batch) * lengths[batch].max() for batch in batches))
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=2000)
+    parser.add_argument('--long-share', type=float, default=0.15)
+    parser.add_argument('--token-budgets', type=int, nargs='+', default=[2048, 4096, 8192])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    encoder = SentenceBERTEncoder(store_path='')
+    encoder.logger.disabled = True
+    skills = extracted_skills(args.skills, args.long_share)
+    lengths = encoder._token_lengths(skills)
+    print(f"{len(skills)} skills, token length p50 {np.median(lengths):.0f} / p95 "
+          f"{np.percentile(lengths, 95):.0f} / max {lengths.max()}, {lengths.sum()} real tokens")
+
+    # Fixed batches of 32 as sentence-transformers forms them (sorted by characters)
+    by_chars = np.argsort([-len(s) for s in skills], kind='stable')
+    fixed_batches = [by_chars[i:i + 32] for i in range(0, len(skills), 32)]
+    fixed_tokens = padded_tokens(lengths, fixed_batches)
+    fixed_seconds = best_of(lambda: encoder.model.encode(skills, batch_size=32, normalize_embeddings=True),
+                            args.repeat)
+
+    print(f"{'schedule':>14} {'batches':>8} {'padded tokens':>14} {'padding':>8} {'seconds':>8} {'speedup':>8}")
+    print(f"{'fixed/32':>14} {len(fixed_batches):>8} {fixed_tokens:>14} "
+          f"{1 - lengths.sum() / fixed_tokens:>8.1%} {fixed_seconds:>8.2f} {1:>7.2f}x")
+
+    order = np.argsort(lengths, kind='stable')
+    for budget in args.token_budgets:
+        encoder.MAX_BATCH_TOKENS = budget
+        buckets = [order[start:stop] for start, stop in encoder._length_buckets(lengths[order])]
+        tokens = padded_tokens(lengths, buckets)
+        seconds = best_of(lambda: encoder._run_model(skills), args.repeat)
+        print(f"{f'buckets/{budget}':>14} {len(buckets):>8} {tokens:>14} {1 - lengths.sum() / tokens:>8.1%} "
+              f"{seconds:>8.2f} {fixed_seconds / seconds:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
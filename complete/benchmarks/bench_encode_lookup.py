@@ -0,0 +1,147 @@
+"""
+Benchmark SentenceBERTEncoder.encode_skills cache lookup on large inputs
+
+Measures the batched lookup engine (dedup + preallocated float32 scatter)
+against the previous list-based implementation for 10k-100k skill inputs
+at several cache hit rates. By default the model is replaced by a cheap
+random projection so the numbers isolate lookup/assembly overhead; pass
+--real-model to include SBERT inference for the misses.
+
+Usage:
+    python benchmarks/bench_encode_lookup.py [--sizes 10000 50000 100000] [--real-model]
+"""
+import argparse
+import os
+import sys
+import time
+from unittest import mock
+
+import numpy as np
+
+os.environ.setdefault('SKILLGAP_EMBEDDING_STORE', '')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from app import SentenceBERTEncoder  # noqa: E402
+
+# Embedding dimension of all-MiniLM-L6-v2
+FAKE_DIMENSION = 384
+
+
+class RandomProjectionModel:
+    """Stand-in for SentenceTransformer.encode with near-zero inference cost"""
+
+    def __init__(self, dimension: int = FAKE_DIMENSION):
+        self.dimension = dimension
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, skills, show_progress_bar=False, batch_size=32, **kwargs):
+        rng = np.random.default_rng(len(skills))
+        return rng.standard_normal((len(skills), self.dimension)).astype(np.float32)
+
+
+def make_encoder(real_model: bool, **kwargs) -> SentenceBERTEncoder:
+    """
+    SentenceBERTEncoder with the real model, or with a RandomProjectionModel
+    that is patched in before the encoder loads anything (no model download)
+
+    Fake embeddings are never written to the persistent store.
+    """
+    if real_model:
+        return SentenceBERTEncoder(**kwargs)
+    with mock.patch.object(app, 'load_model', lambda model_name, backend='torch': RandomProjectionModel()):
+        return SentenceBERTEncoder(store_path='', **kwargs)
+
+
+def legacy_encode(encoder: SentenceBERTEncoder, skills):
+    """Previous encode_skills cache path, kept here for comparison"""
+    cached_embeddings = []
+    uncached_skills = []
+    uncached_indices = []
+    for i, skill in enumerate(skills):
+        embedding = encoder.embedding_cache.get(skill)
+        if embedding is not None:
+            cached_embeddings.append(embedding)
+        else:
+            uncached_skills.append(skill)
+            uncached_indices.append(i)
+    if not uncached_skills:
+        return np.array(cached_embeddings)
+    new_embeddings = encoder.model.encode(uncached_skills, batch_size=32)
+    for skill, embedding in zip(uncached_skills, new_embeddings):
+        encoder.embedding_cache.put(skill, embedding)
+    all_embeddings = [None] * len(skills)
+    cached_idx = 0
+    uncached_idx = 0
+    for i in range(len(skills)):
+        if i in uncached_indices:
+            all_embeddings[i] = new_embeddings[uncached_idx]
+            uncached_idx += 1
+        else:
+            all_embeddings[i] = cached_embeddings[cached_idx]
+            cached_idx += 1
+    return np.array(all_embeddings)
+
+
+def make_workload(n_skills: int, hit_rate: float, duplicate_rate: float, seed: int = 0):
+    """Skill list of n_skills entries where hit_rate of the distinct skills are pre-cached"""
+    rng = np.random.default_rng(seed)
+    n_distinct = max(1, int(n_skills * (1 - duplicate_rate)))
+    vocabulary = [f"skill {i} {rng.integers(1_000_000)}" for i in range(n_distinct)]
+    picks = np.concatenate([np.arange(n_distinct),
+                            rng.integers(0, n_distinct, n_skills - n_distinct)])
+    rng.shuffle(picks)
+    skills = [vocabulary[i] for i in picks]
+    warm = vocabulary[:int(n_distinct * hit_rate)]
+    return skills, warm
+
+
+def run(encoder: SentenceBERTEncoder, sizes, hit_rates, duplicate_rate: float, legacy_limit: int):
+    print(f"{'skills':>8} {'hit rate':>9} {'new (s)':>9} {'legacy (s)':>11} {'speedup':>8}")
+    for n_skills in sizes:
+        for hit_rate in hit_rates:
+            skills, warm = make_workload(n_skills, hit_rate, duplicate_rate)
+
+            encoder.clear_cache()
+            if warm:
+                encoder.encode_skills(warm)
+            start = time.perf_counter()
+            encoder.encode_skills(skills)
+            new_seconds = time.perf_counter() - start
+
+            legacy_text = 'skipped'
+            speedup_text = '-'
+            if n_skills <= legacy_limit:
+                encoder.clear_cache()
+                if warm:
+                    encoder.encode_skills(warm)
+                start = time.perf_counter()
+                legacy_encode(encoder, skills)
+                legacy_seconds = time.perf_counter() - start
+                legacy_text = f"{legacy_seconds:.3f}"
+                speedup_text = f"{legacy_seconds / new_seconds:.1f}x"
+
+            print(f"{n_skills:>8} {hit_rate:>9.0%} {new_seconds:>9.3f} {legacy_text:>11} {speedup_text:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 50_000, 100_000])
+    parser.add_argument('--hit-rates', type=float, nargs='+', default=[0.0, 0.5, 0.9, 1.0])
+    parser.add_argument('--duplicate-rate', type=float, default=0.2,
+                        help='Fraction of input entries that repeat an earlier skill')
+    parser.add_argument('--legacy-limit', type=int, default=20_000,
+                        help='Largest input to run the quadratic legacy path on')
+    parser.add_argument('--real-model', action='store_true',
+                        help='Encode misses with SBERT instead of a random projection')
+    args = parser.parse_args()
+
+    encoder = make_encoder(args.real_model, cache_max_bytes=1024 * 1024 * 1024)
+
+    run(encoder, args.sizes, args.hit_rates, args.duplicate_rate, args.legacy_limit)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark encoder inference backends on CPU: accuracy, throughput and latency
+
+Loads the model with each backend from encoder_backends (fp32 torch, ONNX,
+int8 dynamically quantised torch), checks the cosine agreement of every
+non-reference backend with the fp32 embeddings, then reports per batch size
+the median latency of one batch and the throughput over all probe skills.
+Exits non-zero if a backend's mean cosine agreement is below
+encoder_backends.MIN_COSINE_AGREEMENT.
+
+Needs the real model (sentence-transformers; onnx also needs optimum[onnxruntime]).
+
+Usage:
+    python benchmarks/bench_encoder_backends.py [--backends torch onnx quantized] [--batch-sizes 1 8 32 128]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from encoder_backends import BACKENDS, MIN_COSINE_AGREEMENT, cosine_agreement, load_model  # noqa: E402
+from skill_normalizer import SKILL_ALIASES  # noqa: E402
+
+BASE_SKILLS = sorted(set(SKILL_ALIASES) | set(SKILL_ALIASES.values()) | {
+    'Python', 'SQL', 'Pandas', 'NumPy', 'TensorFlow', 'PyTorch', 'Docker', 'Git', 'Linux',
+    'Statistics', 'Data Analysis', 'Neural Networks', 'Cloud Computing', 'Tableau', 'Excel',
+    'Java', 'C++', 'React', 'REST APIs', 'Spark', 'Hadoop', 'MongoDB', 'CI/CD', 'Agile'
+})
+CONTEXTS = ['{}', 'experience with {}', 'advanced {}', '{} development', 'applied {} in production']
+
+
+def probe_skills(n_texts: int):
+    """Skill-like probe texts: base skills in several phrasings, repeated to n_texts"""
+    texts = [context.format(skill) for context in CONTEXTS for skill in BASE_SKILLS]
+    return (texts * (n_texts // len(texts) + 1))[:n_texts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--texts', type=int, default=1024)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    texts = probe_skills(args.texts)
+    reference = load_model(args.model, 'torch')
+    failed = False
+
+    print(f"{'backend':>10} {'load (s)':>9} {'mean cos':>9} {'min cos':>8} {'nbr agree':>10} "
+          f"{'batch':>6} {'latency (ms)':>13} {'skills/s':>9}")
+    for backend in args.backends:
+        start = time.perf_counter()
+        model = reference if backend == 'torch' else load_model(args.model, backend)
+        load_seconds = time.perf_counter() - start
+
+        if model is reference:
+            agreement = {'mean': 1.0, 'min': 1.0, 'neighbour_agreement': 1.0}
+        else:
+            agreement = cosine_agreement(reference, model, texts)
+            failed |= agreement['mean'] < MIN_COSINE_AGREEMENT
+
+        for i, batch_size in enumerate(args.batch_sizes):
+            batch = texts[:batch_size]
+            model.encode(batch, batch_size=batch_size)  # warm-up
+            latencies = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                model.encode(batch, batch_size=batch_size)
+                latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            model.encode(texts, batch_size=batch_size)
+            throughput = len(texts) / (time.perf_counter() - start)
+
+            prefix = (f"{backend:>10} {load_seconds:>9.2f} {agreement['mean']:>9.4f} {agreement['min']:>8.4f} "
+                      f"{agreement['neighbour_agreement']:>10.1%}") if i == 0 else ' ' * 50
+            print(f"{prefix} {batch_size:>6} {statistics.median(latencies) * 1000:>13.2f} {throughput:>9.0f}")
+
+    if failed:
+        print(f"FAIL: a backend's mean cosine agreement is below {MIN_COSINE_AGREEMENT}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
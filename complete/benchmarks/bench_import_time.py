@@ -0,0 +1,97 @@
+"""
+Benchmark cold-start import time of the app and guard against regressions
+
+Imports each module in a fresh interpreter (python -X importtime), reports the
+median wall time over --repeat runs and the slowest top-level imports, and
+exits non-zero if
+  - a module on the deferred list (models, sklearn, plotting libraries we
+    don't render with) is imported at startup, or
+  - the median import time exceeds --budget-s.
+
+Run from anywhere; sentence-transformers / spaCy need not be installed since
+neither may be imported here.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5] [--budget-s 4.5] [--top 8]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+COMPLETE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MILESTONE2_DIR = os.path.join(os.path.dirname(COMPLETE_DIR), 'Milestone2', 'Milestone2')
+
+# (label, directory, module)
+TARGETS = [
+    ('complete/app.py', COMPLETE_DIR, 'app'),
+    ('Milestone2 skill_analyzer_core', MILESTONE2_DIR, 'skill_analyzer_core'),
+]
+
+# Loaded on first use (background model load, first similarity / assignment call)
+DEFERRED = ['torch', 'sentence_transformers', 'transformers', 'spacy', 'sklearn',
+            'seaborn', 'matplotlib', 'plotly.figure_factory', 'plotly.express', 'scipy.optimize',
+            'scipy.sparse']
+
+
+def import_profile(directory: str, module: str):
+    """Import module in a fresh interpreter; returns (seconds, {module: cumulative seconds})"""
+    env = dict(os.environ, SKILLGAP_EMBEDDING_STORE='', PYTHONDONTWRITEBYTECODE='1')
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                               cwd=directory, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        try:
+            cumulative[name.strip()] = int(total) / 1e6
+        except ValueError:  # header line
+            continue
+    return cumulative.get(module, 0.0), cumulative
+
+
+def top_level(cumulative, module: str, top: int):
+    """Slowest imports that are not submodules of another listed import"""
+    roots = {name: seconds for name, seconds in cumulative.items()
+             if name != module and '.' not in name}
+    return sorted(roots.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-s', type=float, default=4.5,
+                        help="Maximum median import time of complete/app.py")
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    failed = False
+    for label, directory, module in TARGETS:
+        timings = []
+        for _ in range(args.repeat):
+            seconds, cumulative = import_profile(directory, module)
+            timings.append(seconds)
+        median = statistics.median(timings)
+
+        print(f"{label}: median {median:.2f}s (min {min(timings):.2f}s over {args.repeat} cold imports)")
+        for name, seconds in top_level(cumulative, module, args.top):
+            print(f"    {name:<28} {seconds:>6.2f}s")
+
+        eager = [name for name in DEFERRED if name in cumulative]
+        if eager:
+            print(f"    FAIL: imported at startup: {', '.join(eager)}")
+            failed = True
+        if module == 'app' and median > args.budget_s:
+            print(f"    FAIL: over the {args.budget_s:.1f}s cold-start budget")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
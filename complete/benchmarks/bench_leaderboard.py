@@ -0,0 +1,82 @@
+"""
+Benchmark leaderboard mode (SkillGapAnalyzer.rank_candidates) throughput
+
+Streams synthetic resumes against one JD and reports resumes/sec for several
+chunk sizes, next to the per-resume analyze() loop it replaces. Resume skills
+are drawn from a fixed vocabulary, so after the first pass most embeddings
+come from the cache, as they would for a real requisition. By default the
+model is a random projection (measures the ranking pipeline itself); pass
+--real-model to include SBERT inference.
+
+Usage:
+    python benchmarks/bench_leaderboard.py [--resumes 20000] [--chunk-sizes 64 256 1024] [--real-model]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+os.environ.setdefault('SKILLGAP_EMBEDDING_STORE', '')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SimilarityCalculator, SkillGapAnalyzer  # noqa: E402
+from bench_encode_lookup import make_encoder  # noqa: E402
+
+
+def generate_resumes(n_resumes: int, vocabulary, seed: int = 0):
+    """Yield (candidate_id, skills) pairs without materialising the whole set"""
+    rng = np.random.default_rng(seed)
+    for i in range(n_resumes):
+        picks = rng.choice(len(vocabulary), rng.integers(5, 30), replace=False)
+        yield f"candidate-{i}", [vocabulary[j] for j in picks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--resumes', type=int, default=20_000)
+    parser.add_argument('--vocabulary', type=int, default=5_000)
+    parser.add_argument('--jd-skills', type=int, default=15)
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[64, 256, 1024])
+    parser.add_argument('--top-k', type=int, default=50)
+    parser.add_argument('--loop-resumes', type=int, default=2_000,
+                        help='Resumes to run through the analyze() loop for comparison')
+    parser.add_argument('--real-model', action='store_true')
+    args = parser.parse_args()
+
+    encoder = make_encoder(args.real_model, cache_max_bytes=1024 * 1024 * 1024)
+    analyzer = SkillGapAnalyzer(encoder, SimilarityCalculator())
+    analyzer.logger.disabled = True
+    analyzer.calculator.logger.disabled = True
+
+    vocabulary = [f"skill {i}" for i in range(args.vocabulary)]
+    jd_skills = vocabulary[:args.jd_skills]
+    encoder.encode_skills(vocabulary)  # warm cache
+
+    print(f"{'mode':>22} {'resumes':>8} {'seconds':>8} {'resumes/s':>10} {'peak MB':>8}")
+    for chunk_size in args.chunk_sizes:
+        analyzer.rank_candidates(generate_resumes(args.resumes, vocabulary), jd_skills,
+                                 top_k=args.top_k, chunk_size=chunk_size)
+        stats = analyzer.last_leaderboard_stats
+
+        # Separate traced pass: tracemalloc slows allocation too much to time with it on
+        tracemalloc.start()
+        analyzer.rank_candidates(generate_resumes(min(args.resumes, 4 * chunk_size), vocabulary),
+                                 jd_skills, top_k=args.top_k, chunk_size=chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{f'leaderboard/{chunk_size}':>22} {stats['resumes_scored']:>8} {stats['seconds']:>8.2f} "
+              f"{stats['resumes_per_second']:>10.0f} {peak / 1024 / 1024:>8.1f}")
+
+    start = time.perf_counter()
+    for _, skills in generate_resumes(args.loop_resumes, vocabulary):
+        analyzer.analyze(skills, jd_skills)
+    elapsed = time.perf_counter() - start
+    print(f"{'analyze() loop':>22} {args.loop_resumes:>8} {elapsed:>8.2f} {args.loop_resumes / elapsed:>10.0f} {'-':>8}")
+
+
+if __name__ == '__main__':
+    main()
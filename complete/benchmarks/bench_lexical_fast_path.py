@@ -0,0 +1,141 @@
+"""
+Benchmark the lexical fast path of SkillGapAnalyzer.analyze
+
+JD skills whose canonical key (case, spacing and aliases folded) also occurs
+in the resume are resolved as exact matches before SBERT. This script runs
+the same requests with the fast path on and off and reports the skills
+passed to encode_skills, the skills that reached the model, the similarity
+cells computed and the wall time.
+
+Within one request the JD side of an exact match is normally a cache hit
+(the resume side encoded it first), so model work only drops when every JD
+skill matches lexically; the saving is in encode lookups and matmul cells.
+
+Every request starts with a cold embedding cache, so "model" counts what a
+first-time request costs. Requests come from --traffic (JSON lines of
+{"resume": [...], "jd": [...]}, e.g. exported from real sessions) or are
+synthesised with --exact-rate of the JD skills copied from the resume in
+varying spellings, plus the app's sample pair.
+
+Usage:
+    python benchmarks/bench_lexical_fast_path.py [--traffic requests.jsonl] [--exact-rate 0.3] [--real-model]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault('SKILLGAP_EMBEDDING_STORE', '')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SimilarityCalculator, SkillGapAnalyzer  # noqa: E402
+from bench_encode_lookup import make_encoder  # noqa: E402
+
+SAMPLE_RESUME = ["Python", "Machine Learning", "SQL", "Data Analysis",
+                 "Pandas", "NumPy", "Scikit-learn", "Git", "Statistics"]
+SAMPLE_JD = ["Python", "Deep Learning", "TensorFlow", "SQL", "AWS", "Docker",
+             "Kubernetes", "Data Science", "Neural Networks", "Cloud Computing"]
+
+
+class CountingModel:
+    """Wraps a model and counts the texts it is asked to encode"""
+
+    def __init__(self, model):
+        self.model = model
+        self.texts = 0
+
+    def encode(self, skills, **kwargs):
+        self.texts += len(skills)
+        return self.model.encode(skills, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+
+def synthetic_traffic(n_requests: int, exact_rate: float, vocabulary_size: int, seed: int = 0):
+    """Requests where exact_rate of the JD skills also appear (re-spelled) in the resume"""
+    rng = np.random.default_rng(seed)
+    vocabulary = [f"skill {i}" for i in range(vocabulary_size)]
+    spellings = [str.lower, str.upper, str.title, lambda s: f"  {s} "]
+    requests = [(SAMPLE_RESUME, SAMPLE_JD)]
+    for _ in range(n_requests - 1):
+        resume = [vocabulary[i] for i in rng.choice(vocabulary_size, rng.integers(10, 60), replace=False)]
+        n_jd = int(rng.integers(8, 30))
+        n_exact = min(len(resume), int(round(n_jd * exact_rate)))
+        jd = [spellings[rng.integers(len(spellings))](resume[i])
+              for i in rng.choice(len(resume), n_exact, replace=False)]
+        jd += [vocabulary[i] for i in rng.choice(vocabulary_size, n_jd - n_exact, replace=False)]
+        requests.append((resume, jd))
+    return requests
+
+
+def load_traffic(path: str):
+    with open(path, encoding='utf-8') as f:
+        return [(r['resume'], r['jd']) for r in map(json.loads, f) if r.get('resume') and r.get('jd')]
+
+
+def run(analyzer: SkillGapAnalyzer, model: CountingModel, requests):
+    encoder = analyzer.encoder
+    encode_skills = encoder.encode_skills
+    lookups = 0
+
+    def counting_encode_skills(skills, *args, **kwargs):
+        nonlocal lookups
+        lookups += len(skills)
+        return encode_skills(skills, *args, **kwargs)
+
+    encoder.encode_skills = counting_encode_skills
+    model.texts = 0
+    cells = 0
+    elapsed = 0.0
+    for resume, jd in requests:
+        analyzer.encoder.clear_cache()
+        start = time.perf_counter()
+        result = analyzer.analyze(resume, jd)
+        elapsed += time.perf_counter() - start
+        cells += len(result.resume_skills) * len(result.jd_skills)
+    del encoder.encode_skills
+    return lookups, model.texts, cells - analyzer.lexical_stats['cells_saved'], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--traffic', help='JSON lines file of {"resume": [...], "jd": [...]} requests')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--exact-rate', type=float, default=0.3,
+                        help='Share of JD skills also present in the resume (synthetic traffic)')
+    parser.add_argument('--vocabulary', type=int, default=2000)
+    parser.add_argument('--real-model', action='store_true')
+    args = parser.parse_args()
+
+    requests = (load_traffic(args.traffic) if args.traffic
+                else synthetic_traffic(args.requests, args.exact_rate, args.vocabulary))
+
+    encoder = make_encoder(args.real_model)
+    model = CountingModel(encoder.model)
+    encoder.model = model
+    calculator = SimilarityCalculator()
+
+    rows = {}
+    for label, enabled in (('off', False), ('on', True)):
+        analyzer = SkillGapAnalyzer(encoder, calculator, lexical_fast_path=enabled)
+        for component in (analyzer, calculator, encoder):
+            component.logger.disabled = True
+        rows[label] = run(analyzer, model, requests)
+        lexical_matches = analyzer.lexical_stats['lexical_matches']
+
+    total_jd = sum(len(encoder.normalizer.canonicalize(jd)[1]) for _, jd in requests)
+    print(f"{len(requests)} requests, {total_jd} JD skills, "
+          f"{lexical_matches} ({lexical_matches / total_jd:.1%}) resolved lexically")
+    print(f"{'fast path':>10} {'lookups':>9} {'model':>9} {'sim cells':>11} {'seconds':>8}")
+    for label, (lookups, texts, cells, seconds) in rows.items():
+        print(f"{label:>10} {lookups:>9} {texts:>9} {cells:>11} {seconds:>8.3f}")
+    saved = [1 - on / off if off else 0.0 for on, off in zip(rows['on'], rows['off'])]
+    print(f"{'saved':>10} {saved[0]:>9.1%} {saved[1]:>9.1%} {saved[2]:>11.1%} {saved[3]:>8.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark the similarity kernel against sklearn cosine_similarity
+
+The sklearn path validates, copies and re-normalises both inputs on every
+call; SimilarityCalculator.compute_similarity_matrix takes unit-length
+float32 embeddings and performs one BLAS matmul into a preallocated output.
+
+Usage:
+    python benchmarks/bench_similarity_kernel.py [--sizes 100 1000 10000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import SimilarityCalculator, l2_normalize  # noqa: E402
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--dimension', type=int, default=384)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    calculator = SimilarityCalculator()
+    calculator.logger.disabled = True
+    rng = np.random.default_rng(0)
+
+    print(f"{'shape':>13} {'sklearn (ms)':>13} {'kernel (ms)':>12} {'speedup':>8} {'max abs diff':>13}")
+    for n in args.sizes:
+        resume = l2_normalize(rng.standard_normal((n, args.dimension)))
+        jd = l2_normalize(rng.standard_normal((n, args.dimension)))
+        out = np.empty((n, n), dtype=np.float32)
+
+        sklearn_seconds = best_of(lambda: cosine_similarity(resume, jd), args.repeat)
+        kernel_seconds = best_of(lambda: calculator.compute_similarity_matrix(resume, jd, out=out), args.repeat)
+        diff = float(np.abs(cosine_similarity(resume, jd) - out).max())
+
+        print(f"{f'{n}x{n}':>13} {sklearn_seconds * 1000:>13.2f} {kernel_seconds * 1000:>12.2f} "
+              f"{sklearn_seconds / kernel_seconds:>7.1f}x {diff:>13.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+import argparse
+import contextlib
+import itertools
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from embedding_store import EmbeddingStore
+from encoder_backends import BACKENDS, load_model, model_key
+from skill_normalizer import SkillNormalizer, default_normalizer
+
+# Same default location as the app's store (complete/.embedding_store)
+DEFAULT_EMBEDDING_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.embedding_store')
+
+# Thread pools sized from the environment when numpy / torch / the tokenizers
+# are first imported
+THREAD_VARIABLES = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+
+# Per-worker state, set by _init_worker in each pool process
+_worker_model = None
+_worker_batch_size = 64
+
+
+@contextlib.contextmanager
+def _worker_environment(threads: int):
+    """
+    Set the thread variables in this process's environment while workers start
+
+    Spawned workers import this module, and numpy with it, before any pool
+    initializer runs, so the variables only take effect if the workers
+    inherit them.
+    """
+    variables = dict.fromkeys(THREAD_VARIABLES, str(threads))
+    variables['TOKENIZERS_PARALLELISM'] = 'false'
+    saved = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _init_worker(model_name: str, backend: str, threads: int, batch_size: int):
+    """Pool initializer: pin torch's thread count, then load this worker's model copy"""
+    global _worker_model, _worker_batch_size
+    try:
+        import torch
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    except (ImportError, RuntimeError):
+        pass
+
+    _worker_model = load_model(model_name, backend)
+    _worker_batch_size = batch_size
+
+
+def _encode_chunk(texts: List[str]) -> np.ndarray:
+    """Pool task: L2-normalised float32 embeddings of one chunk"""
+    embeddings = _worker_model.encode(texts, batch_size=_worker_batch_size, normalize_embeddings=True,
+                                      convert_to_numpy=True, show_progress_bar=False)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+class BulkEncoder:
+    """Encode large skill corpora on a pool of local processes
+
+    For backfills (a new taxonomy, an archive of resumes) rather than
+    interactive analyses: every worker process loads its own model copy and
+    runs with a pinned thread count, so N workers with one thread each scale
+    close to linearly on N cores instead of contending for one model.
+    Chunks are streamed back in input order and can be written straight into
+    the persistent EmbeddingStore that SentenceBERTEncoder reads from.
+    """
+
+    MAX_IN_FLIGHT = 2
+
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', backend: str = 'torch',
+                 workers: Optional[int] = None, threads_per_worker: int = 1,
+                 chunk_size: int = 1024, batch_size: int = 64,
+                 normalizer: Optional[SkillNormalizer] = None):
+        """
+        Initialize bulk encoder (the pool is started per run)
+
+        Args:
+            model_name: Name of the sentence-transformers model
+            backend: Inference backend, one of encoder_backends.BACKENDS
+            workers: Number of worker processes (defaults to cores // threads_per_worker)
+            threads_per_worker: Torch / BLAS threads in each worker
+            chunk_size: Skills sent to a worker per task
+            batch_size: Model batch size inside a worker
+            normalizer: Maps skills to canonical keys; keys are what gets
+                embedded and stored, as in SentenceBERTEncoder
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {BACKENDS}")
+        self.model_name = model_name
+        self.backend = backend
+        self.store_model_name = model_key(model_name, backend)
+        self.threads_per_worker = max(1, int(threads_per_worker))
+        self.workers = workers or max(1, (os.cpu_count() or 1) // self.threads_per_worker)
+        self.chunk_size = int(chunk_size)
+        self.batch_size = int(batch_size)
+        self.normalizer = normalizer or default_normalizer
+        self.logger = self._setup_logger()
+
+    def encode_iter(self, skills: Iterable[str]) -> Iterator[Tuple[List[str], np.ndarray]]:
+        """
+        Encode skills on the pool, yielding results in input order
+
+        Args:
+            skills: Skill strings (any iterable; read chunk by chunk)
+
+        Yields:
+            (canonical keys, embeddings) per chunk of chunk_size skills
+        """
+        key = self.normalizer.key
+        chunks = (list(map(key, chunk)) for chunk in self._chunks(skills))
+        yield from self._run_pool(chunks)
+
+    def encode(self, skills: Sequence[str]) -> np.ndarray:
+        """Encode skills on the pool; returns one embedding row per skill, in order"""
+        parts = [embeddings for _, embeddings in self.encode_iter(skills)]
+        if not parts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.concatenate(parts)
+
+    def ingest(self, skills: Iterable[str], store: Union[EmbeddingStore, str]) -> Dict:
+        """
+        Encode every skill the store does not hold yet and append it to the store
+
+        Args:
+            skills: Skill strings; duplicates and already stored keys are skipped
+            store: Writable EmbeddingStore, or the directory of one; a store that
+                does not exist yet is created with the dimension of the first
+                encoded chunk, so the model is only ever loaded in the workers
+
+        Returns:
+            Counts of skills seen, already stored and appended, plus timing
+        """
+        store_path = None
+        if isinstance(store, str):
+            store_path = store
+            dimension = EmbeddingStore.stored_dimension(store_path)
+            store = EmbeddingStore(store_path, dimension) if dimension is not None else None
+        if store is not None and store.readonly:
+            raise PermissionError(f"Embedding store {store.path} is opened read-only")
+
+        key = self.normalizer.key
+        stats = {'skills': 0, 'already_stored': 0, 'appended': 0}
+        seen = set()
+
+        def pending_chunks():
+            for chunk in self._chunks(skills):
+                stats['skills'] += len(chunk)
+                keys = [k for k in dict.fromkeys(map(key, chunk)) if k not in seen]
+                seen.update(keys)
+                if store is None:
+                    rows = np.full(len(keys), -1, dtype=np.int64)
+                else:
+                    rows = store.lookup_rows(self.store_model_name, keys)
+                stats['already_stored'] += int((rows >= 0).sum())
+                missing = [k for k, row in zip(keys, rows) if row < 0]
+                if missing:
+                    yield missing
+
+        start = time.perf_counter()
+        for keys, embeddings in self._run_pool(pending_chunks()):
+            if store is None:
+                store = EmbeddingStore(store_path, embeddings.shape[1])
+            stats['appended'] += store.add(self.store_model_name, keys, embeddings)
+        stats['seconds'] = time.perf_counter() - start
+        stats['skills_per_second'] = stats['appended'] / stats['seconds'] if stats['seconds'] else 0.0
+        self.logger.info(f"Ingested {stats['appended']} new embeddings ({stats['already_stored']} already "
+                         f"stored) in {stats['seconds']:.1f}s with {self.workers} workers")
+        return stats
+
+    def _run_pool(self, chunks: Iterable[List[str]]) -> Iterator[Tuple[List[str], np.ndarray]]:
+        # spawn, not fork: torch and the tokenizers are not fork-safe once initialised
+        context = multiprocessing.get_context('spawn')
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            return
+        self.logger.info(f"Starting {self.workers} encoding workers "
+                         f"({self.threads_per_worker} thread(s) each, {self.backend} backend)")
+        with _worker_environment(self.threads_per_worker), \
+                context.Pool(self.workers, initializer=_init_worker,
+                             initargs=(self.model_name, self.backend, self.threads_per_worker,
+                                       self.batch_size)) as pool:
+            # At most MAX_IN_FLIGHT chunks per worker are queued, so the input is
+            # read (and results held) as the pool keeps up; results come back
+            # in submission order
+            in_flight = deque()
+            for chunk in itertools.chain([first], chunks):
+                in_flight.append((chunk, pool.apply_async(_encode_chunk, (chunk,))))
+                if len(in_flight) >= self.MAX_IN_FLIGHT * self.workers:
+                    chunk, result = in_flight.popleft()
+                    yield chunk, result.get()
+            while in_flight:
+                chunk, result = in_flight.popleft()
+                yield chunk, result.get()
+
+    def _chunks(self, skills: Iterable[str]) -> Iterator[List[str]]:
+        chunk = []
+        for skill in skills:
+            chunk.append(skill)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('BulkEncoder')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill the persistent embedding store from skill files (one skill per line)")
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--store', default=os.environ.get('SKILLGAP_EMBEDDING_STORE') or DEFAULT_EMBEDDING_STORE)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--backend', default=os.environ.get('SKILLGAP_ENCODER_BACKEND', 'torch'), choices=BACKENDS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--threads-per-worker', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    def read_skills():
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield line.strip()
+
+    encoder = BulkEncoder(args.model, args.backend, workers=args.workers,
+                          threads_per_worker=args.threads_per_worker, chunk_size=args.chunk_size)
+    stats = encoder.ingest(read_skills(), args.store)
+    print(f"{stats['skills']} skills read, {stats['already_stored']} already stored, "
+          f"{stats['appended']} appended in {stats['seconds']:.1f}s "
+          f"({stats['skills_per_second']:.0f} skills/s)")
+
+
+if __name__ == '__main__':
+    main()
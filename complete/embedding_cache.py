@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """In-memory LRU embedding cache bounded by a byte budget
+
+    Keeps hit/miss/eviction counters and the number of resident bytes so the
+    UI can show how well the cache is doing under real traffic.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            max_bytes: Upper bound on the bytes held by cached embeddings
+        """
+        self.max_bytes = int(max_bytes)
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Return the cached embedding (marking it recently used), or None"""
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return embedding
+
+    def put(self, key: Hashable, embedding: np.ndarray):
+        """Insert an embedding, evicting least recently used entries if over budget"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.resident_bytes -= old.nbytes
+
+        if embedding.nbytes > self.max_bytes:
+            # Would evict everything and still not fit
+            return
+        if embedding.base is not None:
+            # A row view would pin its whole parent array and defeat the byte budget
+            embedding = embedding.copy()
+
+        self._entries[key] = embedding
+        self.resident_bytes += embedding.nbytes
+
+        while self.resident_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.resident_bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def update(self, items: Iterable[Tuple[Hashable, np.ndarray]]):
+        """Insert several embeddings"""
+        if isinstance(items, dict):
+            items = items.items()
+        for key, embedding in items:
+            self.put(key, embedding)
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        self._entries.clear()
+        self.resident_bytes = 0
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_statistics(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups > 0 else 0,
+            'evictions': self.evictions,
+            'resident_bytes': self.resident_bytes,
+            'max_bytes': self.max_bytes
+        }
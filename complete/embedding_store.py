@@ -0,0 +1,266 @@
+import json
+import logging
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single writer assumed
+    fcntl = None
+
+
+class EmbeddingStore:
+    """Persistent on-disk embedding store backed by a memory-mapped float32 matrix
+
+    Layout of the store directory:
+        meta.json       format version and embedding dimension
+        embeddings.f32  raw float32 unit-length rows (n_rows x dimension), memory mapped
+        index.jsonl     one [model_name, skill] entry per row, append-only
+
+    Rows are only ever appended, so several worker processes can open the
+    same store read-only while one process appends new embeddings; readers
+    pick up new rows when a lookup misses.
+    """
+
+    # v2: rows are L2-normalised at encode time
+    FORMAT_VERSION = 2
+    META_FILE = 'meta.json'
+    DATA_FILE = 'embeddings.f32'
+    INDEX_FILE = 'index.jsonl'
+    LOCK_FILE = '.lock'
+
+    def __init__(self, path: str, dimension: int, readonly: bool = False):
+        """
+        Open (or create) an embedding store
+
+        Args:
+            path: Directory holding the store files
+            dimension: Embedding dimension of the stored vectors
+            readonly: Open without write access (for worker processes)
+        """
+        self.path = path
+        self.dimension = int(dimension)
+        self.readonly = readonly
+        self.logger = self._setup_logger()
+
+        self._index: Dict[Tuple[str, str], int] = {}
+        self._index_offset = 0
+        self._matrix: Optional[np.memmap] = None
+        self._mapped_rows = 0
+
+        if not readonly:
+            os.makedirs(path, exist_ok=True)
+            self._init_meta()
+        self.refresh()
+
+    @classmethod
+    def stored_dimension(cls, path: str) -> Optional[int]:
+        """Embedding dimension of the store at path, None if there is no store yet"""
+        try:
+            with open(os.path.join(path, cls.META_FILE), 'r', encoding='utf-8') as f:
+                return int(json.load(f)['dimension'])
+        except FileNotFoundError:
+            return None
+
+    @property
+    def data_path(self) -> str:
+        return os.path.join(self.path, self.DATA_FILE)
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.path, self.INDEX_FILE)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._index
+
+    def refresh(self):
+        """Pick up rows appended by other processes since the last refresh"""
+        if not os.path.exists(self.index_path):
+            return
+        if os.path.getsize(self.index_path) == self._index_offset:
+            return
+
+        # Binary mode: _index_offset is a byte offset (also used to truncate)
+        with open(self.index_path, 'rb') as f:
+            f.seek(self._index_offset)
+            row = len(self._index)
+            while True:
+                line = f.readline()
+                # A partially written trailing line belongs to an append in progress
+                if not line or not line.endswith(b'\n'):
+                    break
+                model_name, skill = json.loads(line.decode('utf-8'))
+                self._index[(model_name, skill)] = row
+                row += 1
+                self._index_offset = f.tell()
+
+        self._remap()
+
+    def get(self, model_name: str, skill: str) -> Optional[np.ndarray]:
+        """Return the stored embedding for a skill, or None if absent"""
+        row = self.lookup_rows(model_name, [skill])[0]
+        if row < 0:
+            return None
+        return np.array(self._matrix[row])
+
+    def get_many(self, model_name: str, skills: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return stored embeddings for every skill that is present"""
+        rows = self.lookup_rows(model_name, skills)
+        present = np.flatnonzero(rows >= 0)
+        embeddings = self.take(rows[present])
+        return {skills[i]: embeddings[k] for k, i in enumerate(present)}
+
+    def lookup_rows(self, model_name: str, skills: Sequence[str]) -> np.ndarray:
+        """Return the row of each skill in the matrix, -1 where absent"""
+        rows = self._lookup(model_name, skills)
+        missing = np.flatnonzero(rows < 0)
+        if len(missing) and self._refresh_if_grown():
+            rows[missing] = self._lookup(model_name, [skills[i] for i in missing])
+        return rows
+
+    def _lookup(self, model_name: str, skills: Sequence[str]) -> np.ndarray:
+        index = self._index
+        return np.fromiter((index.get((model_name, skill), -1) for skill in skills),
+                           dtype=np.int64, count=len(skills))
+
+    def _refresh_if_grown(self) -> bool:
+        """Refresh if another process appended since the last refresh"""
+        n_rows = len(self._index)
+        self.refresh()
+        return len(self._index) > n_rows
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        """Gather rows from the memory-mapped matrix into a new float32 array"""
+        if len(rows) == 0:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.asarray(self._matrix[rows], dtype=np.float32)
+
+    def add(self, model_name: str, skills: Sequence[str], embeddings: np.ndarray) -> int:
+        """
+        Append embeddings for skills that are not yet stored
+
+        Args:
+            model_name: Name of the model that produced the embeddings
+            skills: Skill strings, one per embedding row
+            embeddings: Array of shape (len(skills), dimension)
+
+        Returns:
+            Number of rows appended
+        """
+        if self.readonly:
+            raise PermissionError(f"Embedding store {self.path} is opened read-only")
+
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(skills), -1)
+        if embeddings.shape[1] != self.dimension:
+            raise ValueError(f"Expected embeddings of dimension {self.dimension}, "
+                             f"got {embeddings.shape[1]}")
+
+        with self._write_lock():
+            # Another writer may have appended in the meantime
+            self.refresh()
+
+            new_keys = {}
+            for i, skill in enumerate(skills):
+                key = (model_name, skill)
+                if key not in self._index and key not in new_keys:
+                    new_keys[key] = i
+            new_rows = list(new_keys.values())
+
+            if not new_keys:
+                return 0
+
+            self._discard_torn_append()
+
+            # Data first, index second: readers never see an index entry without its row
+            with open(self.data_path, 'ab') as f:
+                f.write(np.ascontiguousarray(embeddings[new_rows]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                for key in new_keys:
+                    f.write(json.dumps(list(key), ensure_ascii=False) + '\n')
+
+            self.refresh()
+
+        self.logger.info(f"Appended {len(new_keys)} embeddings to {self.path}")
+        return len(new_keys)
+
+    def _discard_torn_append(self):
+        """
+        Cut both files back to the last complete row (caller holds the write lock)
+
+        A writer that died between writing its data and its index lines leaves
+        orphan rows in the data file (or a partial index line); appending
+        after them would shift every later row against its index entry.
+        """
+        data_bytes = len(self._index) * self.dimension * np.dtype(np.float32).itemsize
+        if os.path.exists(self.data_path) and os.path.getsize(self.data_path) > data_bytes:
+            self.logger.warning(f"Discarding orphan rows of an interrupted append in {self.path}")
+            with open(self.data_path, 'r+b') as f:
+                f.truncate(data_bytes)
+        if os.path.exists(self.index_path) and os.path.getsize(self.index_path) > self._index_offset:
+            with open(self.index_path, 'r+b') as f:
+                f.truncate(self._index_offset)
+
+    def _init_meta(self):
+        meta_path = os.path.join(self.path, self.META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('format_version') != self.FORMAT_VERSION or meta.get('dimension') != self.dimension:
+                raise ValueError(f"Embedding store {self.path} is incompatible: {meta} "
+                                 f"(delete the directory to rebuild it)")
+            return
+
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'format_version': self.FORMAT_VERSION,
+                       'dimension': self.dimension,
+                       'dtype': 'float32'}, f)
+
+    def _remap(self):
+        n_rows = len(self._index)
+        if n_rows == self._mapped_rows:
+            return
+        self._matrix = np.memmap(self.data_path, dtype=np.float32, mode='r',
+                                 shape=(n_rows, self.dimension))
+        self._mapped_rows = n_rows
+
+    def _write_lock(self):
+        return _FileLock(os.path.join(self.path, self.LOCK_FILE))
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('EmbeddingStore')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
+
+
+class _FileLock:
+    """Exclusive advisory lock held while appending to the store"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._handle = None
+
+    def __enter__(self):
+        self._handle = open(self.path, 'a')
+        if fcntl is not None:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        self._handle.close()
+        self._handle = None
@@ -0,0 +1,126 @@
+import logging
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Inference backends for SentenceBERTEncoder
+#   torch      sentence-transformers model as loaded (fp32, default device)
+#   onnx       exported ONNX graph run by onnxruntime on CPU (sentence-transformers
+#              >= 3.2 with optimum[onnxruntime]; exported on first use if the
+#              model repo ships no ONNX file)
+#   quantized  fp32 torch model with its Linear layers dynamically quantised to int8, CPU
+BACKENDS = ('torch', 'onnx', 'quantized')
+
+# Smallest mean cosine between a backend's embeddings and the fp32 ones we accept
+MIN_COSINE_AGREEMENT = 0.99
+
+logger = logging.getLogger('EncoderBackends')
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+    logger.addHandler(_handler)
+
+
+def load_model(model_name: str, backend: str = 'torch'):
+    """
+    Load a sentence-transformers model for the given inference backend
+
+    Every backend returns an object with the SentenceTransformer interface
+    (encode, get_sentence_embedding_dimension, tokenizer, max_seq_length).
+
+    Args:
+        model_name: Name or path of the sentence-transformers model
+        backend: One of BACKENDS
+
+    Returns:
+        Loaded model
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown encoder backend {backend!r}; expected one of {BACKENDS}")
+
+    from sentence_transformers import SentenceTransformer
+
+    if backend == 'torch':
+        return SentenceTransformer(model_name)
+
+    if backend == 'onnx':
+        try:
+            return SentenceTransformer(model_name, device='cpu', backend='onnx')
+        except TypeError as e:
+            # sentence-transformers < 3.2 has no backend argument
+            raise ImportError("The onnx backend needs sentence-transformers>=3.2 and "
+                              "optimum[onnxruntime]") from e
+
+    import torch
+    model = SentenceTransformer(model_name, device='cpu')
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def model_key(model_name: str, backend: str = 'torch') -> str:
+    """Name the embeddings of a model/backend pair are cached and stored under
+
+    ONNX / int8 embeddings differ slightly from fp32 ones, so non-torch
+    backends get their own name.
+    """
+    return model_name if backend == 'torch' else f"{model_name}@{backend}"
+
+
+def cosine_agreement(reference, candidate, texts: Sequence[str],
+                     batch_size: int = 64) -> Dict[str, float]:
+    """
+    Compare a backend's embeddings with a reference model's
+
+    Args:
+        reference: Model giving the expected embeddings (normally the fp32 torch model)
+        candidate: Model under test
+        texts: Probe texts, e.g. the skill taxonomy
+        batch_size: Encoding batch size
+
+    Returns:
+        Mean / minimum / 1st-percentile cosine between the two embeddings of
+        each text, and the share of texts whose nearest other text is the
+        same under both models
+    """
+    texts = list(texts)
+    expected = _encode(reference, texts, batch_size)
+    actual = _encode(candidate, texts, batch_size)
+    cosines = np.einsum('ij,ij->i', expected, actual)
+
+    agreement = {
+        'mean': float(cosines.mean()),
+        'min': float(cosines.min()),
+        'p01': float(np.percentile(cosines, 1)),
+        'neighbour_agreement': _neighbour_agreement(expected, actual)
+    }
+    logger.info(f"Cosine agreement over {len(texts)} texts: mean {agreement['mean']:.4f}, "
+                f"min {agreement['min']:.4f}, neighbours {agreement['neighbour_agreement']:.1%}")
+    return agreement
+
+
+def check_agreement(reference, candidate, texts: Sequence[str],
+                    min_cosine: float = MIN_COSINE_AGREEMENT) -> Dict[str, float]:
+    """cosine_agreement(), raising ValueError if the mean cosine is below min_cosine"""
+    agreement = cosine_agreement(reference, candidate, texts)
+    if agreement['mean'] < min_cosine:
+        raise ValueError(f"Backend embeddings disagree with the reference: mean cosine "
+                         f"{agreement['mean']:.4f} < {min_cosine}")
+    return agreement
+
+
+def _encode(model, texts: List[str], batch_size: int) -> np.ndarray:
+    embeddings = model.encode(texts, batch_size=batch_size, normalize_embeddings=True,
+                              convert_to_numpy=True, show_progress_bar=False)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def _neighbour_agreement(expected: np.ndarray, actual: np.ndarray) -> float:
+    if len(expected) < 2:
+        return 1.0
+    neighbours = []
+    for embeddings in (expected, actual):
+        similarity = embeddings @ embeddings.T
+        np.fill_diagonal(similarity, -np.inf)
+        neighbours.append(similarity.argmax(axis=1))
+    return float(np.mean(neighbours[0] == neighbours[1]))
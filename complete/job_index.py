@@ -0,0 +1,173 @@
+import json
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+
+class JobPostingIndex:
+    """Precomputed JD skill embeddings for ranking many postings against one resume
+
+    Layout (all contiguous arrays):
+        skill_embeddings  unique canonical skills across all postings (n_unique x dim),
+                          L2-normalised float32
+        skill_ids         every posting's skills as int32 rows into skill_embeddings,
+                          concatenated posting after posting
+        offsets           posting p owns skill_ids[offsets[p]:offsets[p + 1]]
+
+    A posting's score is the same overall_score SkillGapAnalyzer computes: the
+    mean over its skills of the best similarity to any resume skill.
+    """
+
+    def __init__(self, encoder):
+        """
+        Initialize index
+
+        Args:
+            encoder: SentenceBERTEncoder used for postings and resumes
+        """
+        self.encoder = encoder
+        self.model_name = encoder.model_name
+        self.logger = self._setup_logger()
+
+        self.posting_ids: List[str] = []
+        self.skill_keys: List[str] = []
+        self._skill_positions: Dict[str, int] = {}
+        self.skill_embeddings = np.empty((0, encoder.embedding_dimension), dtype=np.float32)
+        self.skill_ids = np.empty(0, dtype=np.int32)
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.posting_ids)
+
+    def add_postings(self, postings: Iterable[Tuple[str, Sequence[str]]]):
+        """
+        Add job postings to the index
+
+        Args:
+            postings: (posting_id, skills) pairs, e.g. dict.items()
+        """
+        normalizer = self.encoder.normalizer
+        new_ids = []
+        new_skill_ids = []
+        lengths = []
+        # Positions of skills new to the index; merged into _skill_positions
+        # only once they are encoded, so a failed encode leaves the index as it was
+        new_positions: Dict[str, int] = {}
+
+        for posting_id, skills in postings:
+            _, keys = normalizer.canonicalize(skills)
+            if not keys:
+                self.logger.warning(f"Skipping posting {posting_id}: no skills")
+                continue
+            for key in keys:
+                position = self._skill_positions.get(key)
+                if position is None:
+                    position = new_positions.setdefault(key, len(self.skill_keys) + len(new_positions))
+                new_skill_ids.append(position)
+            new_ids.append(posting_id)
+            lengths.append(len(keys))
+
+        if not new_ids:
+            return
+
+        if new_positions:
+            new_keys = list(new_positions)
+            embeddings = self.encoder.encode_skills(new_keys, show_progress=True)
+            self.skill_embeddings = np.concatenate([self.skill_embeddings, embeddings])
+            self.skill_keys.extend(new_keys)
+            self._skill_positions.update(new_positions)
+
+        self.skill_ids = np.concatenate([self.skill_ids, np.asarray(new_skill_ids, dtype=np.int32)])
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(lengths)])
+        self.posting_ids.extend(new_ids)
+        self.logger.info(f"Indexed {len(new_ids)} postings ({len(self.posting_ids)} total, "
+                         f"{len(self.skill_keys)} distinct skills)")
+
+    def score_all(self, resume_skills: List[str], block_size: int = 16384) -> np.ndarray:
+        """
+        Overall score of every posting for one resume
+
+        Args:
+            resume_skills: Skills from the resume
+            block_size: Unique JD skills scored per matmul block
+
+        Returns:
+            Array of overall scores aligned with posting_ids
+        """
+        if not self.posting_ids:
+            return np.empty(0, dtype=np.float32)
+
+        resume_skills, _ = self.encoder.normalizer.canonicalize(resume_skills)
+        if not resume_skills:
+            raise ValueError("resume_skills must be non-empty")
+        resume_embeddings = self.encoder.encode_skills(resume_skills)
+
+        # Best resume match for every distinct JD skill, computed once
+        best = np.empty(len(self.skill_keys), dtype=np.float32)
+        for start in range(0, len(self.skill_keys), block_size):
+            block = self.skill_embeddings[start:start + block_size]
+            best[start:start + block_size] = (block @ resume_embeddings.T).max(axis=1)
+
+        # Segment mean over each posting's skills
+        lengths = np.diff(self.offsets)
+        sums = np.add.reduceat(best[self.skill_ids], self.offsets[:-1])
+        return sums / lengths
+
+    def top_k(self, resume_skills: List[str], k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Best-fitting postings for a resume
+
+        Returns:
+            Up to k (posting_id, overall_score) pairs, best first
+        """
+        scores = self.score_all(resume_skills)
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.posting_ids[i], float(scores[i])) for i in top]
+
+    def save(self, path: str):
+        """Save the index to a single .npz file"""
+        np.savez(
+            path,
+            skill_embeddings=self.skill_embeddings,
+            skill_ids=self.skill_ids,
+            offsets=self.offsets,
+            meta=np.array(json.dumps({
+                'model_name': self.model_name,
+                'posting_ids': self.posting_ids,
+                'skill_keys': self.skill_keys
+            }))
+        )
+        self.logger.info(f"Saved job posting index ({len(self.posting_ids)} postings) to {path}")
+
+    @classmethod
+    def load(cls, path: str, encoder) -> 'JobPostingIndex':
+        """Load an index saved with save(); it must match the encoder's model"""
+        index = cls(encoder)
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            if meta['model_name'] != encoder.model_name:
+                raise ValueError(f"Index was built with {meta['model_name']}, "
+                                 f"encoder uses {encoder.model_name}")
+            index.skill_embeddings = data['skill_embeddings']
+            index.skill_ids = data['skill_ids']
+            index.offsets = data['offsets']
+        index.posting_ids = meta['posting_ids']
+        index.skill_keys = meta['skill_keys']
+        index._skill_positions = {key: i for i, key in enumerate(index.skill_keys)}
+        return index
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('JobPostingIndex')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
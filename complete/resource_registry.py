@@ -0,0 +1,143 @@
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class ResourceRegistry:
+    """Process-wide registry of lazily loaded models and stateless components
+
+    Streamlit re-executes the app script on every interaction, but imported
+    modules (and therefore this registry) live for the whole process. Each
+    resource is built once, on first request, and the same instance is handed
+    to every session afterwards.
+    """
+
+    def __init__(self):
+        self._resources: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._preloading: Dict[str, threading.Thread] = {}
+        self.logger = self._setup_logger()
+
+    def get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the shared instance for name, building it with factory on first use
+
+        Args:
+            name: Registry key, e.g. 'encoder:all-MiniLM-L6-v2'
+            factory: Zero-argument callable that builds the resource
+
+        Returns:
+            The shared resource instance
+        """
+        if name in self._resources:
+            return self._resources[name]
+
+        with self._lock:
+            load_lock = self._loading.setdefault(name, threading.Lock())
+
+        # Per-resource lock: two sessions asking for the same model wait for one
+        # load, while unrelated resources can load concurrently
+        with load_lock:
+            if name in self._resources:
+                return self._resources[name]
+
+            self.logger.info(f"Loading resource: {name}")
+            rss_before = _current_rss_bytes()
+            start = time.perf_counter()
+            instance = factory()
+            load_seconds = time.perf_counter() - start
+            rss_after = _current_rss_bytes()
+
+            with self._lock:
+                self._resources[name] = instance
+                self._stats[name] = {
+                    'name': name,
+                    'type': type(instance).__name__,
+                    'load_seconds': load_seconds,
+                    'memory_bytes': max(rss_after - rss_before, 0),
+                    'loaded_at': time.time()
+                }
+            self.logger.info(f"Loaded {name} in {load_seconds:.2f}s")
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._resources
+
+    def preload(self, name: str, factory: Callable[[], Any]) -> Optional[threading.Thread]:
+        """
+        Start building a resource on a background thread
+
+        A later get() for the same name waits for this load instead of
+        starting another. If the load fails, the error is logged and the next
+        get() retries (and raises) in the caller.
+
+        Returns:
+            The loader thread, or None if the resource is already loaded or loading
+        """
+        with self._lock:
+            if name in self._resources or name in self._preloading:
+                return None
+            thread = threading.Thread(target=self._preload, args=(name, factory),
+                                      name=f'preload:{name}', daemon=True)
+            self._preloading[name] = thread
+        thread.start()
+        return thread
+
+    def _preload(self, name: str, factory: Callable[[], Any]):
+        try:
+            self.get(name, factory)
+        except Exception as e:
+            self.logger.warning(f"Background load of {name} failed: {e}")
+        finally:
+            with self._lock:
+                self._preloading.pop(name, None)
+
+    def release(self, name: str):
+        """Drop a resource so the next get() rebuilds it"""
+        with self._lock:
+            self._resources.pop(name, None)
+            self._stats.pop(name, None)
+
+    def get_statistics(self) -> List[Dict]:
+        """Load time and memory footprint of every loaded resource"""
+        with self._lock:
+            return [dict(stats) for stats in self._stats.values()]
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('ResourceRegistry')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
+
+
+def _current_rss_bytes() -> int:
+    """Resident set size of this process (best effort, 0 if unknown)"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # Peak RSS; KiB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    return 0
+
+
+# Shared by every Streamlit session in this process
+registry = ResourceRegistry()
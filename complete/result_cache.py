@@ -0,0 +1,241 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def fingerprint_skills(keys: Iterable[str]) -> str:
+    """Order- and duplicate-insensitive SHA-256 of a list of canonical skill keys"""
+    digest = hashlib.sha256()
+    for key in sorted(set(keys)):
+        digest.update(key.encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Analysis results keyed by skill-set fingerprints
+
+    A key covers everything that determines a result: the canonical resume and
+    JD skill sets (in any order), the model and the analyzer settings. Entries
+    live in a bounded in-memory LRU and, if disk_path is set, in one pickle
+    file per key so they survive restarts. Entries older than ttl_seconds are
+    treated as misses, and bind_model() drops everything computed with another
+    model.
+
+    Disk files are named <model tag>-<key>.pkl and written once, so the model
+    and age of an entry are known from the file name and mtime: expired and
+    other-model files are swept without unpickling them, and the oldest files
+    are evicted once the directory exceeds max_disk_bytes.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = 3600, max_entries: int = 256,
+                 disk_path: Optional[str] = None, max_disk_bytes: Optional[int] = 256 * 1024 * 1024):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: Age after which an entry expires (None keeps entries forever)
+            max_entries: Results held in memory
+            disk_path: Optional directory for persisted results
+            max_disk_bytes: Size of the persisted results above which the oldest
+                are evicted (None leaves the directory unbounded)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self.max_disk_bytes = max_disk_bytes
+        self.model_name: Optional[str] = None
+        self.logger = self._setup_logger()
+
+        # key -> (model_name, created_at, result)
+        self._entries: "OrderedDict[str, Tuple[str, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(resume_keys: Iterable[str], jd_keys: Iterable[str], model_name: str,
+                 **settings) -> str:
+        """
+        Cache key of one analysis
+
+        Args:
+            resume_keys: Canonical resume skill keys
+            jd_keys: Canonical JD skill keys
+            model_name: Encoder model
+            **settings: Analyzer settings that change the result (thresholds, ...)
+        """
+        digest = hashlib.sha256()
+        digest.update(fingerprint_skills(resume_keys).encode('ascii'))
+        digest.update(fingerprint_skills(jd_keys).encode('ascii'))
+        digest.update(model_name.encode('utf-8'))
+        digest.update(repr(sorted(settings.items())).encode('utf-8'))
+        return digest.hexdigest()
+
+    def bind_model(self, model_name: str):
+        """Invalidate every entry computed with a model other than model_name"""
+        if model_name == self.model_name:
+            return
+        with self._lock:
+            stale = [key for key, (model, _, _) in self._entries.items() if model != model_name]
+            for key in stale:
+                del self._entries[key]
+        if self.model_name is not None:
+            self.logger.info(f"Model changed to {model_name}; dropped cached results of {self.model_name}")
+        self.model_name = model_name
+        if self.disk_path:
+            self._sweep_disk()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for key, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self.disk_path and self.model_name is not None:
+            entry = self._read_disk(self._disk_file(key, self.model_name))
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is not None and self._expired(entry[1]):
+            self.invalidate(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key: str, result: Any, model_name: str):
+        """Store a result computed with model_name"""
+        entry = (model_name, time.time(), result)
+        self._remember(key, entry)
+        if self.disk_path:
+            path = self._disk_file(key, model_name)
+            try:
+                with open(path + '.tmp', 'wb') as f:
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(path + '.tmp', path)
+            except OSError as e:
+                self.logger.warning(f"Could not persist cached result: {e}")
+            self._sweep_disk()
+
+    def invalidate(self, key: str):
+        """Drop one entry from memory and disk"""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_path:
+            for name in self._disk_files():
+                if name.endswith(f"-{key}.pkl"):
+                    self._remove_disk(os.path.join(self.disk_path, name))
+
+    def clear(self):
+        """Drop all entries from memory and disk (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_path:
+            for name in self._disk_files():
+                self._remove_disk(os.path.join(self.disk_path, name))
+
+    def get_statistics(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups * 100) if lookups > 0 else 0,
+            'ttl_seconds': self.ttl_seconds,
+            'persistent': bool(self.disk_path)
+        }
+
+    def _remember(self, key: str, entry: Tuple[str, float, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    @staticmethod
+    def _model_tag(model_name: str) -> str:
+        return hashlib.sha256(model_name.encode('utf-8')).hexdigest()[:16]
+
+    def _disk_file(self, key: str, model_name: str) -> str:
+        return os.path.join(self.disk_path, f"{self._model_tag(model_name)}-{key}.pkl")
+
+    def _disk_files(self) -> List[str]:
+        try:
+            return [name for name in os.listdir(self.disk_path) if name.endswith('.pkl')]
+        except FileNotFoundError:
+            return []
+
+    def _sweep_disk(self):
+        """Drop other-model and expired files, then the oldest ones over max_disk_bytes"""
+        tag = self._model_tag(self.model_name) if self.model_name is not None else None
+        now = time.time()
+        kept = []
+        for name in self._disk_files():
+            path = os.path.join(self.disk_path, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if ((tag is not None and not name.startswith(f"{tag}-")) or
+                    (self.ttl_seconds is not None and now - info.st_mtime > self.ttl_seconds)):
+                self._remove_disk(path)
+            else:
+                kept.append((info.st_mtime, info.st_size, path))
+
+        if self.max_disk_bytes is None:
+            return
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in sorted(kept):
+            if total <= self.max_disk_bytes:
+                break
+            self._remove_disk(path)
+            total -= size
+
+    def _read_disk(self, path: str) -> Optional[Tuple[str, float, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Corrupt file, or a result class that no longer unpickles
+            # (renamed module or attribute): a miss either way
+            self.logger.warning(f"Discarding unreadable cached result {os.path.basename(path)}: {e}")
+            self._remove_disk(path)
+            return None
+
+    def _remove_disk(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _setup_logger(self) -> logging.Logger:
+        """Setup logging"""
+        logger = logging.getLogger('ResultCache')
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter('%(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+        return logger
@@ -0,0 +1,123 @@
+import re
+import sys
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Abbreviations and spelling variants mapped to one canonical skill name.
+# Seeded from the Milestone 2 ABBREVIATIONS table (Task3/task3.3.py); 'SQL' is
+# deliberately not expanded because the rest of the app refers to it as SQL.
+# Aliases are applied to both sides unconditionally and an alias hit is an
+# exact STRONG match, so ambiguous short forms ('CV' is also a resume, 'DS'
+# data structures, 'Node' any node) are left out.
+SKILL_ALIASES = {
+    'ML': 'Machine Learning',
+    'DL': 'Deep Learning',
+    'NLP': 'Natural Language Processing',
+    'AI': 'Artificial Intelligence',
+    'JS': 'JavaScript',
+    'TS': 'TypeScript',
+    'K8s': 'Kubernetes',
+    'GCP': 'Google Cloud Platform',
+    'Google Cloud': 'Google Cloud Platform',
+    'Amazon Web Services': 'AWS',
+    'Sklearn': 'Scikit-learn',
+    'Scikit Learn': 'Scikit-learn',
+    'NodeJS': 'Node.js',
+    'Postgres': 'PostgreSQL',
+    'Golang': 'Go',
+}
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_skill(skill: str) -> str:
+    """Unicode-normalise, trim and collapse internal whitespace (case preserved)"""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', skill)).strip()
+
+
+class SkillNormalizer:
+    """Resolve skill strings to canonical (interned) keys
+
+    Two strings that differ only in case, spacing or by a known alias map to
+    the same canonical key, so they share one cache entry, one embedding and
+    one row/column of the similarity matrix.
+    """
+
+    MAX_MEMO_ENTRIES = 200_000
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        """
+        Initialize normalizer
+
+        Args:
+            aliases: Mapping of alias -> canonical skill name (defaults to SKILL_ALIASES)
+        """
+        self._alias_keys: Dict[str, str] = {}
+        self._alias_display: Dict[str, str] = {}
+        # Memo of raw string -> (canonical key, display); skill strings repeat
+        # heavily in bulk runs
+        self._key_memo: Dict[str, Tuple[str, str]] = {}
+
+        for alias, canonical in (SKILL_ALIASES if aliases is None else aliases).items():
+            self.add_alias(alias, canonical)
+
+    def add_alias(self, alias: str, canonical: str):
+        """Register alias as another spelling of canonical"""
+        canonical_key = self._fold(canonical)
+        self._alias_keys[self._fold(alias)] = canonical_key
+        self._alias_display[canonical_key] = clean_skill(canonical)
+        self._key_memo.clear()
+
+    def key(self, skill: str) -> str:
+        """Canonical (interned) key of a skill: casefolded, cleaned, alias-resolved"""
+        return self._resolve(skill)[0]
+
+    def display(self, skill: str) -> str:
+        """Human-readable form: the canonical alias target, else the cleaned input"""
+        return self._resolve(skill)[1]
+
+    def canonicalize(self, skills: Sequence[str]) -> Tuple[List[str], List[str]]:
+        """
+        Deduplicate a skill list by canonical key, preserving first-seen order
+
+        Args:
+            skills: Raw skill strings
+
+        Returns:
+            (display names, canonical keys), one entry per distinct skill
+        """
+        displays = []
+        keys = []
+        seen = set()
+        for skill in skills:
+            if not skill or not skill.strip():
+                continue
+            key, display = self._resolve(skill)
+            if key in seen:
+                continue
+            seen.add(key)
+            keys.append(key)
+            displays.append(display)
+        return displays, keys
+
+    def _resolve(self, skill: str) -> Tuple[str, str]:
+        """(canonical key, display name) of a raw skill string, memoised"""
+        resolved = self._key_memo.get(skill)
+        if resolved is None:
+            cleaned = clean_skill(skill)
+            folded = cleaned.casefold()
+            key = sys.intern(self._alias_keys.get(folded, folded))
+            resolved = (key, self._alias_display.get(key, cleaned))
+            if len(self._key_memo) >= self.MAX_MEMO_ENTRIES:
+                self._key_memo.clear()
+            self._key_memo[skill] = resolved
+        return resolved
+
+    @staticmethod
+    def _fold(skill: str) -> str:
+        return clean_skill(skill).casefold()
+
+
+# Shared instance used by the encoder, the analyzer and input parsing
+default_normalizer = SkillNormalizer()
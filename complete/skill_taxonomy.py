@@ -0,0 +1,122 @@
+from typing import Dict, List
+
+from skill_normalizer import SKILL_ALIASES
+
+# Bump when the curated vocabulary below changes, so prebuilt embedding
+# artifacts (taxonomy_artifact.py) built from an older list are reported stale
+TAXONOMY_VERSION = 2
+
+# Single source of the app's skill vocabulary. SKILL_SET is also the PhraseMatcher
+# vocabulary of the Milestone 2 extractor (Milestone2/skill_analyzer_core.py
+# imports it from here)
+SKILL_SET = [
+    "Python", "SQL", "Machine Learning", "Data Analysis", "Project Management",
+    "TensorFlow", "Pytorch", "AWS", "Docker", "Tableau", "Full Stack Development",
+    "Communication", "Leadership", "Critical Thinking", "Agile", "Scrum",
+    "MS Office", "MS Visio", "Functional testing", "Business Analysis",
+    "Requirement documentation", "Documentation Skills", "Status Reporting",
+    "Coordination", "Requirements Gathering Tool"
+]
+
+# Categorised skill database of Milestone 2 Task 3 (Task3/task3.1.py, plus
+# 'Analytical' from Task5/task5.1.py)
+SKILL_DATABASE = {
+    'programming_languages': [
+        'Python', 'Java', 'C', 'C++', 'C#',
+        'JavaScript', 'R', 'Go', 'Ruby', 'PHP'
+    ],
+    'frameworks': [
+        'TensorFlow', 'PyTorch', 'Scikit-learn', 'Keras', 'React',
+        'Angular', 'Django', 'Flask', 'Spring', 'Node.js'
+    ],
+    'databases': [
+        'MySQL', 'PostgreSQL', 'MongoDB', 'SQLite', 'Oracle'
+    ],
+    'cloud': [
+        'AWS', 'Azure', 'Google Cloud', 'IBM Cloud', 'Heroku'
+    ],
+    'soft_skills': [
+        'Leadership', 'Teamwork', 'Communication', 'Problem-solving', 'Time Management', 'Analytical'
+    ]
+}
+
+# Learning resources per skill, used by LearningPathGenerator
+LEARNING_RESOURCES = {
+    'Python': {
+        'difficulty': 'Medium',
+        'time_estimate': '4-8 weeks',
+        'resources': [
+            'Python for Everybody (Coursera)',
+            'Automate the Boring Stuff with Python',
+            'Official Python Tutorial'
+        ]
+    },
+    'Machine Learning': {
+        'difficulty': 'Hard',
+        'time_estimate': '12-16 weeks',
+        'prerequisites': ['Python', 'Statistics'],
+        'resources': [
+            'Andrew Ng Machine Learning Course',
+            'Hands-on Machine Learning with Scikit-Learn',
+            'Fast.ai Practical Deep Learning'
+        ]
+    },
+    'TensorFlow': {
+        'difficulty': 'Medium',
+        'time_estimate': '6-8 weeks',
+        'prerequisites': ['Python', 'Machine Learning'],
+        'resources': [
+            'TensorFlow Developer Certificate',
+            'Deep Learning Specialization',
+            'TensorFlow Official Tutorials'
+        ]
+    },
+    'AWS': {
+        'difficulty': 'Medium',
+        'time_estimate': '8-12 weeks',
+        'resources': [
+            'AWS Cloud Practitioner Certification',
+            'AWS Solutions Architect Associate',
+            'AWS Free Tier Hands-on Labs'
+        ]
+    },
+    'Docker': {
+        'difficulty': 'Medium',
+        'time_estimate': '2-4 weeks',
+        'resources': [
+            'Docker Official Documentation',
+            'Docker Mastery Course',
+            'Docker for Developers'
+        ]
+    }
+}
+
+# "Sample Data" input of the Skills Discovery tab
+SAMPLE_RESUME_SKILLS = [
+    "Python", "Machine Learning", "SQL", "Data Analysis",
+    "Pandas", "NumPy", "Scikit-learn", "Git", "Statistics"
+]
+SAMPLE_JD_SKILLS = [
+    "Python", "Deep Learning", "TensorFlow", "SQL",
+    "AWS", "Docker", "Kubernetes", "Data Science",
+    "Neural Networks", "Cloud Computing"
+]
+
+
+def taxonomy_skills() -> List[str]:
+    """Every curated skill the app knows in advance (raw names, first-seen order, no duplicates)"""
+    skills: Dict[str, None] = {}
+    for skill in SKILL_SET:
+        skills[skill] = None
+    for category_skills in SKILL_DATABASE.values():
+        for skill in category_skills:
+            skills[skill] = None
+    for skill, info in LEARNING_RESOURCES.items():
+        skills[skill] = None
+        for prerequisite in info.get('prerequisites', []):
+            skills[prerequisite] = None
+    for skill in SAMPLE_RESUME_SKILLS + SAMPLE_JD_SKILLS:
+        skills[skill] = None
+    for canonical in SKILL_ALIASES.values():
+        skills[canonical] = None
+    return list(skills)
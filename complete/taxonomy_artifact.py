@@ -0,0 +1,176 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from encoder_backends import BACKENDS, load_model, model_key
+from result_cache import fingerprint_skills
+from skill_normalizer import SkillNormalizer, default_normalizer
+from skill_taxonomy import TAXONOMY_VERSION, taxonomy_skills
+
+# Prebuilt embeddings of the curated taxonomy (skill_taxonomy.taxonomy_skills)
+#
+# One .npz file holding
+#   keys        canonical skill keys (unicode array)
+#   embeddings  L2-normalised float32 rows, one per key
+#   meta        JSON: format and taxonomy version, model name, dimension,
+#               vocabulary fingerprint and a SHA-256 checksum of keys + embeddings
+#
+# Built once per model with `python taxonomy_artifact.py` and shipped with the
+# app; at startup warm_encoder() loads it into the encoder's cache so only
+# skills outside the taxonomy are ever sent to the model.
+FORMAT_VERSION = 1
+DEFAULT_ARTIFACT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'taxonomy_embeddings.npz')
+
+logger = logging.getLogger('TaxonomyArtifact')
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+    logger.addHandler(_handler)
+
+
+def taxonomy_keys(normalizer: Optional[SkillNormalizer] = None) -> List[str]:
+    """Canonical keys of the curated taxonomy, as the encoder caches them"""
+    _, keys = (normalizer or default_normalizer).canonicalize(taxonomy_skills())
+    return keys
+
+
+def build_artifact(path: str, model_name: str = 'all-MiniLM-L6-v2', backend: str = 'torch',
+                   skills: Optional[Sequence[str]] = None, batch_size: int = 64) -> Dict:
+    """
+    Encode the taxonomy and write the artifact
+
+    Args:
+        path: Output .npz file (written atomically)
+        model_name: Name of the sentence-transformers model
+        backend: Inference backend, one of encoder_backends.BACKENDS
+        skills: Vocabulary to encode (defaults to the curated taxonomy)
+        batch_size: Encoding batch size
+
+    Returns:
+        The artifact's metadata
+    """
+    if skills is None:
+        keys = taxonomy_keys()
+    else:
+        _, keys = default_normalizer.canonicalize(skills)
+
+    model = load_model(model_name, backend)
+    embeddings = np.asarray(model.encode(keys, batch_size=batch_size, normalize_embeddings=True,
+                                         convert_to_numpy=True, show_progress_bar=False),
+                            dtype=np.float32)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'taxonomy_version': TAXONOMY_VERSION,
+        'model_name': model_key(model_name, backend),
+        'dimension': int(embeddings.shape[1]),
+        'n_skills': len(keys),
+        'vocabulary_fingerprint': fingerprint_skills(keys),
+        'checksum': _checksum(keys, embeddings),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, keys=np.array(keys, dtype=str), embeddings=embeddings,
+                 meta=np.array(json.dumps(meta)))
+    os.replace(tmp_path, path)
+    logger.info(f"Wrote {len(keys)} taxonomy embeddings ({meta['model_name']}) to {path}")
+    return meta
+
+
+def load_artifact(path: str) -> Tuple[List[str], np.ndarray, Dict]:
+    """
+    Read and verify an artifact
+
+    Args:
+        path: Artifact .npz file
+
+    Returns:
+        (canonical keys, embeddings, metadata)
+
+    Raises:
+        ValueError: Unknown format version, or the checksum does not match
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        keys = data['keys'].tolist()
+        embeddings = np.asarray(data['embeddings'], dtype=np.float32)
+
+    if meta.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Taxonomy artifact {path} has format {meta.get('format_version')}, "
+                         f"expected {FORMAT_VERSION}")
+    if _checksum(keys, embeddings) != meta.get('checksum'):
+        raise ValueError(f"Taxonomy artifact {path} failed its checksum (corrupt or modified)")
+    return keys, embeddings, meta
+
+
+def warm_encoder(encoder, path: Optional[str] = DEFAULT_ARTIFACT) -> int:
+    """
+    Load the artifact into a SentenceBERTEncoder's embedding cache
+
+    A missing, corrupt or mismatched artifact is logged and skipped: the
+    encoder then embeds taxonomy skills on first use as usual.
+
+    Args:
+        encoder: SentenceBERTEncoder to warm
+        path: Artifact .npz file (None / empty disables)
+
+    Returns:
+        Number of embeddings added to the cache
+    """
+    if not path or not os.path.exists(path):
+        logger.info("No taxonomy embedding artifact; taxonomy skills are encoded on first use")
+        return 0
+
+    try:
+        keys, embeddings, meta = load_artifact(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring taxonomy artifact: {e}")
+        return 0
+
+    if meta['model_name'] != encoder.model_name or meta['dimension'] != encoder.embedding_dimension:
+        logger.warning(f"Ignoring taxonomy artifact built for {meta['model_name']} "
+                       f"({meta['dimension']}d); encoder uses {encoder.model_name}")
+        return 0
+
+    current = taxonomy_keys(encoder.normalizer)
+    if meta['vocabulary_fingerprint'] != fingerprint_skills(current):
+        missing = len(set(current) - set(keys))
+        logger.warning(f"Taxonomy artifact is stale (taxonomy v{meta['taxonomy_version']}, current "
+                       f"v{TAXONOMY_VERSION}): {missing} taxonomy skills not covered; "
+                       f"rebuild with `python taxonomy_artifact.py`")
+
+    added = encoder.warm_cache(keys, embeddings)
+    logger.info(f"Warmed embedding cache with {added} taxonomy skills from {path}")
+    return added
+
+
+def _checksum(keys: Sequence[str], embeddings: np.ndarray) -> str:
+    digest = hashlib.sha256()
+    digest.update('\x1f'.join(keys).encode('utf-8'))
+    digest.update(np.ascontiguousarray(embeddings, dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the prebuilt taxonomy embedding artifact")
+    parser.add_argument('--output', default=os.environ.get('SKILLGAP_TAXONOMY_ARTIFACT') or DEFAULT_ARTIFACT)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2')
+    parser.add_argument('--backend', default=os.environ.get('SKILLGAP_ENCODER_BACKEND', 'torch'), choices=BACKENDS)
+    args = parser.parse_args()
+
+    meta = build_artifact(args.output, args.model, args.backend)
+    load_artifact(args.output)
+    print(json.dumps(meta, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import zlib
+
+import numpy as np
+import pytest
+
+# Tests import the app modules the way app.py does: as top-level modules of complete/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SKILLGAP_EMBEDDING_STORE', '')
+
+
+class HashModel:
+    """Deterministic stand-in for a SentenceTransformer: each text maps to a
+    fixed pseudo-random vector, so tests run without downloading a model"""
+
+    dimension = 16
+
+    class _Tokenizer:
+        def __call__(self, texts, **kwargs):
+            return {'input_ids': [[0] * (len(text.split()) + 2) for text in texts]}
+
+    def __init__(self):
+        self.tokenizer = self._Tokenizer()
+        self.max_seq_length = 256
+        self.calls = 0
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        self.calls += 1
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for i, text in enumerate(texts):
+            embeddings[i] = np.random.default_rng(zlib.crc32(text.encode())).standard_normal(self.dimension)
+        if normalize_embeddings and len(texts):
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    import app
+    monkeypatch.setattr(app, 'load_model', lambda model_name, backend='torch': HashModel())
+    return app.SentenceBERTEncoder(store_path='')
+
+
+@pytest.fixture
+def analyzer_factory(encoder):
+    import app
+
+    def make(**kwargs):
+        return app.SkillGapAnalyzer(encoder, app.SimilarityCalculator(), **kwargs)
+    return make
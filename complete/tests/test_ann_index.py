@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from ann_index import IVFIndex
+
+
+def unit_vectors(n, dimension=16, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((n, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def index():
+    items = unit_vectors(500)
+    return IVFIndex(n_lists=20, n_probe=4).build(items, [f"skill {i}" for i in range(500)], model_name='m')
+
+
+def test_exhaustive_search_matches_brute_force(index):
+    items = unit_vectors(500)
+    queries = unit_vectors(10, seed=1)
+    scores, ids = index.search(queries, k=5, n_probe=index.n_lists)
+
+    expected_ids = np.argsort(-(queries @ items.T), axis=1)[:, :5]
+    np.testing.assert_array_equal(ids, expected_ids)
+    np.testing.assert_allclose(scores, np.take_along_axis(queries @ items.T, expected_ids, axis=1), atol=1e-6)
+
+
+def test_save_load_round_trip(index, tmp_path):
+    path = str(tmp_path / 'index.npz')
+    index.save(path)
+    loaded = IVFIndex.load(path, model_name='m')
+
+    assert loaded.skills == index.skills
+    assert (loaded.n_lists, loaded.n_probe, loaded.model_name) == (index.n_lists, index.n_probe, 'm')
+    queries = unit_vectors(10, seed=2)
+    for actual, expected in zip(loaded.search(queries, k=7), index.search(queries, k=7)):
+        np.testing.assert_array_equal(actual, expected)
+    ids = np.array([0, 123, 499])
+    np.testing.assert_array_equal(loaded.get_vectors(ids), unit_vectors(500)[ids])
+
+
+def test_load_rejects_other_model(index, tmp_path):
+    path = str(tmp_path / 'index.npz')
+    index.save(path)
+    with pytest.raises(ValueError):
+        IVFIndex.load(path, model_name='other')
@@ -0,0 +1,80 @@
+import random
+
+import numpy as np
+import pytest
+
+VOCAB = [f"skill {i}" for i in range(40)] + ['ML', 'Machine Learning', 'Python', 'SQL']
+
+
+def random_lists(n, max_len, seed):
+    rng = random.Random(seed)
+    return [rng.sample(VOCAB, rng.randint(1, max_len)) for _ in range(n)]
+
+
+@pytest.mark.parametrize('matching_mode', ['best', 'optimal', 'greedy'])
+@pytest.mark.parametrize('max_block_bytes', [1 << 30, 300])
+def test_batch_summary_matches_pairwise_analysis(analyzer_factory, max_block_bytes, matching_mode):
+    analyzer = analyzer_factory(matching_mode=matching_mode)
+    resumes, jds = random_lists(12, 10, seed=0), random_lists(7, 8, seed=1)
+
+    summary = analyzer.analyze_batch(resumes, jds, summary_only=True, max_block_bytes=max_block_bytes)
+    for pair, (i, j) in enumerate(zip(summary['resume_index'], summary['jd_index'])):
+        expected = analyzer.analyze(resumes[i], jds[j])
+        assert summary['overall_score'][pair] == pytest.approx(expected.overall_score, abs=1e-6)
+        assert summary['matched_count'][pair] == len(expected.matched_skills)
+        assert summary['partial_count'][pair] == len(expected.partial_matches)
+        assert summary['missing_count'][pair] == len(expected.missing_skills)
+
+
+def test_batch_blocks_stay_within_budget(analyzer_factory, monkeypatch):
+    analyzer = analyzer_factory()
+    resumes, jds = random_lists(30, 10, seed=2), random_lists(5, 8, seed=3)
+    n_jd_union = len({analyzer.encoder.normalizer.key(s) for jd in jds for s in jd})
+    max_block_bytes = 4 * n_jd_union * 12
+
+    shapes = []
+    compute = analyzer.calculator.compute_similarity_matrix
+
+    def recording(resume_embeddings, jd_embeddings, *args, **kwargs):
+        shapes.append((len(resume_embeddings), len(jd_embeddings)))
+        return compute(resume_embeddings, jd_embeddings, *args, **kwargs)
+
+    monkeypatch.setattr(analyzer.calculator, 'compute_similarity_matrix', recording)
+    results = analyzer.analyze_batch(resumes, jds, max_block_bytes=max_block_bytes)
+
+    assert len(shapes) > 1
+    assert all(rows <= 12 for rows, _ in shapes)
+    expected = analyzer.analyze(resumes[17], jds[3])
+    np.testing.assert_allclose(results[17][3].best_similarity, expected.best_similarity, atol=1e-6)
+
+
+@pytest.mark.parametrize('matching_mode', ['best', 'optimal', 'greedy'])
+def test_leaderboard_scores_match_analysis(analyzer_factory, matching_mode):
+    analyzer = analyzer_factory(matching_mode=matching_mode)
+    resumes = random_lists(20, 10, seed=4)
+    jd = random_lists(1, 8, seed=5)[0]
+
+    entries = analyzer.rank_candidates(((f"c{i}", skills) for i, skills in enumerate(resumes)),
+                                       jd, top_k=20, chunk_size=6)
+    assert len(entries) == 20
+    for entry in entries:
+        expected = analyzer.analyze(resumes[int(entry.candidate_id[1:])], jd)
+        assert entry.overall_score == pytest.approx(expected.overall_score, abs=1e-6)
+        assert entry.matched_count == len(expected.matched_skills)
+        assert entry.partial_count == len(expected.partial_matches)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 100])
+def test_leaderboard_keeps_best_in_order_with_ties_by_arrival(analyzer_factory, chunk_size):
+    analyzer = analyzer_factory()
+    jd = random_lists(1, 8, seed=6)[0]
+    # Every resume appears twice, so scores tie; an empty resume is skipped
+    resumes = random_lists(10, 10, seed=7)
+    candidates = [(f"c{i}", skills) for i, skills in enumerate(resumes + resumes + [[]])]
+
+    entries = analyzer.rank_candidates(iter(candidates), jd, top_k=7, chunk_size=chunk_size)
+
+    scores = [analyzer.analyze(skills, jd).overall_score for _, skills in candidates[:-1]]
+    expected = sorted(range(len(scores)), key=lambda i: (-round(scores[i], 6), i))[:7]
+    assert [entry.candidate_id for entry in entries] == [f"c{i}" for i in expected]
+    assert analyzer.last_leaderboard_stats['resumes_scored'] == len(candidates) - 1
@@ -0,0 +1,52 @@
+import numpy as np
+
+from embedding_cache import EmbeddingCache
+
+
+def vector(value, dimension=4):
+    return np.full(dimension, value, dtype=np.float32)
+
+
+def test_evicts_least_recently_used_over_byte_budget():
+    cache = EmbeddingCache(max_bytes=3 * vector(0).nbytes)
+    for i, key in enumerate('abc'):
+        cache.put(key, vector(i))
+    assert cache.get('a') is not None
+    cache.put('d', vector(3))
+
+    assert 'b' not in cache
+    assert list(cache._entries) == ['c', 'a', 'd']
+    assert cache.resident_bytes == 3 * vector(0).nbytes
+    assert cache.evictions == 1
+
+
+def test_counters_and_resident_bytes():
+    cache = EmbeddingCache(max_bytes=1024)
+    cache.put('a', vector(1))
+    cache.put('a', vector(2))
+    assert cache.get('a')[0] == 2
+    assert cache.get('b') is None
+
+    stats = cache.get_statistics()
+    assert (stats['entries'], stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1, 0)
+    assert stats['hit_rate'] == 50
+    assert stats['resident_bytes'] == vector(0).nbytes
+
+    cache.clear()
+    assert cache.resident_bytes == 0 and cache.hits == 1
+
+
+def test_oversized_entry_is_not_cached():
+    cache = EmbeddingCache(max_bytes=vector(0).nbytes)
+    cache.put('a', vector(1))
+    cache.put('big', vector(1, dimension=8))
+    assert 'big' not in cache and 'a' in cache
+    assert cache.evictions == 0
+
+
+def test_row_views_are_copied():
+    parent = np.zeros((100, 4), dtype=np.float32)
+    cache = EmbeddingCache(max_bytes=1024)
+    cache.put('a', parent[0])
+    assert cache.get('a').base is None
+    assert cache.resident_bytes == parent[0].nbytes
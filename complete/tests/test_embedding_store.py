@@ -0,0 +1,71 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from embedding_store import EmbeddingStore
+
+
+def vectors(n, dimension=4, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, dimension)).astype(np.float32)
+
+
+def test_append_and_reopen(tmp_path):
+    store = EmbeddingStore(str(tmp_path), 4)
+    embeddings = vectors(3)
+    assert store.add('m', ['a', 'b', 'c'], embeddings) == 3
+    assert store.add('m', ['b', 'c', 'd', 'd'], vectors(4, seed=1)) == 1
+
+    reopened = EmbeddingStore(str(tmp_path), 4)
+    assert len(reopened) == 4
+    np.testing.assert_array_equal(reopened.get('m', 'b'), embeddings[1])
+    assert reopened.get('other-model', 'b') is None
+    np.testing.assert_array_equal(reopened.lookup_rows('m', ['c', 'x', 'a']), [2, -1, 0])
+
+
+def test_incompatible_dimension_is_rejected(tmp_path):
+    EmbeddingStore(str(tmp_path), 4)
+    with pytest.raises(ValueError):
+        EmbeddingStore(str(tmp_path), 8)
+
+
+def test_stored_dimension(tmp_path):
+    path = str(tmp_path / 'store')
+    assert EmbeddingStore.stored_dimension(path) is None
+    EmbeddingStore(path, 4)
+    assert EmbeddingStore.stored_dimension(path) == 4
+
+
+def test_readonly_store_sees_later_appends(tmp_path):
+    writer = EmbeddingStore(str(tmp_path), 4)
+    writer.add('m', ['a'], vectors(1))
+    reader = EmbeddingStore(str(tmp_path), 4, readonly=True)
+
+    embeddings = vectors(2, seed=2)
+    writer.add('m', ['b', 'c'], embeddings)
+    np.testing.assert_array_equal(reader.get_many('m', ['c'])['c'], embeddings[1])
+    with pytest.raises(PermissionError):
+        reader.add('m', ['d'], vectors(1))
+
+
+def test_torn_append_does_not_shift_rows(tmp_path):
+    store = EmbeddingStore(str(tmp_path), 4)
+    store.add('m', ['a', 'b'], vectors(2))
+
+    # A writer died after its data write, before its index lines
+    with open(store.data_path, 'ab') as f:
+        f.write(np.full((1, 4), 9, dtype=np.float32).tobytes())
+    # ... or in the middle of an index line
+    with open(store.index_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(['m', 'torn'])[:5])
+
+    store = EmbeddingStore(str(tmp_path), 4)
+    expected = vectors(2, seed=3)
+    store.add('m', ['c', 'd'], expected)
+
+    reopened = EmbeddingStore(str(tmp_path), 4)
+    np.testing.assert_array_equal(reopened.get('m', 'c'), expected[0])
+    np.testing.assert_array_equal(reopened.get('m', 'd'), expected[1])
+    assert os.path.getsize(reopened.data_path) == 4 * 4 * 4
+    assert len(reopened) == 4
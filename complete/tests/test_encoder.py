@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def encoded_texts(encoder, monkeypatch):
+    """Every text the model is asked to encode, in call order"""
+    texts = []
+    encode = encoder.model.encode
+
+    def recording(batch, *args, **kwargs):
+        texts.extend(batch)
+        return encode(batch, *args, **kwargs)
+    monkeypatch.setattr(encoder.model, 'encode', recording)
+    return texts
+
+
+def test_duplicates_are_encoded_once(encoder, encoded_texts):
+    skills = ['Python', 'SQL', 'python', ' Python ', 'Docker', 'SQL']
+    embeddings = encoder.encode_skills(skills)
+
+    assert sorted(encoded_texts) == sorted({encoder.normalizer.key(s) for s in skills})
+    assert embeddings.shape == (len(skills), encoder.embedding_dimension)
+
+
+@pytest.mark.parametrize('use_cache', [True, False])
+def test_output_rows_follow_input_order(encoder, use_cache):
+    skills = ['Docker', 'python', 'SQL', 'Python', 'Kubernetes', 'docker', 'SQL']
+    embeddings = encoder.encode_skills(skills, use_cache=use_cache)
+
+    for skill, embedding in zip(skills, embeddings):
+        expected = encoder.model.encode([encoder.normalizer.key(skill)], normalize_embeddings=True)[0]
+        np.testing.assert_allclose(embedding, expected, rtol=1e-6)
+
+
+def test_cached_skills_are_not_re_encoded(encoder, encoded_texts):
+    first = encoder.encode_skills(['Python', 'SQL'])
+    encoded_texts.clear()
+    second = encoder.encode_skills(['SQL', 'Docker', 'python'])
+
+    assert encoded_texts == [encoder.normalizer.key('Docker')]
+    np.testing.assert_array_equal(second[[0, 2]], first[[1, 0]])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_length_buckets_bound_padding(encoder, seed):
+    rng = np.random.default_rng(seed)
+    lengths = np.sort(rng.integers(3, 120, size=rng.integers(1, 2000)))
+    buckets = encoder._length_buckets(lengths)
+
+    assert [start for start, _ in buckets] == [0] + [stop for _, stop in buckets[:-1]]
+    assert buckets[-1][1] == len(lengths)
+    for start, stop in buckets:
+        batch = lengths[start:stop]
+        assert len(batch) <= encoder.MAX_BATCH_SIZE
+        if len(batch) > 1:
+            padded = len(batch) * batch[-1]
+            assert padded <= encoder.MAX_BATCH_TOKENS
+            assert padded <= batch.sum() * (1 + encoder.MAX_PADDING_RATIO)
+
+
+def test_run_model_batches_by_length_and_keeps_input_order(encoder, monkeypatch):
+    batches = []
+    encode = encoder.model.encode
+
+    def recording(batch, *args, **kwargs):
+        batches.append(list(batch))
+        return encode(batch, *args, **kwargs)
+    monkeypatch.setattr(encoder.model, 'encode', recording)
+
+    skills = [' '.join(['word'] * n) + f' {i}' for i, n in enumerate([40, 1, 39, 2, 41, 1])]
+    embeddings = encoder._run_model(skills)
+
+    word_counts = [[len(s.split()) for s in batch] for batch in batches]
+    assert word_counts == [[2, 2, 3], [40, 41, 42]]
+    for skill, embedding in zip(skills, embeddings):
+        np.testing.assert_allclose(embedding, encode([skill], normalize_embeddings=True)[0], rtol=1e-6)
+
+
+def test_sequence_stats_count_padding_to_the_longest_input(encoder):
+    encoder.encode_skills(['a', 'b c', 'd e f'], use_cache=False)
+
+    stats = encoder.sequence_stats
+    # HashModel lengths are words + 2; one batch padded to its longest (5 tokens)
+    assert (stats['batches'], stats['skills']) == (1, 3)
+    assert stats['real_tokens'] == 3 + 4 + 5
+    assert stats['padded_tokens'] == 3 * 5
+
+    summary = encoder.get_sequence_statistics()
+    assert summary['mean_padded_length'] == 5
+    assert summary['padding_ratio'] == pytest.approx(1 - 12 / 15)
+    # Batching never changes the model's own sequence limit
+    assert encoder.model.max_seq_length == encoder.max_seq_length == 256
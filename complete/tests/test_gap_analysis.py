@@ -0,0 +1,139 @@
+import random
+
+import numpy as np
+import pytest
+
+import app
+
+RESUME = ['Python', 'SQL', 'ML', 'Docker', 'Git', 'Statistics']
+JD = ['Python', 'Machine Learning', 'AWS', 'Kubernetes', 'Deep Learning', 'Data Science']
+VOCAB = RESUME + JD[1:] + ['Machine learning', 'python', 'Pandas', 'NumPy', 'Spark', 'Linux']
+
+
+def test_reclassify_matches_analysis_with_new_thresholds(analyzer_factory):
+    result = analyzer_factory().analyze(RESUME, JD)
+    expected = analyzer_factory(strong_threshold=0.4, partial_threshold=0.2).analyze(RESUME, JD)
+
+    # No encoder: reclassifying must not need (or wait for) the model
+    analyzer = app.SkillGapAnalyzer(None, app.SimilarityCalculator(),
+                                    strong_threshold=0.4, partial_threshold=0.2)
+    reclassified = analyzer.reclassify(result)
+
+    np.testing.assert_array_equal(reclassified.match_codes, expected.match_codes)
+    assert reclassified.category_scores == pytest.approx(expected.category_scores)
+    assert (reclassified.strong_threshold, reclassified.partial_threshold) == (0.4, 0.2)
+    assert reclassified.overall_score == result.overall_score
+
+
+def assert_same_result(actual, expected):
+    assert actual.resume_skills == expected.resume_skills
+    assert actual.jd_skills == expected.jd_skills
+    np.testing.assert_array_equal(actual.best_resume_idx, expected.best_resume_idx)
+    np.testing.assert_allclose(actual.best_similarity, expected.best_similarity, atol=1e-6)
+    np.testing.assert_array_equal(actual.match_codes, expected.match_codes)
+    np.testing.assert_allclose(actual.similarity_matrix, expected.similarity_matrix, atol=1e-6)
+    if expected.lexical_mask is None:
+        assert actual.lexical_mask is None
+    else:
+        np.testing.assert_array_equal(actual.lexical_mask, expected.lexical_mask)
+    assert actual.overall_score == pytest.approx(expected.overall_score, abs=1e-6)
+    assert actual.category_scores == pytest.approx(expected.category_scores, abs=1e-6)
+
+
+def test_incremental_semantic_column_gaining_exact_match(analyzer_factory):
+    analyzer = analyzer_factory()
+    previous = analyzer.analyze(['Python', 'Git'], ['Python', 'Docker', 'Machine Learning'])
+
+    # 'Docker' and 'Machine Learning' (via its 'ML' alias) become exact matches
+    resume = ['Python', 'Git', 'Docker', 'ML']
+    assert_same_result(analyzer.analyze_incremental(resume, previous.jd_skills, previous),
+                       analyzer.analyze(resume, previous.jd_skills))
+
+
+def test_incremental_matches_full_analysis_across_random_edits(analyzer_factory):
+    rng = random.Random(0)
+    analyzer = analyzer_factory()
+    resume, jd = rng.sample(VOCAB, 8), rng.sample(VOCAB, 8)
+    previous = analyzer.analyze(resume, jd)
+
+    for _ in range(60):
+        # Add, remove or swap skills on either side; the small vocabulary keeps
+        # columns flipping between lexical and semantic
+        edited = resume if rng.random() < 0.6 else jd
+        for _ in range(rng.randint(1, 3)):
+            action = rng.choice(['add', 'remove', 'replace'])
+            if action != 'add' and len(edited) > 1:
+                edited.pop(rng.randrange(len(edited)))
+            if action != 'remove':
+                edited.insert(rng.randint(0, len(edited)), rng.choice(VOCAB))
+
+        result = analyzer.analyze_incremental(resume, jd, previous)
+        assert_same_result(result, analyzer.analyze(resume, jd))
+        previous = result
+
+
+@pytest.mark.parametrize('settings', [
+    {'lexical_fast_path': False},
+    {'matching_mode': 'optimal'},
+    {'matching_mode': 'greedy'},
+])
+def test_incremental_semantic_edits_match_full_analysis(analyzer_factory, settings):
+    rng = random.Random(1)
+    analyzer = analyzer_factory(**settings)
+    resume, jd = rng.sample(VOCAB, 10), rng.sample(VOCAB, 6)
+    previous = analyzer.analyze(resume, jd)
+
+    for _ in range(30):
+        edited = resume if rng.random() < 0.6 else jd
+        if len(edited) > 2 and rng.random() < 0.5:
+            edited.pop(rng.randrange(len(edited)))
+        else:
+            edited.insert(rng.randint(0, len(edited)), rng.choice(VOCAB))
+
+        result = analyzer.analyze_incremental(resume, jd, previous)
+        assert_same_result(result, analyzer.analyze(resume, jd))
+        previous = result
+
+
+def test_incremental_encodes_only_added_skills(analyzer_factory):
+    analyzer = analyzer_factory(lexical_fast_path=False)
+    previous = analyzer.analyze(RESUME, JD)
+    model = analyzer.encoder.model
+    encoded = []
+    encode = model.encode
+
+    def recording(texts, *args, **kwargs):
+        encoded.extend(texts)
+        return encode(texts, *args, **kwargs)
+    model.encode = recording
+
+    analyzer.analyze_incremental(RESUME + ['Linux'], JD, previous)
+    assert encoded == [analyzer.encoder.normalizer.key('Linux')]
+
+
+def test_find_best_matches_keeps_exact_matches(analyzer_factory):
+    result = analyzer_factory().analyze(RESUME, JD)
+    assert result.lexical_mask is not None and result.lexical_mask.any()
+    assert not np.isnan(result.similarity_matrix).any()
+
+    matches = app.SimilarityCalculator().find_best_matches(result.similarity_matrix, threshold=-1)
+    assert [jd_idx for _, jd_idx, _ in matches] == list(range(len(result.jd_skills)))
+    for resume_idx, jd_idx, similarity in matches:
+        assert resume_idx == result.best_resume_idx[jd_idx]
+        assert similarity == pytest.approx(result.best_similarity[jd_idx])
+
+
+def test_similarity_csv_has_no_blank_cells(analyzer_factory):
+    result = analyzer_factory().analyze(RESUME, JD)
+    csv = app.ReportGenerator().generate_similarity_csv(result)
+    assert ',,' not in csv and not any(line.endswith(',') for line in csv.splitlines())
+
+
+@pytest.mark.parametrize('matching_mode', ['optimal', 'greedy'])
+def test_sparse_output_keeps_one_to_one_mode(analyzer_factory, matching_mode):
+    dense = analyzer_factory(matching_mode=matching_mode).analyze(RESUME, JD)
+    result = analyzer_factory(matching_mode=matching_mode, sparse_floor=0.1).analyze(RESUME, JD)
+
+    assert result.matching_mode == matching_mode
+    np.testing.assert_array_equal(result.best_resume_idx, dense.best_resume_idx)
+    np.testing.assert_array_equal(result.match_codes, dense.match_codes)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from job_index import JobPostingIndex
+
+POSTINGS = {
+    'data-scientist': ['Python', 'Machine Learning', 'SQL', 'Statistics'],
+    'backend': ['Go', 'Docker', 'PostgreSQL', 'SQL'],
+    'ml-engineer': ['ML', 'Python', 'Docker', 'Kubernetes'],
+}
+RESUME = ['Python', 'SQL', 'Docker', 'Pandas']
+
+
+def test_scores_match_single_analysis(encoder, analyzer_factory):
+    index = JobPostingIndex(encoder)
+    index.add_postings(POSTINGS.items())
+    analyzer = analyzer_factory()
+
+    scores = index.score_all(RESUME)
+    for posting_id, score in zip(index.posting_ids, scores):
+        assert score == pytest.approx(analyzer.analyze(RESUME, POSTINGS[posting_id]).overall_score, abs=1e-6)
+    assert [posting_id for posting_id, _ in index.top_k(RESUME, k=2)] == \
+        [index.posting_ids[i] for i in np.argsort(-scores)[:2]]
+
+
+def test_save_load_round_trip(encoder, tmp_path):
+    index = JobPostingIndex(encoder)
+    index.add_postings(POSTINGS.items())
+    path = str(tmp_path / 'postings.npz')
+    index.save(path)
+
+    loaded = JobPostingIndex.load(path, encoder)
+    np.testing.assert_array_equal(loaded.score_all(RESUME), index.score_all(RESUME))
+    loaded.add_postings([('devops', ['Kubernetes', 'Terraform'])])
+    assert len(loaded) == 4
+
+
+def test_failed_encode_leaves_index_unchanged(encoder, monkeypatch):
+    index = JobPostingIndex(encoder)
+    index.add_postings(list(POSTINGS.items())[:1])
+    before = index.score_all(RESUME)
+
+    def failing_encode(*args, **kwargs):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(encoder, 'encode_skills', failing_encode)
+    with pytest.raises(RuntimeError):
+        index.add_postings([('backend', POSTINGS['backend'])])
+    monkeypatch.undo()
+
+    assert len(index) == 1
+    np.testing.assert_array_equal(index.score_all(RESUME), before)
+    index.add_postings([('backend', POSTINGS['backend'])])
+    assert len(index.skill_keys) == len(index._skill_positions) == len(index.skill_embeddings)
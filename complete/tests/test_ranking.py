@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from app import MISSING, PARTIAL_MATCH, STRONG_MATCH, SkillRanker
+
+
+@pytest.fixture
+def ranker():
+    return SkillRanker()
+
+
+def per_candidate_top_k(ranker, similarity, match_codes, offsets, k, categories=None):
+    """Reference: rank each candidate's segment on its own with a full sort"""
+    expected = []
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        scores = ranker.importance_scores(similarity[start:stop], match_codes[start:stop])
+        order = [i for i in np.argsort(-scores, kind='stable')
+                 if categories is None or match_codes[start + i] in categories]
+        expected.append(order[:k])
+    return expected
+
+
+@pytest.mark.parametrize('categories', [None, (PARTIAL_MATCH, MISSING)])
+@pytest.mark.parametrize('k', [1, 3, 50])
+def test_top_k_per_candidate_matches_per_candidate_sort(ranker, k, categories):
+    rng = np.random.default_rng(0)
+    sizes = rng.integers(0, 12, size=30)
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    # Rounded similarities so ties occur
+    similarity = np.round(rng.uniform(0, 1, size=offsets[-1]), 1)
+    match_codes = rng.integers(STRONG_MATCH, MISSING + 1, size=offsets[-1])
+
+    result = ranker.top_k_per_candidate(similarity, match_codes, offsets, k, categories=categories)
+
+    assert len(result) == len(sizes)
+    expected = per_candidate_top_k(ranker, similarity, match_codes, offsets, k, categories)
+    assert [list(indices) for indices in result] == expected
+
+
+def test_top_k_matches_full_sort_with_ties(ranker):
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5])
+    assert list(ranker.top_k(scores, 3)) == [1, 4, 0]
+    assert list(ranker.top_k(scores)) == list(np.argsort(-scores, kind='stable'))
+    assert len(ranker.top_k(scores, 0)) == 0
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from resource_registry import ResourceRegistry
+
+
+def counting_factory(calls, gate=None):
+    def factory():
+        if gate is not None:
+            gate.wait(timeout=5)
+        calls.append(1)
+        return object()
+    return factory
+
+
+def test_factory_runs_once():
+    registry = ResourceRegistry()
+    calls = []
+    first = registry.get('model', counting_factory(calls))
+    assert registry.get('model', counting_factory(calls)) is first
+    assert len(calls) == 1
+    assert [stats['name'] for stats in registry.get_statistics()] == ['model']
+
+
+def test_concurrent_gets_share_one_load():
+    registry = ResourceRegistry()
+    calls, gate = [], threading.Event()
+    factory = counting_factory(calls, gate)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get('model', factory)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+
+def test_get_waits_for_preload():
+    registry = ResourceRegistry()
+    calls, gate = [], threading.Event()
+    thread = registry.preload('model', counting_factory(calls, gate))
+    assert thread is not None
+    assert registry.preload('model', counting_factory(calls)) is None
+
+    gate.set()
+    instance = registry.get('model', counting_factory(calls))
+    thread.join(timeout=5)
+    assert len(calls) == 1
+    assert registry.get('model', counting_factory(calls)) is instance
+    assert registry.preload('model', counting_factory(calls)) is None
+
+
+def test_failed_preload_is_retried_by_get():
+    registry = ResourceRegistry()
+
+    def failing():
+        raise RuntimeError("download failed")
+
+    registry.preload('model', failing).join(timeout=5)
+    assert not registry.is_loaded('model')
+    with pytest.raises(RuntimeError):
+        registry.get('model', failing)
+    assert registry.get('model', lambda: 'loaded') == 'loaded'
+
+
+def test_release_rebuilds():
+    registry = ResourceRegistry()
+    calls = []
+    first = registry.get('model', counting_factory(calls))
+    registry.release('model')
+    assert registry.get('model', counting_factory(calls)) is not first
+    assert len(calls) == 2
@@ -0,0 +1,121 @@
+import os
+import sys
+import types
+
+import pytest
+
+import result_cache
+from result_cache import ResultCache
+
+
+def test_key_ignores_order_and_duplicates():
+    key = ResultCache.make_key(['python', 'sql'], ['aws'], 'model', strong_threshold=0.8)
+    assert ResultCache.make_key(['sql', 'python', 'sql'], ['aws'], 'model', strong_threshold=0.8) == key
+
+
+@pytest.mark.parametrize('changed', [
+    dict(resume_keys=['python'], jd_keys=['aws'], model_name='model', settings={'strong_threshold': 0.8}),
+    dict(resume_keys=['python', 'sql'], jd_keys=['sql'], model_name='model', settings={'strong_threshold': 0.8}),
+    dict(resume_keys=['python', 'sql'], jd_keys=['aws'], model_name='other', settings={'strong_threshold': 0.8}),
+    dict(resume_keys=['python', 'sql'], jd_keys=['aws'], model_name='model', settings={'strong_threshold': 0.7}),
+    # Resume and JD sets are not interchangeable
+    dict(resume_keys=['aws'], jd_keys=['python', 'sql'], model_name='model', settings={'strong_threshold': 0.8}),
+])
+def test_key_changes_with_skills_model_and_settings(changed):
+    key = ResultCache.make_key(['python', 'sql'], ['aws'], 'model', strong_threshold=0.8)
+    assert ResultCache.make_key(changed['resume_keys'], changed['jd_keys'], changed['model_name'],
+                                **changed['settings']) != key
+
+
+def test_memory_tier_is_lru_bounded():
+    cache = ResultCache(max_entries=2)
+    cache.bind_model('model')
+    cache.put('a', 1, 'model')
+    cache.put('b', 2, 'model')
+    assert cache.get('a') == 1
+    cache.put('c', 3, 'model')
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, 'time', lambda: now[0])
+    cache = ResultCache(ttl_seconds=60)
+    cache.bind_model('model')
+    cache.put('a', 1, 'model')
+    now[0] += 59
+    assert cache.get('a') == 1
+    now[0] += 2
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_disk_entries_survive_restart(tmp_path):
+    cache = ResultCache(disk_path=str(tmp_path))
+    cache.bind_model('model')
+    cache.put('a', {'score': 0.5}, 'model')
+
+    reopened = ResultCache(disk_path=str(tmp_path))
+    reopened.bind_model('model')
+    assert reopened.get('a') == {'score': 0.5}
+
+
+def test_bind_model_sweeps_disk_without_unpickling(tmp_path, monkeypatch):
+    cache = ResultCache(ttl_seconds=60, disk_path=str(tmp_path))
+    cache.bind_model('old')
+    cache.put('a', 1, 'old')
+    cache.bind_model('new')
+    cache.put('b', 2, 'new')
+    cache.put('c', 3, 'new')
+    expired = os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0])
+    os.utime(expired, (0, 0))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("sweep must not unpickle")
+    monkeypatch.setattr(result_cache.pickle, 'load', fail)
+
+    reopened = ResultCache(ttl_seconds=60, disk_path=str(tmp_path))
+    reopened.bind_model('new')
+    remaining = os.listdir(str(tmp_path))
+    assert len(remaining) == 1
+    assert expired not in [os.path.join(str(tmp_path), name) for name in remaining]
+    assert remaining[0].startswith(ResultCache._model_tag('new'))
+
+
+def test_disk_tier_evicts_oldest_over_size_limit(tmp_path):
+    payload = b'x' * 1000
+    cache = ResultCache(ttl_seconds=None, disk_path=str(tmp_path), max_disk_bytes=2500)
+    cache.bind_model('model')
+    for i, key in enumerate(['a', 'b', 'c']):
+        cache.put(key, payload, 'model')
+        os.utime(cache._disk_file(key, 'model'), (1000 + i, 1000 + i))
+    cache.put('d', payload, 'model')
+
+    reopened = ResultCache(ttl_seconds=None, disk_path=str(tmp_path), max_disk_bytes=2500)
+    reopened.bind_model('model')
+    assert reopened.get('a') is None
+    assert reopened.get('b') is None
+    assert reopened.get('c') == payload
+    assert reopened.get('d') == payload
+
+
+def test_unloadable_disk_entry_is_a_miss(tmp_path, monkeypatch):
+    # A result class whose module no longer exists when the entry is read back
+    module = types.ModuleType('renamed_results')
+    Result = type('Result', (), {'__module__': 'renamed_results'})
+    module.Result = Result
+    monkeypatch.setitem(sys.modules, 'renamed_results', module)
+
+    cache = ResultCache(disk_path=str(tmp_path))
+    cache.bind_model('model')
+    cache.put('a', Result(), 'model')
+    path = cache._disk_file('a', 'model')
+    monkeypatch.delitem(sys.modules, 'renamed_results')
+
+    cache = ResultCache(disk_path=str(tmp_path))
+    cache.bind_model('model')
+
+    assert cache.get('a') is None
+    assert not os.path.exists(path)
@@ -0,0 +1,98 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import app
+
+
+def unit_vectors(n, dimension=16, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((n, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def calculator():
+    return app.SimilarityCalculator()
+
+
+@pytest.mark.parametrize('max_block_bytes', [4, 4 * 7 * 3, 4 * 50, 1 << 20])
+def test_blocked_best_matches_equal_dense(calculator, max_block_bytes):
+    resume, jd = unit_vectors(37), unit_vectors(23, seed=1)
+    dense = calculator.compute_similarity_matrix(resume, jd)
+
+    best = calculator.compute_best_matches_blocked(resume, jd, max_block_bytes=max_block_bytes, top_k=5)
+    np.testing.assert_array_equal(best['best_resume_idx'], dense.argmax(axis=0))
+    np.testing.assert_allclose(best['best_similarity'], dense.max(axis=0), atol=1e-6)
+    expected_top = np.argsort(-dense, axis=0, kind='stable')[:5].T
+    np.testing.assert_array_equal(best['top_k_idx'], expected_top)
+    np.testing.assert_allclose(best['top_k_similarity'], np.take_along_axis(dense.T, expected_top, axis=1),
+                               atol=1e-6)
+
+
+def test_memory_capped_analysis_equals_full(analyzer_factory):
+    resume = [f"resume skill {i}" for i in range(30)] + ['Python', 'SQL']
+    jd = [f"jd skill {i}" for i in range(20)] + ['Python']
+    full = analyzer_factory().analyze(resume, jd)
+    capped = analyzer_factory(max_matrix_bytes=256).analyze(resume, jd)
+
+    assert capped.similarity_matrix is None
+    np.testing.assert_array_equal(capped.best_resume_idx, full.best_resume_idx)
+    np.testing.assert_allclose(capped.best_similarity, full.best_similarity, atol=1e-6)
+    np.testing.assert_array_equal(capped.match_codes, full.match_codes)
+    assert capped.category_scores == pytest.approx(full.category_scores, abs=1e-6)
+
+
+def test_sparsify_keeps_entries_above_floor(calculator):
+    dense = calculator.compute_similarity_matrix(unit_vectors(30), unit_vectors(20, seed=1))
+    sparse_matrix = calculator.sparsify(dense, 0.3)
+    np.testing.assert_array_equal(sparse_matrix.toarray(), np.where(dense >= 0.3, dense, 0))
+
+
+@pytest.mark.parametrize('max_block_bytes', [4 * 7 * 3, 1 << 20])
+def test_blocked_sparse_output_equals_thresholded_dense(calculator, max_block_bytes):
+    resume, jd = unit_vectors(37), unit_vectors(23, seed=1)
+    dense = calculator.compute_similarity_matrix(resume, jd)
+
+    best = calculator.compute_best_matches_blocked(resume, jd, max_block_bytes=max_block_bytes,
+                                                   sparse_floor=0.3)
+    np.testing.assert_allclose(best['sparse_matrix'].toarray(), np.where(dense >= 0.3, dense, 0), atol=1e-6)
+
+
+def test_sparse_analysis_keeps_exact_matches(analyzer_factory):
+    resume = [f"resume skill {i}" for i in range(30)] + ['Python']
+    jd = [f"jd skill {i}" for i in range(20)] + ['Python']
+    full = analyzer_factory().analyze(resume, jd)
+    result = analyzer_factory(max_matrix_bytes=256, sparse_floor=0.3).analyze(resume, jd)
+
+    dense = np.nan_to_num(full.similarity_matrix, nan=0.0)
+    np.testing.assert_allclose(result.similarity_matrix.toarray(), np.where(dense >= 0.3, dense, 0), atol=1e-6)
+    np.testing.assert_array_equal(result.match_codes, full.match_codes)
+
+
+def brute_force_assignment_total(matrix):
+    """Best total similarity over every one-to-one matching (small matrices only)"""
+    n_resume, n_jd = matrix.shape
+    if n_resume >= n_jd:
+        return max(matrix[list(rows), range(n_jd)].sum()
+                   for rows in itertools.permutations(range(n_resume), n_jd))
+    return max(matrix[range(n_resume), list(cols)].sum()
+               for cols in itertools.permutations(range(n_jd), n_resume))
+
+
+@pytest.mark.parametrize('shape', [(5, 5), (6, 4), (3, 6)])
+def test_assignment_optimality(calculator, shape):
+    for seed in range(5):
+        matrix = np.random.default_rng(seed).random(shape).astype(np.float32)
+        optimum = brute_force_assignment_total(matrix)
+
+        for method in ('optimal', 'greedy'):
+            resume_idx, similarity = calculator.assign_one_to_one(matrix, method)
+            assigned = resume_idx >= 0
+            # Each resume skill used at most once, every JD skill matched while rows last
+            assert len(set(resume_idx[assigned])) == assigned.sum() == min(shape)
+            np.testing.assert_allclose(similarity[assigned], matrix[resume_idx[assigned], np.flatnonzero(assigned)])
+            if method == 'optimal':
+                assert similarity.sum() == pytest.approx(optimum, abs=1e-5)
+            else:
+                assert optimum / 2 - 1e-5 <= similarity.sum() <= optimum + 1e-5
@@ -0,0 +1,37 @@
+import pytest
+
+from skill_normalizer import SkillNormalizer, clean_skill
+
+
+def test_case_spacing_and_aliases_share_a_key():
+    normalizer = SkillNormalizer()
+    assert normalizer.key('  machine   LEARNING ') == normalizer.key('ML') == 'machine learning'
+    assert normalizer.display('ml') == 'Machine Learning'
+    assert normalizer.display('  pandas ') == 'pandas'
+    assert clean_skill('Deep  Learning') == 'Deep Learning'
+
+
+def test_canonicalize_deduplicates_in_first_seen_order():
+    normalizer = SkillNormalizer({'K8s': 'Kubernetes'})
+    displays, keys = normalizer.canonicalize(['Python', 'k8s', '', 'python', 'Kubernetes', 'SQL'])
+    assert keys == ['python', 'kubernetes', 'sql']
+    assert displays == ['Python', 'Kubernetes', 'SQL']
+
+
+@pytest.mark.parametrize('short_form, expansion', [
+    ('CV', 'Computer Vision'),
+    ('DS', 'Data Science'),
+    ('Node', 'Node.js'),
+])
+def test_ambiguous_short_forms_are_not_aliases(short_form, expansion):
+    normalizer = SkillNormalizer()
+    assert normalizer.key(short_form) != normalizer.key(expansion)
+    assert normalizer.display(short_form) == short_form
+
+
+def test_ambiguous_short_form_is_not_an_exact_match(analyzer_factory):
+    # A resume listing "CV" (curriculum vitae) must not be a forced STRONG
+    # match for a Computer Vision requirement
+    result = analyzer_factory().analyze(['CV', 'Python'], ['Computer Vision', 'Python'])
+    assert result.lexical_mask.tolist() == [False, True]
+    assert result.best_similarity[0] < 1.0